@@ -0,0 +1,237 @@
+import argparse
+import json
+import math
+import random
+import sys
+import timeit
+import tracemalloc
+
+from utils.batch_engine import kyorugi_arrays, kyorugi_totals, poomsae_arrays, poomsae_totals
+from utils.bracket_engine import (default_round_range, matches_in_round_range, plan_tournament, result_rows,
+                                  round_label_to_size, sequence_games_across_courts)
+from utils.freestyle_planner import freestyle_stage_rows, plan_freestyle
+from utils.game_time_engine import (DEFAULT_POOMSAE_SETTINGS, FREESTYLE, GONGIN, POOMSAE_DIVISIONS, POOMSAE_EVENT_TYPES,
+                                    kyorugi_row, poomsae_row, summarize_kyorugi, summarize_poomsae)
+
+# 계산 엔진 성능 측정 (timeit + tracemalloc). 로직을 바꾸기 전후의 시간/메모리/결과를 비교할 때 쓴다.
+#
+#   python benchmark.py                              # 100, 1천, 1만, 10만 개 체급
+#   python benchmark.py --sizes 100 1000 --only 품새
+#   python benchmark.py --save before.json           # 결과 저장
+#   python benchmark.py --compare before.json        # 저장한 결과와 비교 (배율, 결과값 변화)
+#
+# 대회 데이터는 고정 시드로 만들므로 같은 크기면 매번 같은 입력이다.
+# checksum 은 계산 결과를 요약한 값으로, 최적화 후 값이 달라지면 결과가 바뀐 것이다.
+# NumPy 일괄 처리(utils/batch_engine.py) 항목은 측정 전에 같은 입력의 행 단위 엔진 결과
+# (총 시간, 참가부별/구분별 소계)와 맞는지 확인하고, 다르면 AssertionError 로 멈춘다.
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000)
+DEFAULT_REPEAT = 3
+SEED = 20250718
+
+KYORUGI_DIVISIONS = ["초등부", "남중부", "여중부", "남고부", "여고부", "대학부", "일반부"]
+WEIGHT_CLASSES = ["-33kg", "-37kg", "-41kg", "-45kg", "-49kg", "-53kg", "-57kg", "-61kg", "-65kg", "+65kg"]
+NUMBER_EVENTS = ["겨루기", "품새", "자유품새"]
+KYORUGI_SETTINGS = {division: 300 + 30 * i for i, division in enumerate(KYORUGI_DIVISIONS)}
+
+
+def _headcount(rng):
+    # 대부분 작은 체급, 가끔 큰 체급
+    return rng.randint(0, 12) if rng.random() < 0.8 else rng.randint(13, 200)
+
+
+def synthetic_number_records(count):
+    # 경기번호 계산기 입력 (종목, 부, 체급, 참가인원). 같은 체급이 이어지는 행도 섞는다
+    rng = random.Random(SEED)
+    records = []
+    for _ in range(count):
+        if records and rng.random() < 0.1:
+            event, division, weight_class, _ = records[-1]
+        else:
+            event, division, weight_class = rng.choice(NUMBER_EVENTS), rng.choice(KYORUGI_DIVISIONS), rng.choice(WEIGHT_CLASSES)
+        records.append((event, division, weight_class, _headcount(rng)))
+    return records
+
+
+def synthetic_kyorugi_entries(count):
+    # 겨루기 경기시간 입력 (참가부, 체급, 인원수, 시작강수, 종료강수). 일부는 강수 범위를 좁힌다
+    rng = random.Random(SEED)
+    entries = []
+    for _ in range(count):
+        headcount = _headcount(rng)
+        start_round, end_round = default_round_range(headcount)
+        if rng.random() < 0.2:
+            end_round = "준결승" if headcount > 4 else end_round
+        entries.append((rng.choice(KYORUGI_DIVISIONS), rng.choice(WEIGHT_CLASSES), headcount, start_round, end_round))
+    return entries
+
+
+def synthetic_poomsae_entries(count):
+    # 품새 경기시간 입력 (종목, 참가부, 인원수)
+    rng = random.Random(SEED)
+    events = POOMSAE_EVENT_TYPES + [f"{event_type}(자유품새)" for event_type in POOMSAE_EVENT_TYPES]
+    return [(rng.choice(events), rng.choice(POOMSAE_DIVISIONS), _headcount(rng)) for _ in range(count)]
+
+
+def synthetic_freestyle_sizes(count):
+    rng = random.Random(SEED)
+    return [rng.randint(2, 300) for _ in range(count)]
+
+
+# ---------- 측정 대상 (입력 -> checksum) ----------
+
+def bench_bracket_numbering(records):
+    return sum(row.values[-1] for row in result_rows(plan_tournament(records)))
+
+
+def bench_court_numbering(records):
+    plans = plan_tournament(records)
+    return sum(row.values[-1] for row in result_rows(plans, sequence_games_across_courts(plans, 8)))
+
+
+def bench_round_range(entries):
+    return sum(matches_in_round_range(headcount, round_label_to_size(start_round), round_label_to_size(end_round))
+               for _, _, headcount, start_round, end_round in entries)
+
+
+def bench_freestyle_groups(sizes):
+    plan_freestyle.cache_clear() # 캐시 효과 없이 조 편성 자체를 측정
+    return sum(size for participants in sizes for _, size, _, _ in freestyle_stage_rows(plan_freestyle(participants)))
+
+
+def bench_kyorugi_time(entries):
+    return summarize_kyorugi([kyorugi_row(*entry, KYORUGI_SETTINGS) for entry in entries]).total_seconds
+
+
+def bench_poomsae_time(entries):
+    plan_freestyle.cache_clear()
+    summary = summarize_poomsae([poomsae_row(event, division, headcount, DEFAULT_POOMSAE_SETTINGS)
+                                 for event, division, headcount in entries])
+    return round(summary.gongin_seconds + summary.freestyle_seconds, 3)
+
+
+def bench_kyorugi_time_numpy(entries):
+    return int(kyorugi_totals(kyorugi_arrays(entries, KYORUGI_SETTINGS))["total_seconds"])
+
+
+def bench_poomsae_time_numpy(entries):
+    totals = poomsae_totals(poomsae_arrays(entries, DEFAULT_POOMSAE_SETTINGS))
+    return round(totals["gongin_seconds"] + totals["freestyle_seconds"], 3)
+
+
+# ---------- NumPy 일괄 처리 결과 확인 ----------
+
+def _assert_close(label, expected, actual):
+    # 품새 게임 수는 분수(예: 인원 / 3)라 합산 순서에 따른 부동소수점 오차는 허용
+    if not math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-6):
+        raise AssertionError(f"NumPy 일괄 처리 결과가 다릅니다 ({label}): {expected} != {actual}")
+
+
+def check_kyorugi_numpy(entries):
+    summary = summarize_kyorugi([kyorugi_row(*entry, KYORUGI_SETTINGS) for entry in entries])
+    arrays = kyorugi_arrays(entries, KYORUGI_SETTINGS)
+    totals = kyorugi_totals(arrays)
+    _assert_close("총 소요시간", summary.total_seconds, totals["total_seconds"])
+    for index, division in enumerate(arrays.divisions):
+        data = summary.division_data.get(division, {"total_seconds": 0, "total_games": 0})
+        _assert_close(f"{division} 소요시간", data["total_seconds"], totals["division_seconds"][index])
+        _assert_close(f"{division} 게임수", data["total_games"], totals["division_games"][index])
+
+
+def check_poomsae_numpy(entries):
+    plan_freestyle.cache_clear()
+    summary = summarize_poomsae([poomsae_row(event, division, headcount, DEFAULT_POOMSAE_SETTINGS)
+                                 for event, division, headcount in entries])
+    totals = poomsae_totals(poomsae_arrays(entries, DEFAULT_POOMSAE_SETTINGS))
+    _assert_close("공인품새 소요시간", summary.gongin_seconds, totals["gongin_seconds"])
+    _assert_close("자유품새 소요시간", summary.freestyle_seconds, totals["freestyle_seconds"])
+    for type_index, poomsae_type in enumerate((GONGIN, FREESTYLE)):
+        for event_index, event_type in enumerate(POOMSAE_EVENT_TYPES):
+            data = summary.sub_totals[poomsae_type][event_type]
+            _assert_close(f"{poomsae_type} {event_type} 소요시간", data["time"], totals["sub_total_seconds"][type_index][event_index])
+            _assert_close(f"{poomsae_type} {event_type} 게임수", data["games"], totals["sub_total_games"][type_index][event_index])
+
+
+# 측정 전에 입력마다 한 번 실행하는 결과 확인 (이름 -> 확인 함수)
+CHECKS = {
+    "겨루기 경기시간 NumPy": check_kyorugi_numpy,
+    "품새 경기시간 NumPy": check_poomsae_numpy,
+}
+
+# (이름, 입력 생성, 측정 함수)
+BENCHMARKS = [
+    ("경기번호 브래킷", synthetic_number_records, bench_bracket_numbering),
+    ("경기번호 코트 통합", synthetic_number_records, bench_court_numbering),
+    ("강수 범위 경기 수", synthetic_kyorugi_entries, bench_round_range),
+    ("자유품새 조 편성", synthetic_freestyle_sizes, bench_freestyle_groups),
+    ("겨루기 경기시간", synthetic_kyorugi_entries, bench_kyorugi_time),
+    ("품새 경기시간", synthetic_poomsae_entries, bench_poomsae_time),
+    ("겨루기 경기시간 NumPy", synthetic_kyorugi_entries, bench_kyorugi_time_numpy),
+    ("품새 경기시간 NumPy", synthetic_poomsae_entries, bench_poomsae_time_numpy),
+]
+
+
+def measure(function, data, repeat):
+    # (가장 빠른 실행 시간(초), 최대 메모리(바이트), checksum). 메모리는 시간 측정과 따로 한 번 더 실행해서 잰다
+    seconds = min(timeit.repeat(lambda: function(data), number=1, repeat=repeat))
+    tracemalloc.start()
+    try:
+        checksum = function(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak, checksum
+
+
+def run_benchmarks(sizes, repeat, only=None):
+    for name, make_input, function in BENCHMARKS:
+        if only and only not in name:
+            continue
+        for size in sizes:
+            data = make_input(size)
+            if name in CHECKS:
+                CHECKS[name](data)
+            seconds, peak, checksum = measure(function, data, repeat)
+            yield name, size, {"seconds": seconds, "peak_bytes": peak, "checksum": checksum}
+
+
+def format_result(name, size, result, baseline=None):
+    line = f"{name:<12} {size:>7}  {result['seconds'] * 1000:>10.2f} ms  {result['peak_bytes'] / 1024:>10.1f} KB"
+    if baseline is not None:
+        speedup = baseline['seconds'] / result['seconds'] if result['seconds'] else float('inf')
+        memory = result['peak_bytes'] / baseline['peak_bytes'] if baseline['peak_bytes'] else 1
+        line += f"  속도 x{speedup:.2f}, 메모리 x{memory:.2f}"
+        if baseline['checksum'] != result['checksum']:
+            line += f"  [결과 변경: {baseline['checksum']} -> {result['checksum']}]"
+    return line
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="feelsUtil 계산 엔진 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="체급(행) 수 (기본 100 1000 10000 100000)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="반복 횟수, 가장 빠른 값을 기록 (기본 3)")
+    parser.add_argument("--only", help="이름에 이 글자가 들어간 항목만 측정")
+    parser.add_argument("--save", help="결과를 JSON 파일로 저장")
+    parser.add_argument("--compare", help="이전에 저장한 JSON 결과와 비교")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = {}
+    print(f"{'항목':<12} {'크기':>7}  {'시간':>13}  {'최대 메모리':>11}")
+    for name, size, result in run_benchmarks(args.sizes, args.repeat, args.only):
+        results[f"{name}/{size}"] = result
+        print(format_result(name, size, result, baseline.get(f"{name}/{size}")), flush=True)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    changed = [key for key, result in results.items() if key in baseline and baseline[key]['checksum'] != result['checksum']]
+    return 1 if changed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,185 @@
+import argparse
+import os
+import sys
+from functools import partial
+
+from common.constants import KYORUGI_SETTINGS_FILE, POOMSAE_SETTINGS_FILE, TOURNAMENT_DB_FILE
+from common.settings_store import SettingsStore
+from utils import batch_runner
+from utils.game_time_engine import DEFAULT_POOMSAE_SETTINGS
+from utils.tournament_store import KYORUGI_SOURCE, NUMBER_SOURCE, POOMSAE_SOURCE, TournamentStore
+
+# 화면 없이 계산기를 실행하는 명령행 일괄 처리 (tkinter 를 불러오지 않음)
+#
+#   python cli.py number  --input 입력.xlsx --output 결과.xlsx   (결과.csv / 결과.parquet 도 가능)
+#   python cli.py kyorugi --input 입력폴더 --output 결과폴더 --courts 4
+#   python cli.py poomsae --input 입력폴더 --output 결과폴더 --gongin-courts 4 --jayu-courts 2
+#
+# --input 이 폴더면 안의 모든 .xlsx 파일을 계산해서 --output 폴더에 "<이름>_결과.xlsx" 로 저장한다.
+# 파일들은 여러 프로세스에서 나눠 계산한다 (--workers, 기본은 CPU 수).
+# 파일 하나가 실패해도 나머지는 계속 처리하고, 실패가 있으면 종료 코드 1 을 돌려준다.
+#
+#   python cli.py number --input 시즌폴더 --merge --output 시즌_경기번호.xlsx
+#   -> 모든 파일의 결과를 입력 파일 이름순으로 한 통합문서에 모으고, 파일별 성공/오류를 별도 시트에 기록
+#
+#   python cli.py db --per-day                      대회 DB (화면의 "DB 저장") 일자별 경기 수
+#   python cli.py db --division 남중부 --over 32     남중부 중 인원이 32명 넘는 체급 (--day, --source 로 좁힘)
+
+OUTPUT_SUFFIX = "_결과.xlsx"
+MERGED_NUMBER_FILENAME = "경기번호_통합_결과.xlsx"
+
+
+def _positive_int(value):
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError("0보다 커야 합니다.")
+    return number
+
+
+def _start_time(value):
+    batch_runner.end_time_text(value, 0) # HH:MM 형식 확인
+    return value
+
+
+def run_number(paths, args):
+    input_path, output_path = paths
+    result = batch_runner.plan_number_file(input_path, args.courts)
+    batch_runner.write_number_workbook(result, output_path)
+    return f"{len(result)}개 라운드"
+
+
+def run_kyorugi(paths, args):
+    input_path, output_path = paths
+    settings = SettingsStore(args.settings or KYORUGI_SETTINGS_FILE).load()
+    entries = batch_runner.kyorugi_entries(batch_runner.read_entry_rows(input_path))
+    summary = batch_runner.plan_kyorugi(entries, settings)
+    schedule = batch_runner.kyorugi_schedule(summary, args.courts)
+    batch_runner.write_kyorugi_workbook(entries, summary, schedule, output_path, args.courts, args.start)
+    return f"{len(entries)}개 체급, 예상 종료 {batch_runner.end_time_text(args.start, schedule.finish_seconds)}"
+
+
+def run_poomsae(paths, args):
+    input_path, output_path = paths
+    settings = SettingsStore(args.settings or POOMSAE_SETTINGS_FILE, DEFAULT_POOMSAE_SETTINGS).load()
+    entries = batch_runner.poomsae_entries(batch_runner.read_entry_rows(input_path))
+    summary = batch_runner.plan_poomsae(entries, settings, not args.no_prelim, not args.no_main, not args.no_final)
+    schedules = batch_runner.poomsae_schedules(summary, args.gongin_courts, args.jayu_courts, args.freestyle_simultaneous)
+    batch_runner.write_poomsae_workbook(entries, summary, schedules, output_path, args.gongin_courts, args.jayu_courts,
+                                        args.freestyle_simultaneous, args.start)
+    finish_seconds = sum(schedule.finish_seconds for schedule in schedules)
+    return f"{len(entries)}개 종목, 예상 종료 {batch_runner.end_time_text(args.start, finish_seconds)}"
+
+
+COMMANDS = {"number": run_number, "kyorugi": run_kyorugi, "poomsae": run_poomsae}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="feelsUtil 계산기 명령행 일괄 처리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_common(subparser):
+        subparser.add_argument("--input", required=True, help="입력 엑셀 파일 또는 폴더")
+        subparser.add_argument("--output", help="결과 파일 (입력이 폴더면 결과 폴더). 생략하면 입력 옆에 저장")
+        subparser.add_argument("--workers", type=_positive_int, help="동시에 처리할 프로세스 수 (기본 CPU 수)")
+
+    number = subparsers.add_parser("number", help="경기번호 계산")
+    add_common(number)
+    number.add_argument("--merge", action="store_true", help="모든 입력 파일의 결과를 --output 통합문서 하나로 저장")
+    number.add_argument("--courts", type=_positive_int, help="코트 수. 주면 코트별 통합 경기번호(예: 1-001)로 매김")
+
+    kyorugi = subparsers.add_parser("kyorugi", help="겨루기 경기시간 계산")
+    add_common(kyorugi)
+    kyorugi.add_argument("--courts", type=_positive_int, default=4, help="코트 수 (기본 4)")
+    kyorugi.add_argument("--start", type=_start_time, default="09:00", help="시작 시간 HH:MM (기본 09:00)")
+    kyorugi.add_argument("--settings", help="겨루기 설정 파일 (기본 kyorugi_settings.json)")
+
+    poomsae = subparsers.add_parser("poomsae", help="품새 경기시간 계산")
+    add_common(poomsae)
+    poomsae.add_argument("--gongin-courts", type=_positive_int, default=4, help="공인품새 코트 수 (기본 4)")
+    poomsae.add_argument("--jayu-courts", type=_positive_int, default=2, help="자유품새 코트 수 (기본 2)")
+    poomsae.add_argument("--freestyle-simultaneous", action="store_true", help="자유품새 동시진행 (자유품새 코트에 나눠 배정)")
+    poomsae.add_argument("--no-prelim", action="store_true", help="자유품새 예선 제외")
+    poomsae.add_argument("--no-main", action="store_true", help="자유품새 본선 제외")
+    poomsae.add_argument("--no-final", action="store_true", help="자유품새 결선 제외")
+    poomsae.add_argument("--start", type=_start_time, default="09:00", help="시작 시간 HH:MM (기본 09:00)")
+    poomsae.add_argument("--settings", help="품새 설정 파일 (기본 poomsae_settings.json)")
+
+    db = subparsers.add_parser("db", help="대회 DB 조회 (여러 종목/일자)")
+    db.add_argument("--db", default=TOURNAMENT_DB_FILE, help="대회 DB 파일 (기본 tournament.sqlite3)")
+    db.add_argument("--per-day", action="store_true", help="일자별 경기 수")
+    db.add_argument("--division", help="참가부 (예: 남중부)")
+    db.add_argument("--over", type=int, help="인원이 이 수보다 많은 체급만")
+    db.add_argument("--day", help="대회 일자 YYYY-MM-DD")
+    db.add_argument("--source", choices=(NUMBER_SOURCE, KYORUGI_SOURCE, POOMSAE_SOURCE), help="저장한 계산기")
+
+    return parser
+
+
+def query_db(args):
+    # 결과는 탭으로 구분해서 출력 (엑셀/스프레드시트에 바로 붙여 넣기)
+    if not os.path.exists(args.db):
+        print(f"대회 DB 파일이 없습니다: {args.db}", file=sys.stderr)
+        return 1
+    store = TournamentStore(args.db)
+    if args.per_day:
+        print("일자\t계산기\t경기수")
+        for day, source, match_count in store.matches_per_day(args.source):
+            if args.day is None or day == args.day:
+                print(f"{day}\t{source}\t{match_count:g}")
+        return 0
+
+    min_headcount = args.over + 1 if args.over is not None else None
+    print("일자\t계산기\t종목\t참가부\t체급\t성별\t인원수")
+    for row in store.find_categories(args.division, min_headcount, args.day, args.source):
+        print("\t".join(str(value) for value in row))
+    return 0
+
+
+def output_paths(input_path, output_path):
+    # (입력 파일, 결과 파일) 목록
+    input_files = batch_runner.list_entry_workbooks(input_path)
+    if os.path.isdir(input_path):
+        output_dir = output_path or input_path
+        os.makedirs(output_dir, exist_ok=True)
+        return [(path, os.path.join(output_dir, os.path.splitext(os.path.basename(path))[0] + OUTPUT_SUFFIX)) for path in input_files]
+    return [(input_path, output_path or os.path.splitext(input_path)[0] + OUTPUT_SUFFIX)]
+
+
+def merge_number_results(args):
+    input_files = batch_runner.list_entry_workbooks(args.input)
+    output_path = args.output or os.path.join(args.input if os.path.isdir(args.input) else os.path.dirname(args.input), MERGED_NUMBER_FILENAME)
+
+    plan_file = partial(batch_runner.plan_number_file, court_count=args.courts)
+    file_results = list(batch_runner.map_in_processes(plan_file, input_files, args.workers))
+    for file_path, result, error in file_results:
+        if error is not None:
+            print(f"[실패] {file_path}: {error}", file=sys.stderr)
+        else:
+            print(f"[완료] {file_path} ({len(result)}개 라운드)")
+
+    batch_runner.write_merged_number_workbook(file_results, output_path)
+    print(f"통합 결과: {output_path}")
+    return 1 if any(error is not None for _, _, error in file_results) else 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "db":
+        return query_db(args)
+    if args.command == "number" and args.merge:
+        return merge_number_results(args)
+
+    run = partial(COMMANDS[args.command], args=args)
+    failures = 0
+    for (input_file, output_file), message, error in batch_runner.map_in_processes(run, output_paths(args.input, args.output), args.workers):
+        if error is not None:
+            failures += 1
+            print(f"[실패] {input_file}: {error}", file=sys.stderr)
+        else:
+            print(f"[완료] {input_file} -> {output_file} ({message})")
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
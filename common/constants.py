@@ -7,6 +7,15 @@ PROJECT_ROOT = os.path.dirname(BASE_DIR)
 KYORUGI_SETTINGS_FILE = os.path.join(PROJECT_ROOT, "kyorugi_settings.json")
 POOMSAE_SETTINGS_FILE = os.path.join(PROJECT_ROOT, "poomsae_settings.json")
 
+# Session files (입력 표 자동 저장)
+SESSION_DIR = os.path.join(PROJECT_ROOT, "sessions")
+GAME_NUMBER_SESSION_FILE = os.path.join(SESSION_DIR, "game_number.session")
+KYORUGI_SESSION_FILE = os.path.join(SESSION_DIR, "kyorugi.session")
+POOMSAE_SESSION_FILE = os.path.join(SESSION_DIR, "poomsae.session")
+
+# 대회 DB (여러 종목/일자 계산 결과, utils/tournament_store.py)
+TOURNAMENT_DB_FILE = os.path.join(PROJECT_ROOT, "tournament.sqlite3")
+
 # Template paths
 TEMPLATES_DIR = os.path.join(PROJECT_ROOT, "templates")
 GAME_NUMBER_TEMPLATE_PATH = os.path.join(TEMPLATES_DIR, "경기번호_계산기_양식.xlsx")
@@ -0,0 +1,44 @@
+import marshal
+import os
+import tempfile
+
+# 입력 표 세션 파일. 행 값 튜플 목록을 marshal 바이너리로 저장해서 다시 열 때 엑셀을 읽지 않고 바로 복원한다.
+# marshal 은 str/int/tuple/list 만 담으므로 JSON 보다 작고 읽기/쓰기가 빠르다 (10만 행 기준 수십 ms).
+# 저장은 SettingsStore 와 같이 임시 파일에 쓴 뒤 os.replace 로 바꿔치기한다.
+# 형식 번호나 열 구성이 지금과 다르면 (버전이 바뀐 경우) 지난 세션은 무시한다.
+
+SESSION_FORMAT_VERSION = 1
+
+
+class SessionStore:
+    def __init__(self, path, row_type):
+        self.path = path
+        self.row_type = row_type # utils.row_model.row_record 로 만든 행 클래스
+
+    def load(self):
+        # 행 레코드 목록. 파일이 없거나 읽을 수 없으면 None
+        try:
+            with open(self.path, 'rb') as f:
+                version, fields, values = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if version != SESSION_FORMAT_VERSION or tuple(fields) != self.row_type.FIELDS:
+            return None
+        from_values = self.row_type.from_values
+        return [from_values(row_values) for row_values in values]
+
+    def save(self, values):
+        # values: 행마다 row.values() 튜플
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=".session-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                marshal.dump((SESSION_FORMAT_VERSION, self.row_type.FIELDS, values), f)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
@@ -0,0 +1,70 @@
+import json
+import os
+import tempfile
+
+# 설정 JSON 파일 캐시.
+# 한 번 읽은 설정은 메모리에 두고, 파일의 수정 시각(mtime)이 바뀐 경우에만 다시 읽는다.
+# 저장은 임시 파일에 쓴 뒤 os.replace 로 바꿔치기해서, 저장 도중 종료되어도 기존 파일이 깨지지 않는다.
+
+
+def _to_int_values(value):
+    # "450" 같은 숫자 문자열은 int 로, dict 는 안쪽까지 변환. 숫자가 아니면 그대로 둔다
+    if isinstance(value, dict):
+        return {key: _to_int_values(item) for key, item in value.items()}
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            return value
+    return value
+
+
+class SettingsStore:
+    def __init__(self, path, defaults=None):
+        self.path = path
+        self.defaults = _to_int_values(defaults or {})
+        self._settings = None
+        self._stamp = None # (mtime_ns, size). 파일이 없으면 None
+
+    def _file_stamp(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def load(self):
+        # 반환된 dict 는 캐시를 공유하므로 수정하지 않는다
+        stamp = self._file_stamp()
+        if self._settings is not None and stamp == self._stamp:
+            return self._settings
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                settings = _to_int_values(json.load(f))
+        except (OSError, json.JSONDecodeError):
+            settings = self.defaults
+
+        self._settings = settings
+        self._stamp = stamp
+        return settings
+
+    def save(self, settings):
+        settings = _to_int_values(settings)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(prefix=".settings-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(settings, f, ensure_ascii=False, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+        self._settings = settings
+        self._stamp = self._file_stamp()
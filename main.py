@@ -1,11 +1,20 @@
+import time
+STARTED_AT = time.perf_counter() # --import-times 에서 main.py 자체 import 시간을 잴 때 쓴다
+
+import os
+import sys
 import tkinter as tk
-from tkinter import font
+from tkinter import font, messagebox
 import datetime
 from common.version import __version__ as app_version
 from common.version import __build_date__ as app_date
-from modules.game_number_calculator import GameNumberCalculator
-from modules.game_time_calculator import GameTimeCalculator
-from modules.poomsae_sochung_calculator import PoomsaeSochungCalculator
+from utils import profiler
+
+# 각 계산기는 버튼을 처음 누를 때 import 한다 (비밀번호 창이 바로 뜨도록).
+# PyInstaller 가 찾을 수 있도록 open_* 메서드 안에서 일반 import 문으로 가져온다.
+TOOL_MODULES = ["modules.game_number_calculator", "modules.game_time_calculator", "modules.poomsae_sochung_calculator"]
+# 도구 안에서도 엑셀 불러오기/저장할 때만 가져오는 라이브러리
+HEAVY_MODULES = ["openpyxl"]
 
 class PasswordWindow(tk.Tk):
     def __init__(self):
@@ -38,7 +47,7 @@ class PasswordWindow(tk.Tk):
             app = MainApp() # 메인 앱 실행
             app.mainloop()
         else:
-            tk.messagebox.showerror("오류", "잘못된 비밀번호입니다.")
+            messagebox.showerror("오류", "잘못된 비밀번호입니다.")
             self.password_entry.delete(0, tk.END) # 입력 필드 초기화
 
 
@@ -85,6 +94,11 @@ class MainApp(tk.Tk):
         footer_label = tk.Label(footer_frame, text="Copyright (c) FEELJAE-WON. All rights reserved.", font=footer_font, fg="gray")
         footer_label.pack(side=tk.LEFT, padx=5)
 
+        # 성능 기록 중이면 진단 창 버튼. 계산기 창에서도 F12 로 연다
+        if profiler.is_enabled():
+            tk.Button(footer_frame, text="Profile", font=notes_font, fg="blue", relief="flat", cursor="hand2", command=self.open_profile_dialog).pack(side=tk.LEFT, padx=5)
+            self.bind_all("<F12>", lambda event: self.open_profile_dialog())
+
     def create_module_button(self, parent, module_name, command):
         button_font = font.Font(family="Helvetica", size=12)
         button = tk.Button(parent, text=module_name, font=button_font, width=30, height=2,
@@ -111,16 +125,25 @@ class MainApp(tk.Tk):
         
         text_area.config(state="disabled")
 
+    def open_profile_dialog(self):
+        from utils.profile_dialog import ProfileDialog
+
+        ProfileDialog(self)
+
     def open_game_number_calculator(self):
+        with profiler.profiled("도구 열기 / 경기번호 계산기"): # 첫 실행은 import 포함
+            from modules.game_number_calculator import GameNumberCalculator
 
-        self.withdraw() # 메인 창 숨기기
-        calculator_window = GameNumberCalculator(self)
+            self.withdraw() # 메인 창 숨기기
+            calculator_window = GameNumberCalculator(self)
         calculator_window.protocol("WM_DELETE_WINDOW", lambda: self.on_calculator_close(calculator_window))
 
     def open_game_time_calculator(self):
+        with profiler.profiled("도구 열기 / 경기 시간 계산기"): # 첫 실행은 import 포함
+            from modules.game_time_calculator import GameTimeCalculator
 
-        self.withdraw() # 메인 창 숨기기
-        calculator_window = GameTimeCalculator(self)
+            self.withdraw() # 메인 창 숨기기
+            calculator_window = GameTimeCalculator(self)
         calculator_window.protocol("WM_DELETE_WINDOW", lambda: self.on_calculator_close(calculator_window))
 
     def on_calculator_close(self, window):
@@ -128,11 +151,29 @@ class MainApp(tk.Tk):
         self.deiconify() # 메인 창 다시 보이기
 
     def open_poomsae_sochung_calculator(self):
+        with profiler.profiled("도구 열기 / 품새 소청 계산기"): # 첫 실행은 import 포함
+            from modules.poomsae_sochung_calculator import PoomsaeSochungCalculator
 
-        self.withdraw() # 메인 창 숨기기
-        calculator_window = PoomsaeSochungCalculator(self)
+            self.withdraw() # 메인 창 숨기기
+            calculator_window = PoomsaeSochungCalculator(self)
         calculator_window.protocol("WM_DELETE_WINDOW", lambda: self.on_calculator_close(calculator_window))
 
+
+def print_import_times():
+    # python main.py --import-times : 창을 띄우지 않고 시작/도구별 import 비용만 출력
+    from utils.import_timer import format_import_times, time_imports
+
+    base = [("main.py (tkinter, common)", time.perf_counter() - STARTED_AT, len(sys.modules))]
+    print(format_import_times(base + list(time_imports(TOOL_MODULES + HEAVY_MODULES))))
+
+
 if __name__ == "__main__":
+    if "--import-times" in sys.argv:
+        print_import_times()
+        sys.exit()
+    # python main.py --profile : 계산하기/엑셀 가져오기/저장 단계별 시간을 기록 (메인 창 Profile 버튼 또는 F12)
+    if "--profile" in sys.argv or os.environ.get("FEELSUTIL_PROFILE") == "1":
+        profiler.enable()
     password_app = PasswordWindow()
-    password_app.mainloop()
\ No newline at end of file
+    profiler.record("시작 / 비밀번호 창", time.perf_counter() - STARTED_AT)
+    password_app.mainloop()
@@ -1,13 +1,27 @@
 import tkinter as tk
 from tkinter import ttk, font, filedialog
 import shutil
-import openpyxl
 import os
 import datetime
+import sqlite3
 from common.version import __version__ as app_version
 from common.version import __build_date__ as app_date
-from common.constants import GAME_NUMBER_TEMPLATE_PATH
+from common.constants import GAME_NUMBER_SESSION_FILE, GAME_NUMBER_TEMPLATE_PATH, TOURNAMENT_DB_FILE
+from common.session_store import SessionStore
 from utils.file_operations import download_template_file
+from utils.bracket_engine import plan_tournament, result_rows, sequence_games_across_courts
+from utils.result_table import ResultTable
+from utils.result_export import EXPORT_FILETYPES, export_rows
+from utils.virtual_grid import VirtualGrid
+from utils.import_dialog import ExcelImportDialog
+from utils.profiler import profiled, profiled_render
+from utils.row_model import row_record
+from utils.autosave import RowAutosave
+from utils.tournament_store import NUMBER_SOURCE, TournamentStore
+from utils.tournament_day_dialog import ask_tournament_day
+
+INPUT_LABELS = ["종목", "부", "체급", "참가인원"]
+NumberInputRow = row_record("NumberInputRow", dict.fromkeys(INPUT_LABELS, ""))
 
 class GameNumberCalculator(tk.Toplevel):
     def __init__(self, master=None):
@@ -17,6 +31,8 @@ class GameNumberCalculator(tk.Toplevel):
         self.geometry("1200x700")
         self.last_imported_filename = ""
         self.last_imported_filename = ""
+        self.last_plan = None # 마지막 계산하기 결과 (입력 행, plans, sequence). 대회 DB 저장용
+        self.last_db_day = None
 
         # 설명 레이블
         description_font = font.Font(family="Helvetica", size=12)
@@ -59,6 +75,12 @@ class GameNumberCalculator(tk.Toplevel):
         download_button = tk.Button(right_buttons_frame, text="엑셀 양식 다운로드", command=self.download_template)
         download_button.pack(side=tk.RIGHT, padx=5)
 
+        # 대회 DB 저장/불러오기 (여러 종목/일자를 한 DB 에 모은다)
+        db_save_button = tk.Button(right_buttons_frame, text="DB 저장", command=self.save_to_db)
+        db_save_button.pack(side=tk.RIGHT, padx=5)
+        db_load_button = tk.Button(right_buttons_frame, text="DB 불러오기", command=self.load_from_db)
+        db_load_button.pack(side=tk.RIGHT, padx=5)
+
         # 헤더 프레임 (입력 컨테이너 내 상단, 버튼 아래)
         header_frame = tk.Frame(input_container)
         header_frame.pack(fill=tk.X, pady=5)
@@ -72,20 +94,13 @@ class GameNumberCalculator(tk.Toplevel):
         # '+' 버튼을 위한 빈 공간 (헤더와 정렬)
         tk.Label(header_frame, width=5).pack(side=tk.LEFT, padx=5)
 
-        # 스크롤 가능한 입력 행 프레임
-        self.canvas = tk.Canvas(input_container)
-        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-        self.scrollbar = ttk.Scrollbar(input_container, orient="vertical", command=self.canvas.yview)
-        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-        self.canvas.bind('<Configure>', lambda e: self.canvas.configure(scrollregion = self.canvas.bbox("all")))
-
-        self.main_frame = tk.Frame(self.canvas)
-        self.canvas.bind('<Configure>', lambda e: self.canvas.itemconfig(self.canvas.create_window((0, 0), window=self.main_frame, anchor="nw", width=e.width), width=e.width))
-
-        self.main_frame.bind('<Configure>', lambda e: self.canvas.configure(scrollregion = self.canvas.bbox("all")))
+        # 스크롤 가능한 입력 행 (보이는 행만 위젯으로 그림)
+        remove_button_font = font.Font(family="Helvetica", size=12, weight="bold")
+        columns = [{"key": "번호", "kind": "index", "width": 5, "padx": 5}]
+        columns += [{"key": label_text, "width": 15, "padx": 5} for label_text in INPUT_LABELS]
+        columns.append({"kind": "delete", "text": "-", "padx": 5, "config": {"bg": "red", "fg": "white", "font": remove_button_font}})
+        self.input_grid = VirtualGrid(input_container, columns, on_delete=self.remove_row)
+        self.input_grid.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         # 오른쪽: 결과 프레임
         result_frame = tk.Frame(main_container, width=700)
@@ -95,6 +110,16 @@ class GameNumberCalculator(tk.Toplevel):
         result_label = tk.Label(result_frame, text="계산 결과")
         result_label.pack(pady=5)
 
+        # 코트별 통합 번호: 체급을 코트에 나누고 코트마다 큰 라운드부터 번호를 이어 붙임 (예: 1-001)
+        sequence_frame = tk.Frame(result_frame)
+        sequence_frame.pack(fill=tk.X, pady=(0, 5))
+        self.court_sequence_var = tk.IntVar(value=0)
+        tk.Checkbutton(sequence_frame, text="코트별 통합 번호", variable=self.court_sequence_var).pack(side=tk.LEFT)
+        tk.Label(sequence_frame, text="코트수:").pack(side=tk.LEFT, padx=(10, 5))
+        self.court_count_entry = tk.Entry(sequence_frame, width=5)
+        self.court_count_entry.insert(0, "4")
+        self.court_count_entry.pack(side=tk.LEFT)
+
         # 결과 표시 Treeview
         tree_frame = tk.Frame(result_frame) # Treeview와 스크롤바를 담을 프레임
         tree_frame.pack(fill=tk.BOTH, expand=True)
@@ -128,36 +153,30 @@ class GameNumberCalculator(tk.Toplevel):
         self.result_tree.heading("경기수", text="경기수")
         self.result_tree.column("경기수", width=40, anchor='center')
 
+        self.result_table = ResultTable(self.result_tree)
+
         # 정렬 상태 초기화
         self.sort_state = {col: 0 for col in self.result_tree["columns"]}
+        self.sort_columns = [] # 정렬 기준 열 (우선순위 순)
 
         # 헤더 클릭 이벤트 바인딩
         for col in self.result_tree["columns"]:
             self.result_tree.heading(col, command=lambda _col=col: self._sort_column(_col))
+        self.result_tree.bind("<Shift-Button-1>", self._on_heading_shift_click)
 
-        self.rows = []
-        for _ in range(10):
-            self.add_row()
+        # 지난번 입력 행이 있으면 엑셀을 다시 읽지 않고 바로 복원
+        self.autosave = RowAutosave(self.input_grid, SessionStore(GAME_NUMBER_SESSION_FILE, NumberInputRow))
+        if not self.autosave.restore():
+            self.input_grid.set_rows([self._make_row() for _ in range(10)])
 
         # Treeview에 복사 기능 바인딩
         self.result_tree.bind("<Control-c>", self._copy_selected_rows)
         self.result_tree.bind("<Command-c>", self._copy_selected_rows) # For macOS
 
-        # 마우스 휠 스크롤 바인딩
-        self.canvas.bind("<MouseWheel>", self._on_mousewheel) # Windows/Linux
-        self.canvas.bind("<Button-4>", self._on_mousewheel) # macOS scroll up
-        self.result_tree.bind("<Button-5>", self._on_mousewheel) # macOS scroll down
-
         # Footer
         footer_font = font.Font(family="Helvetica", size=9)
         footer_label = tk.Label(self, text="Copyright (c) FEELJAE-WON. All rights reserved.", font=footer_font, fg="gray")
         footer_label.pack(side=tk.BOTTOM, pady=5)
-        self.main_frame.bind("<MouseWheel>", self._on_mousewheel) # Windows/Linux
-        self.main_frame.bind("<Button-4>", self._on_mousewheel) # macOS scroll up
-        self.main_frame.bind("<Button-5>", self._on_mousewheel) # macOS scroll down
-
-    def _on_mousewheel(self, event):
-        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
 
     def _copy_selected_rows(self, event=None):
         selected_items = self.result_tree.selection()
@@ -174,53 +193,20 @@ class GameNumberCalculator(tk.Toplevel):
 
     def reset_all(self):
         # 결과 Treeview 초기화
-        for item in self.result_tree.get_children():
-            self.result_tree.delete(item)
-
-        # 입력 필드 초기화
-        for row_data in self.rows:
-            row_data["frame"].destroy()
-        self.rows.clear()
-
-        # 초기 10개 행 추가
-        for _ in range(10):
-            self.add_row()
-
-    def remove_row(self, row_frame_to_remove):
-        for i, row_data in enumerate(self.rows):
-            if row_data["frame"] == row_frame_to_remove:
-                row_data["frame"].destroy()
-                del self.rows[i]
-                self.resequence_row_numbers()
-                break
-
-    def resequence_row_numbers(self):
-        for i, row_data in enumerate(self.rows):
-            row_data["number_label"].config(text=str(i + 1))
+        self.result_table.clear()
 
-    def add_row(self):
-        row_frame = tk.Frame(self.main_frame)
-        row_frame.pack(fill=tk.X, expand=True, pady=5)
+        # 입력 필드 초기화 (초기 10개 행)
+        self.input_grid.set_rows([self._make_row() for _ in range(10)])
 
-        row_number = len(self.rows) + 1
-        number_label = tk.Label(row_frame, text=str(row_number), width=5)
-        number_label.pack(side=tk.LEFT, padx=5)
+    def remove_row(self, index):
+        self.input_grid.delete_row(index)
 
-        labels = ["종목", "부", "체급", "참가인원"]
-        entries = {}
+    def _make_row(self, data=()):
+        # 엑셀 행은 열이 모자랄 수 있다. 모자란 열은 빈 칸
+        return NumberInputRow.from_values("" if value is None else str(value) for value in tuple(data)[:len(INPUT_LABELS)])
 
-        for i, label_text in enumerate(labels):
-            entry = tk.Entry(row_frame, width=15)
-            entry.pack(side=tk.LEFT, padx=5)
-            entries[label_text] = entry
-        
-        # '-' 버튼 추가
-        remove_button_font = font.Font(family="Helvetica", size=12, weight="bold")
-        remove_button = tk.Button(row_frame, text="-", bg="red", fg="white", font=remove_button_font,
-                                  command=lambda r_frame=row_frame: self.remove_row(r_frame))
-        remove_button.pack(side=tk.LEFT, padx=5)
-
-        self.rows.append({"frame": row_frame, "entries": entries, "number_label": number_label, "remove_button": remove_button})
+    def add_row(self):
+        self.input_grid.append_row(self._make_row())
 
     def import_from_excel(self):
         file_path = filedialog.askopenfilename(filetypes=[("Excel files", "*.xlsx *.xls")])
@@ -229,275 +215,133 @@ class GameNumberCalculator(tk.Toplevel):
 
         self.last_imported_filename = os.path.splitext(os.path.basename(file_path))[0]
 
-        # Clear existing rows
-        for row_data in self.rows:
-            row_data["frame"].destroy()
-        self.rows.clear()
+        # 첫 행(헤더)은 건너뛰고 작업 스레드에서 읽는다
+        rows = []
+        def on_batch(batch):
+            rows.extend(self._make_row(row) for row in batch)
 
-        workbook = openpyxl.load_workbook(file_path)
-        sheet = workbook.active
-
-        for r_idx, row in enumerate(sheet.iter_rows(values_only=True)):
-            if r_idx == 0: # Skip header row
-                continue
-            self.add_row_with_data(row)
+        ExcelImportDialog(self, file_path, on_batch, lambda: self.input_grid.set_rows(rows), phase="경기번호 / 엑셀 가져오기")
 
     def download_template(self):
         download_template_file(GAME_NUMBER_TEMPLATE_PATH, "경기번호_계산기_양식.xlsx", [("Excel files", "*.xlsx")])
 
+    @profiled("경기번호 / 계산하기")
     def calculate_matches(self):
-        # 기존 결과 삭제
-        for item in self.result_tree.get_children():
-            self.result_tree.delete(item)
-
+        self.last_plan = None
         # 정렬 상태 초기화 및 헤더 화살표 제거
+        self.sort_columns = []
         for col in self.result_tree["columns"]:
             self.sort_state[col] = 0
             current_text = self.result_tree.heading(col, "text")
             self.result_tree.heading(col, text=current_text.replace(" ▲", "").replace(" ▼", ""))
 
-        game_number_counter = 1
-        row_index = 1 # 결과 테이블의 행 번호
-        prev_event, prev_division, prev_weight_class = None, None, None
-
-        for i, row_data in enumerate(self.rows):
-            entries = row_data["entries"]
+        # 입력 행은 모두 (참가인원 글자와 함께) 대회 DB 저장용으로 두고, 참가인원이 정수인 행만 계산한다
+        inputs = []
+        records = []
+        for row in self.input_grid.rows:
+            participants_str = row["참가인원"]
             try:
-                participants_str = entries["참가인원"].get()
-                if not participants_str.strip():
-                    continue
-
-                participants = int(participants_str)
-                if participants < 2:
-                    continue
-
-                event = entries["종목"].get() or ""
-                division = entries["부"].get() or ""
-                weight_class = entries["체급"].get() or ""
-
-                if event == "자유품새":
-                    if participants <= 11:
-                        # Case 1: Participants <= 11
-                        self.result_tree.insert("", "end", values=(row_index, event, division, weight_class, "결선", f"1~{participants}", participants))
-                        row_index += 1
-                    elif 12 <= participants <= 21:
-                        # Case 2: 12 <= Participants <= 21
-                        # Divide into 2 groups, with the first group being larger if uneven
-                        group1_size = (participants + 1) // 2
-                        group2_size = participants - group1_size
-
-                        # 본선-1조
-                        self.result_tree.insert("", "end", values=(row_index, event, division, weight_class, "본선-1조", f"1~{group1_size}", group1_size))
-                        row_index += 1
-                        # 본선-2조
-                        self.result_tree.insert("", "end", values=(row_index, event, division, weight_class, "본선-2조", f"1~{group2_size}", group2_size))
-                        row_index += 1
-
-                        # 결선
-                        self.result_tree.insert("", "end", values=(row_index, event, division, weight_class, "결선", "1~8", 8))
-                        row_index += 1
-                    elif participants >= 22:
-                        # Case 3: Participants >= 22
-                        # Preliminary (예선)
-                        num_prelim_groups = 2 # Start with 2 groups
-                        while participants / num_prelim_groups > 11.5 and num_prelim_groups % 2 == 0:
-                            num_prelim_groups += 2
-
-                        # Ensure num_prelim_groups is at least 2 and even
-                        if num_prelim_groups < 2:
-                            num_prelim_groups = 2
-                        if num_prelim_groups % 2 != 0:
-                            num_prelim_groups += 1
-
-                        base_prelim_group_size = participants // num_prelim_groups
-                        remainder_prelim = participants % num_prelim_groups
-
-                        prelim_group_sizes = []
-                        for g in range(num_prelim_groups):
-                            size = base_prelim_group_size
-                            if g < remainder_prelim:
-                                size += 1
-                            prelim_group_sizes.append(size)
-
-                        # 예선 결과 출력
-                        for g_idx, size in enumerate(prelim_group_sizes):
-                            self.result_tree.insert("", "end", values=(row_index, event, division, weight_class, f"예선-{g_idx+1}조", f"1~{size}", size))
-                            row_index += 1
-
-                        # 본선 진출 인원 계산 (1조 인원의 절반(반올림)이 해당 체급에 모든 조에 그 인원이 진출)
-                        first_group_size = prelim_group_sizes[0] if prelim_group_sizes else 0
-                        advancement_per_group = (first_group_size + 1) // 2 # Round up for advancement
-                        total_main_round_participants = advancement_per_group * num_prelim_groups
-
-                        # 본선 (Main Round)
-                        if total_main_round_participants > 0:
-                            num_main_groups = 2 # Start with 2 groups
-                            while total_main_round_participants / num_main_groups > 11.5 and num_main_groups % 2 == 0:
-                                num_main_groups += 2
-
-                            # Ensure num_main_groups is at least 2 and even
-                            if num_main_groups < 2:
-                                num_main_groups = 2
-                            if num_main_groups % 2 != 0:
-                                num_main_groups += 1
-
-                            base_main_group_size = total_main_round_participants // num_main_groups
-                            remainder_main = total_main_round_participants % num_main_groups
-
-                            main_group_sizes = []
-                            for g in range(num_main_groups):
-                                size = base_main_group_size
-                                if g < remainder_main:
-                                    size += 1
-                                main_group_sizes.append(size)
-
-                            # 본선 결과 출력
-                            for g_idx, size in enumerate(main_group_sizes):
-                                self.result_tree.insert("", "end", values=(row_index, event, division, weight_class, f"본선-{g_idx+1}조", f"1~{size}", size))
-                                row_index += 1
-
-                            # 결선 (Final Round) - based on number of main round groups
-                            # 예선과 본선을 거쳤을 경우 결선은 무조건 1~8
-                            self.result_tree.insert("", "end", values=(row_index, event, division, weight_class, "결선", "1~8", 8))
-                            row_index += 1
-                    
-                    prev_event, prev_division, prev_weight_class = None, None, None
-
-                else:
-                    # Existing logic for other events
-                    current_category = (event, division, weight_class)
-                    previous_category = (prev_event, prev_division, prev_weight_class)
-
-                    if current_category != previous_category:
-                        game_number_counter = 1
-
-                    game_number_counter, row_index = self._calculate_standard_matches(participants, event, division, weight_class, game_number_counter, row_index)
-                    
-                    prev_event, prev_division, prev_weight_class = event, division, weight_class
-
+                participants = int(participants_str) if participants_str.strip() else None
             except ValueError:
-                continue
-
-    def _calculate_standard_matches(self, participants, event, division, weight_class, game_number_counter, row_index):
-        total_slots = 1
-        while total_slots < participants:
-            total_slots *= 2
-
-        byes = total_slots - participants
-        first_round_matches = participants - byes
-
-        # 예선전 (첫 라운드)
-        if first_round_matches > 0:
-            round_name = f"{total_slots}"
-            num_matches = first_round_matches // 2
-            start_game = game_number_counter
-            end_game = game_number_counter + num_matches - 1
-            game_numbers_display = f"{start_game}~{end_game}" if num_matches > 0 else "-"
-            self.result_tree.insert("", "end", values=(row_index, event, division, weight_class, round_name, game_numbers_display, num_matches))
-            game_number_counter = end_game + 1
-            row_index += 1
-
-        # 본선 (다음 라운드부터 결승까지)
-        current_participants = (first_round_matches // 2) + byes
-        while current_participants > 1:
-            round_matches = current_participants // 2
-            round_name = f"{current_participants}" if current_participants > 2 else "2"
-            if current_participants == 4:
-                round_name = "4"
-            elif current_participants == 8:
-                round_name = "8"
-
-            start_game = game_number_counter
-            end_game = game_number_counter + round_matches - 1
-            game_numbers_display = f"{start_game}~{end_game}" if round_matches > 0 else "-"
-            self.result_tree.insert("", "end", values=(row_index, event, division, weight_class, round_name, game_numbers_display, round_matches))
-            game_number_counter = end_game + 1
-            current_participants //= 2
-            row_index += 1
-        return game_number_counter, row_index
-
-    def _sort_column(self, col):
-        # 현재 열의 정렬 상태 업데이트
+                participants = None
+            inputs.append((row["종목"], row["부"], row["체급"], participants_str, participants))
+            if participants is not None:
+                records.append((row["종목"], row["부"], row["체급"], participants))
+
+        with profiled("경기번호 / 대진 계산"):
+            plans = plan_tournament(records)
+        sequence = None
+        if self.court_sequence_var.get() == 1:
+            try:
+                court_count = int(self.court_count_entry.get())
+                if court_count <= 0:
+                    raise ValueError("코트 수는 0보다 커야 합니다.")
+            except ValueError as e:
+                tk.messagebox.showerror("입력 오류", f"코트 수 입력이 잘못되었습니다.\n{e}", parent=self)
+                return
+            with profiled("경기번호 / 코트 통합 번호"):
+                sequence = sequence_games_across_courts(plans, court_count)
+        self.last_plan = (inputs, plans, sequence)
+
+        # 결과 전체를 먼저 만든 뒤 한 번에 지우고 채운다
+        with profiled_render(self, "경기번호 / 결과 표시"):
+            self.result_table.set_rows(result_rows(plans, sequence))
+
+    def save_to_db(self):
+        # 지금 입력으로 다시 계산한 뒤 대회 일자별로 대회 DB 에 저장 (같은 일자는 덮어쓴다)
+        self.calculate_matches()
+        if self.last_plan is None:
+            return
+        store = TournamentStore(TOURNAMENT_DB_FILE)
+        try:
+            day = ask_tournament_day(self, store.days(NUMBER_SOURCE), self.last_db_day)
+            if day is None:
+                return
+            with profiled("경기번호 / DB 저장"):
+                store.save_number_plan(day, *self.last_plan)
+        except sqlite3.Error as e:
+            tk.messagebox.showerror("오류", f"대회 DB 저장 중 오류가 발생했습니다: {e}", parent=self)
+            return
+        self.last_db_day = day
+        tk.messagebox.showinfo("성공", f"{day} 경기번호 계산 결과가 대회 DB에 저장되었습니다.", parent=self)
+
+    def load_from_db(self):
+        # 대회 DB 에 저장한 일자의 입력을 다시 채우고 계산
+        store = TournamentStore(TOURNAMENT_DB_FILE)
+        try:
+            days = store.days(NUMBER_SOURCE)
+            if not days:
+                tk.messagebox.showinfo("알림", "대회 DB에 저장된 경기번호 계산 결과가 없습니다.", parent=self)
+                return
+            day = ask_tournament_day(self, days, self.last_db_day or days[-1])
+            if day is None:
+                return
+            entries = store.load_entries(day, NUMBER_SOURCE)
+        except sqlite3.Error as e:
+            tk.messagebox.showerror("오류", f"대회 DB를 읽는 중 오류가 발생했습니다: {e}", parent=self)
+            return
+        if not entries:
+            tk.messagebox.showinfo("알림", f"{day} 에 저장된 경기번호 계산 결과가 없습니다.", parent=self)
+            return
+        self.last_db_day = day
+        self.input_grid.set_rows([self._make_row((event, division, weight_class, count_text))
+                                  for event, division, weight_class, _, count_text, *_ in entries])
+        self.calculate_matches()
+
+    def _sort_column(self, col, add=False):
+        # 클릭: 이 열만으로 정렬 (내림차순 -> 오름차순 -> 정렬 취소)
+        # Shift+클릭(add=True): 기존 정렬을 유지하고 이 열을 다음 정렬 기준으로 추가 (예: 종목 -> 부 -> 강수)
         current_state = self.sort_state[col]
-        
-        # 모든 헤더에서 화살표 제거
-        for c in self.result_tree["columns"]:
-            current_text = self.result_tree.heading(c, "text")
-            self.result_tree.heading(c, text=current_text.replace(" ▲", "").replace(" ▼", ""))
-
-        if current_state == 0: # 정렬 안됨 -> 내림차순
-            new_state = 1
-            reverse = True
-            arrow = " ▼"
-        elif current_state == 1: # 내림차순 -> 오름차순
-            new_state = 2
-            reverse = False
-            arrow = " ▲"
-        else: # 오름차순 -> 정렬 취소
-            new_state = 0
-            reverse = False # 정렬 취소 시에는 순서 무의미
-            arrow = ""
-
-        self.sort_state = {c: 0 for c in self.result_tree["columns"]} # 모든 열 정렬 상태 초기화
+        new_state = (current_state + 1) % 3 # 0: 정렬 안됨, 1: 내림차순, 2: 오름차순
+
+        if not add:
+            self.sort_columns = []
+            self.sort_state = {c: 0 for c in self.result_tree["columns"]} # 모든 열 정렬 상태 초기화
         self.sort_state[col] = new_state
+        if new_state == 0:
+            self.sort_columns = [c for c in self.sort_columns if c != col]
+        elif col not in self.sort_columns:
+            self.sort_columns.append(col)
 
-        # 현재 열 헤더에 화살표 추가
-        current_text = self.result_tree.heading(col, "text")
-        self.result_tree.heading(col, text=current_text.split(" ")[0] + arrow)
-
-        # 데이터 가져오기
-        data = []
-        for item_id in self.result_tree.get_children():
-            data.append((self.result_tree.item(item_id, 'values'), item_id))
-
-        # 정렬
-        if new_state != 0:
-            col_index = self.result_tree["columns"].index(col)
-            if col == "강수":
-                data.sort(key=lambda x: self._get_round_value(x[0][col_index]), reverse=reverse)
-            else:
-                data.sort(key=lambda x: x[0][col_index], reverse=reverse)
-            #data.sort(key=lambda x: x[0][col_index], reverse=reverse)
-
-        # Treeview 업데이트
-        for item_id in self.result_tree.get_children():
-            self.result_tree.delete(item_id)
-
-        for idx, (values, item_id) in enumerate(data):
-            # '번호' 열을 현재 순서에 맞게 업데이트
-            updated_values = list(values)
-            updated_values[0] = idx + 1
-            self.result_tree.insert('', 'end', values=updated_values)
-
-    def _get_round_value(self, round_str):
-        # Custom sort for "자유품새" rounds
-        if '결선' in round_str:
-            # Highest priority for ascending sort
-            return (0, 0)
-        elif '본선' in round_str:
-            try:
-                group_num = int(round_str.split('-')[1].replace('조', ''))
-                # Second priority
-                return (1, group_num)
-            except (IndexError, ValueError):
-                return (1, 0) # Fallback for "본선" without a group number
-        elif '예선' in round_str:
-            try:
-                group_num = int(round_str.split('-')[1].replace('조', ''))
-                # Third priority
-                return (2, group_num)
-            except (IndexError, ValueError):
-                return (2, 0) # Fallback for "예선" without a group number
+        # 헤더 화살표 갱신
+        for c in self.result_tree["columns"]:
+            arrow = {1: " ▼", 2: " ▲"}.get(self.sort_state[c], "")
+            self.result_tree.heading(c, text=c + arrow)
 
-        # Sort logic for standard tournament rounds (e.g., "8", "4")
-        try:
-            # For ascending sort, smaller numbers come first.
-            # For descending, larger numbers come first.
-            # This is the natural integer order.
-            return (3, int(round_str))
-        except ValueError:
-            # Fallback for any other string that doesn't fit the patterns above
-            return (4, round_str)
+        # 미리 계산된 정렬 키로 정렬 후, 항목을 지우지 않고 한 번에 재배치. 정렬 취소 시 계산된 순서
+        columns = self.result_tree["columns"]
+        sort_spec = [(None if c == "번호" else columns.index(c) - 1, self.sort_state[c] == 1) for c in self.sort_columns]
+        self.result_table.reorder(self.result_table.sorted_order(sort_spec))
+
+    def _on_heading_shift_click(self, event):
+        if self.result_tree.identify_region(event.x, event.y) != "heading":
+            return
+        column = self.result_tree.identify_column(event.x) # "#1" 형식
+        columns = self.result_tree["columns"]
+        index = int(column.lstrip("#")) - 1
+        if 0 <= index < len(columns):
+            self._sort_column(columns[index], add=True)
+        return "break"
 
     def export_results_to_excel(self):
         current_time = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -505,54 +349,20 @@ class GameNumberCalculator(tk.Toplevel):
 
         file_path = filedialog.asksaveasfilename(defaultextension=".xlsx",
                                                    initialfile=default_filename,
-                                                   filetypes=[("Excel files", "*.xlsx")])
+                                                   filetypes=EXPORT_FILETYPES)
         if not file_path:
             return
 
-        workbook = openpyxl.Workbook()
-        sheet = workbook.active
-        sheet.title = "경기 결과"
-
-        # 헤더 추가
-        headers = [self.result_tree.heading(col, "text").replace(" ▲", "").replace(" ▼", "") for col in self.result_tree["columns"]]
-        sheet.append(headers)
-
-        # 데이터 추가
-        for item_id in self.result_tree.get_children():
-            values = self.result_tree.item(item_id, 'values')
-            sheet.append(values)
-
+        # 헤더는 열 이름, 데이터는 Treeview 가 아니라 계산된 결과에서 화면 순서대로 바로 쓴다 (xlsx/csv/parquet)
+        headers = list(self.result_tree["columns"])
         try:
-            workbook.save(file_path)
+            export_rows(file_path, headers, self.result_table.iter_displayed_rows(), "경기 결과")
             tk.messagebox.showinfo("성공", f"결과가 {file_path}에 저장되었습니다.")
         except Exception as e:
             tk.messagebox.showerror("오류", f"파일 저장 중 오류가 발생했습니다: {e}")
 
     def add_row_with_data(self, data):
-        row_frame = tk.Frame(self.main_frame)
-        row_frame.pack(fill=tk.X, expand=True, pady=5)
-
-        row_number = len(self.rows) + 1
-        number_label = tk.Label(row_frame, text=str(row_number), width=5)
-        number_label.pack(side=tk.LEFT, padx=5)
-
-        labels = ["종목", "부", "체급", "참가인원"]
-        entries = {}
-
-        for i, label_text in enumerate(labels):
-            entry = tk.Entry(row_frame, width=15)
-            entry.pack(side=tk.LEFT, padx=5)
-            if i < len(data):
-                entry.insert(0, data[i])
-            entries[label_text] = entry
-
-        # '-' 버튼 추가
-        remove_button_font = font.Font(family="Helvetica", size=12, weight="bold")
-        remove_button = tk.Button(row_frame, text="-", bg="red", fg="white", font=remove_button_font,
-                                  command=lambda r_frame=row_frame: self.remove_row(r_frame))
-        remove_button.pack(side=tk.LEFT, padx=5)
-
-        self.rows.append({"frame": row_frame, "entries": entries, "number_label": number_label, "remove_button": remove_button})
+        self.input_grid.append_row(self._make_row(data))
 
 if __name__ == '__main__':
     root = tk.Tk()
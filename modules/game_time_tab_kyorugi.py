@@ -1,14 +1,37 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, font
-import json
 import shutil
 import os
-import openpyxl
+import sqlite3
 from datetime import datetime, timedelta
 
 from common.constants import KYORUGI_SETTINGS_FILE as SETTINGS_FILE
 from common.constants import KYORUGI_TEMPLATE_PATH as TEMPLATE_PATH
+from common.constants import KYORUGI_SESSION_FILE as SESSION_FILE
+from common.constants import TOURNAMENT_DB_FILE
+from common.settings_store import SettingsStore
+from common.session_store import SessionStore
 from utils.file_operations import download_template_file
+from utils.bracket_engine import default_round_range, matches_in_round_range, round_label_to_size, round_options
+from utils.game_time_engine import format_time, kyorugi_division_spans, kyorugi_row, kyorugi_schedule_categories, summarize_kyorugi
+from utils.court_scheduler import simulate_courts
+from utils.allocation_dialog import CourtAllocationDialog
+from utils.live_totals import LiveContribution, LiveTotals
+from utils.debounce import Debouncer
+from utils.result_export import write_xlsx
+from utils.tournament_report import KyorugiReport, kyorugi_report_sheets
+from utils.virtual_grid import VirtualGrid
+from utils.import_dialog import ExcelImportDialog
+from utils.profiler import profiled, profiled_render
+from utils.row_model import row_record
+from utils.autosave import RowAutosave
+from utils.tournament_store import KYORUGI_SOURCE, TournamentStore
+from utils.tournament_day_dialog import ask_tournament_day
+
+settings_store = SettingsStore(SETTINGS_FILE)
+
+# 입력 표의 한 행 (check 는 계산 대상 선택 체크박스)
+KyorugiInputRow = row_record("KyorugiInputRow", {"check": 0, "division": "", "weight_class": "", "count": "", "start_round": "", "end_round": ""})
 
 class KyorugiTab(ttk.Frame):
     def __init__(self, notebook, parent_app):
@@ -19,24 +42,15 @@ class KyorugiTab(ttk.Frame):
         self.color_palette = ["#ADD8E6", "#90EE90", "#FFFFE0", "#FFDAB9", "#E6E6FA", "#B0E0E6", "#FFE4E1", "#D8BFD8", "#F5DEB3", "#C0C0C0"]
         self.color_index = 0
         self.text_color_map = {}
+        self.live_settings = settings_store.load()
+        self.live_totals = LiveTotals(self._live_contribution)
+        self.live_total_label = None
+        self.last_report = None # 마지막 계산하기 결과 (보고서 저장용)
+        self.last_db_day = None
+        # 키 입력/행 추가가 이어지는 동안에는 필터 목록과 합계 표시를 미뤘다가 한 번에 갱신
+        self.filter_options_debouncer = Debouncer(self, self._update_filter_options)
+        self.live_label_debouncer = Debouncer(self, self._refresh_live_label)
         self.create_widgets()
-        self.populate_default_rows()
-
-    def _generate_round_options(self, headcount):
-        options = []
-        
-        # Generate powers of 2 rounds based on headcount exceeding half the round size
-        for power in [1024, 512, 256, 128, 64, 32, 16, 8]:
-            if headcount > (power / 2):
-                options.append(f"{power}강")
-        
-        # Specific conditions for semi-final and final
-        if headcount > 2:
-            options.append("준결승")
-        if headcount >= 2:
-            options.append("결승")
-            
-        return options
 
     def create_widgets(self):
         main_paned_window = ttk.PanedWindow(self, orient=tk.HORIZONTAL)
@@ -95,15 +109,31 @@ class KyorugiTab(ttk.Frame):
         tk.Label(header_frame, text="시작 강수", width=15, anchor='w').pack(side="left", padx=2)
         tk.Label(header_frame, text="종료 강수", width=15, anchor='w').pack(side="left", padx=2)
 
-        self.canvas = tk.Canvas(input_grid_frame)
-        scrollbar = tk.Scrollbar(input_grid_frame, orient="vertical", command=self.canvas.yview)
-        self.rows_container = tk.Frame(self.canvas)
-        self.rows_container.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-        self.canvas.create_window((0, 0), window=self.rows_container, anchor="nw")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
-        self.canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        self.populate_default_rows()
+        columns = [
+            {"key": "check", "kind": "check"},
+            {"key": "division", "width": 15},
+            {"key": "weight_class", "width": 13},
+            {"key": "count", "width": 8},
+            {"kind": "label", "text": "(", "padx": 0},
+            {"key": "start_round", "kind": "combo", "width": 10, "options": self._row_round_options},
+            {"kind": "label", "text": "~", "padx": 0},
+            {"key": "end_round", "kind": "combo", "width": 10, "options": self._row_round_options},
+            {"kind": "label", "text": ")", "padx": 0},
+            {"kind": "delete", "text": "-"},
+        ]
+        self.input_grid = VirtualGrid(input_grid_frame, columns, on_change=self._on_row_change,
+                                      on_delete=self.remove_input_row, cell_style=self._cell_style,
+                                      index_keys=("division", "weight_class"))
+        self.input_grid.pack(side="left", fill="both", expand=True)
+        self.input_rows = self.input_grid.rows
+        # 지난번 입력 행이 있으면 엑셀을 다시 읽지 않고 바로 복원, 없으면 기본 행
+        self.autosave = RowAutosave(self.input_grid, SessionStore(SESSION_FILE, KyorugiInputRow))
+        if self.autosave.restore():
+            self._reset_live_totals()
+            self._update_filter_options()
+            self._apply_filters()
+        else:
+            self.populate_default_rows()
 
         results_labelframe = tk.LabelFrame(right_frame, text="결과")
         results_labelframe.pack(expand=True, fill="both", padx=10, pady=10)
@@ -126,10 +156,24 @@ class KyorugiTab(ttk.Frame):
         self.court_entry = tk.Entry(court_frame, width=5)
         self.court_entry.insert(0, "4")
         self.court_entry.pack(side="left", padx=(0, 10))
+        self.court_entry.bind("<KeyRelease>", lambda event: self.live_label_debouncer.schedule())
+        allocation_button = tk.Button(court_frame, text="코트 배정", command=self.open_court_allocation)
+        allocation_button.pack(side="left")
 
         calc_button = tk.Button(results_labelframe, text="계산하기", bg="red", fg="white", font=("Helvetica", 10, "bold"), command=self.calculate_time)
         calc_button.pack(fill='x', padx=5, pady=10)
         self.bind('<Return>', lambda event=None: calc_button.invoke())
+        report_button = tk.Button(results_labelframe, text="보고서 저장", command=self.export_report)
+        report_button.pack(fill='x', padx=5, pady=(0, 10))
+        db_frame = tk.Frame(results_labelframe)
+        db_frame.pack(fill='x', padx=5, pady=(0, 10))
+        tk.Button(db_frame, text="DB 저장", command=self.save_to_db).pack(side="left", fill='x', expand=True)
+        tk.Button(db_frame, text="DB 불러오기", command=self.load_from_db).pack(side="left", fill='x', expand=True, padx=(5, 0))
+
+        # 입력하는 동안 바로 바뀌는 합계 (코트 시뮬레이션은 계산하기에서)
+        self.live_total_label = tk.Label(results_labelframe, justify="left", anchor="w", fg="gray25")
+        self.live_total_label.pack(fill='x', padx=5)
+        self._refresh_live_label()
 
         self.result_text = tk.Text(results_labelframe, height=15, wrap="word", state="disabled", relief="flat")
         self.result_text.pack(expand=True, fill="both", padx=5, pady=5)
@@ -143,13 +187,8 @@ class KyorugiTab(ttk.Frame):
         footer_label = tk.Label(footer_frame, text="Copyright (c) FEELJAE-WON. All rights reserved.", font=footer_font, fg="gray")
         footer_label.pack(side=tk.LEFT, padx=5)
 
-    def calculate_time(self):
-        try:
-            with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            settings = {}
-
+    def _read_time_inputs(self):
+        # (시작 시간, 코트 수). 잘못된 입력이면 오류를 보여주고 None
         try:
             start_time = datetime.strptime(self.start_time_var.get(), "%H:%M")
             court_count = int(self.court_entry.get())
@@ -157,89 +196,99 @@ class KyorugiTab(ttk.Frame):
                 raise ValueError("코트 수는 0보다 커야 합니다.")
         except ValueError as e:
             messagebox.showerror("입력 오류", f"시작 시간 또는 코트 수 입력이 잘못되었습니다.\n{e}", parent=self)
-            return
+            return None
+        return start_time, court_count
 
-        selected_rows = [row for row in self.input_rows if row['check_var'].get() == 1]
+    def _collect_kyorugi_rows(self):
+        # 체크된 행(없으면 전체)의 (입력 행, KyorugiRow) 목록. 잘못된 데이터가 있으면 오류를 보여주고 None
+        settings = settings_store.load()
+        selected_rows = [row for row in self.input_rows if row['check'] == 1]
         rows_to_process = selected_rows if selected_rows else self.input_rows
 
-        total_kyorugi_seconds_raw = 0
-        
+        collected = []
         for row in rows_to_process:
             try:
-                division = row['division'].get()
-                weight_class = row['weight_class'].get()
-                headcount = int(row['count'].get() or 0)
-                start_round = row['start_round_var'].get()
-                end_round = row['end_round_var'].get()
-                
-                if not division or headcount == 0:
+                division = row['division']
+                weight_class = row['weight_class']
+                if not division:
                     continue
 
-                time_per_match = int(settings.get(division, 450)) # 기본값 450초
-                
-                num_matches = self._get_matches_for_round_range(headcount, start_round, end_round)
-                
-                row_total_seconds = num_matches * time_per_match
-                total_kyorugi_seconds_raw += row_total_seconds
+                headcount = int(row['count'] or 0)
+                collected.append((row, kyorugi_row(division, weight_class, headcount,
+                                                   row['start_round'], row['end_round'], settings)))
 
             except (ValueError, KeyError) as e:
                 messagebox.showerror("데이터 오류", f"입력 데이터에 오류가 있습니다. 확인해주세요.\n참가부: {division}, 체급: {weight_class}\n오류: {e}", parent=self)
-                return
+                return None
+        return collected
+
+    def open_court_allocation(self):
+        time_inputs = self._read_time_inputs()
+        if time_inputs is None:
+            return
+        collected = self._collect_kyorugi_rows()
+        if collected is None:
+            return
+
+        start_time, court_count = time_inputs
+        items = [(row.division, row.weight_class, row.total_seconds) for _, row in collected if row.headcount != 0]
+        CourtAllocationDialog(self, items, court_count, start_time, ("참가부", "체급"))
+
+    @profiled("겨루기 / 계산하기")
+    def calculate_time(self):
+        self.last_report = None
+        time_inputs = self._read_time_inputs()
+        if time_inputs is None:
+            return
+        start_time, court_count = time_inputs
+
+        with profiled("겨루기 / 입력 읽기"):
+            collected = self._collect_kyorugi_rows()
+        if collected is None:
+            return
+
+        with profiled("겨루기 / 시간 계산"):
+            summary = summarize_kyorugi([row for _, row in collected])
+        total_kyorugi_seconds_raw = summary.total_seconds
 
-        kyorugi_duration_per_court = total_kyorugi_seconds_raw / court_count if court_count > 0 else 0
+        # 경기를 코트에 실제로 배정해서 종료 시각 계산 (라운드 대기, 코트 유휴 시간 반영)
+        with profiled("겨루기 / 코트 시뮬레이션"):
+            schedule = simulate_courts(kyorugi_schedule_categories(summary.rows), court_count)
+        kyorugi_duration_per_court = schedule.finish_seconds
+        self.last_report = KyorugiReport([row for row, _ in collected], summary, schedule, court_count, start_time)
+        even_split_seconds = total_kyorugi_seconds_raw / court_count if court_count > 0 else 0
 
         total_duration_seconds = kyorugi_duration_per_court
         end_time = start_time + timedelta(seconds=total_duration_seconds)
 
-        def format_time(seconds):
-            m, s = divmod(seconds, 60)
-            h, m = divmod(m, 60)
-            return f"{int(h)}시간 {int(m)}분 {int(s)}초"
-
         result_str = "==================== 코트 적용 소요시간 ====================\n\n"
         result_str += f"총 예상 소요시간: {format_time(total_duration_seconds)}\n"
         result_str += "\n[겨루기] - " + str(court_count) + " 코트 기준\n"
-        result_str += f"  총 소요시간: {format_time(kyorugi_duration_per_court)}\n\n"
+        result_str += f"  총 소요시간: {format_time(kyorugi_duration_per_court)}\n"
+        result_str += f"  (단순 계산 - 총 시간 / 코트 수: {format_time(even_split_seconds)})\n\n"
         
         result_str += "============================================================\n\n"
         result_str += f"시작 시간: {start_time.strftime('%H:%M')}\n"
         result_str += f"예상 종료 시간: {end_time.strftime('%H:%M')}\n\n"
         result_str += "============================================================\n"
 
-        # 참가부별 코트 반영 소요시간 및 게임 수
-        division_data = {}
-        for row in rows_to_process:
-            division = row['division'].get()
-            weight_class = row['weight_class'].get()
-            headcount = int(row['count'].get() or 0)
-
-            if not division or headcount == 0:
-                continue
-
-            time_per_match = int(settings.get(division, 450))
-            start_round = row['start_round_var'].get()
-            end_round = row['end_round_var'].get()
-            num_matches = self._get_matches_for_round_range(headcount, start_round, end_round)
-            row_total_seconds = num_matches * time_per_match
-
-            if division not in division_data:
-                division_data[division] = {"total_seconds": 0, "total_games": 0}
-            division_data[division]["total_seconds"] += row_total_seconds
-            division_data[division]["total_games"] += num_matches
-
+        # 참가부별 코트 반영 소요시간 (시뮬레이션에서 그 참가부의 첫 경기 시작 ~ 마지막 경기 종료) 및 게임 수
+        division_data = summary.division_data
         if division_data:
             result_str += "\n========== 참가부별 코트 반영 소요시간 및 게임 수 ==========\n\n"
+            spans = kyorugi_division_spans(summary.rows, schedule)
             for division, data in division_data.items():
-                adjusted_seconds = data["total_seconds"] / court_count if court_count > 0 else 0
-                result_str += f"  {division}: {format_time(adjusted_seconds)} (총 {data["total_games"]} 게임)\n"
+                adjusted_seconds = spans.get(division, 0)
+                result_str += f"  {division}: {format_time(adjusted_seconds)} (총 {data['total_games']} 게임)\n"
 
-        applied_settings_summary = {}
-        for row in rows_to_process:
-            division = row['division'].get()
-            if division and division not in applied_settings_summary:
-                time_per_match = int(settings.get(division, 450))
-                applied_settings_summary[division] = time_per_match
+        if schedule.matches:
+            result_str += "\n==================== 코트별 진행 예상 ====================\n\n"
+            for court, timeline in enumerate(schedule.court_timelines):
+                court_end = start_time + timedelta(seconds=schedule.court_finish_seconds[court])
+                idle_seconds = schedule.court_finish_seconds[court] - schedule.court_busy_seconds[court]
+                result_str += f"  {court + 1}코트: {court_end.strftime('%H:%M')} 종료 (총 {len(timeline)} 경기, 대기 {format_time(idle_seconds)})\n"
 
+        applied_settings_summary = summary.applied_settings
         if applied_settings_summary:
             result_str += "\n============== 적용된 참가부별 경기 시간 설정 ==============\n\n"
             for division, time_in_seconds in applied_settings_summary.items():
@@ -247,89 +296,147 @@ class KyorugiTab(ttk.Frame):
                 result_str += f"  {division}: {time_in_seconds}초 ({minutes:.1f}분)\n"
             result_str += "\n============================================================\n"
 
-        self.result_text.config(state="normal")
-        self.result_text.delete("1.0", tk.END)
-        self.result_text.insert(tk.END, result_str)
+        with profiled_render(self, "겨루기 / 결과 표시"):
+            self.result_text.config(state="normal")
+            self.result_text.delete("1.0", tk.END)
+            self.result_text.insert(tk.END, result_str)
 
-        # Apply bold tags
-        self.result_text.tag_add("bold", "3.0", "3.end") # 총 예상 소요시간
-        self.result_text.tag_add("bold", "5.0", "5.end") # 시작 시간
-        self.result_text.tag_add("bold", "6.0", "6.end") # 예상 종료 시간
+            # Apply bold tags
+            self.result_text.tag_add("bold", "3.0", "3.end") # 총 예상 소요시간
+            self.result_text.tag_add("bold", "5.0", "5.end") # 시작 시간
+            self.result_text.tag_add("bold", "6.0", "6.end") # 예상 종료 시간
 
-        self.result_text.config(state="disabled")
+            self.result_text.config(state="disabled")
 
-    def _get_matches_for_round_range(self, headcount, start_round_str, end_round_str):
-        def _extract_round_size(round_str):
-            if round_str == "결승":
-                return 2
-            elif round_str == "준결승":
-                return 4
-            try:
-                return int(round_str.replace("강", ""))
-            except ValueError:
-                return 0
-
-        if headcount <= 1:
-            return 0
+    def export_report(self):
+        # 지금 입력으로 다시 계산한 뒤 경기번호/체급별/참가부별/코트별/설정 시트를 한 통합문서로 저장
+        self.calculate_time()
+        if self.last_report is None:
+            return
+        file_path = filedialog.asksaveasfilename(parent=self, defaultextension=".xlsx",
+                                                 initialfile=f"겨루기_보고서_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                                                 filetypes=[("Excel files", "*.xlsx")])
+        if not file_path:
+            return
+        try:
+            write_xlsx(file_path, kyorugi_report_sheets(self.last_report))
+            messagebox.showinfo("성공", f"보고서가 {file_path}에 저장되었습니다.", parent=self)
+        except Exception as e:
+            messagebox.showerror("저장 실패", f"보고서를 저장하는 중 오류가 발생했습니다:\n{e}", parent=self)
 
-        start_round_size = _extract_round_size(start_round_str)
-        end_round_size = _extract_round_size(end_round_str)
+    def save_to_db(self):
+        # 지금 입력으로 다시 계산한 뒤 대회 일자별로 대회 DB 에 저장 (같은 일자는 덮어쓴다)
+        self.calculate_time()
+        if self.last_report is None:
+            return
+        store = TournamentStore(TOURNAMENT_DB_FILE)
+        try:
+            day = ask_tournament_day(self, store.days(KYORUGI_SOURCE), self.last_db_day)
+            if day is None:
+                return
+            with profiled("겨루기 / DB 저장"):
+                store.save_kyorugi(day, self.last_report, self.input_rows)
+        except sqlite3.Error as e:
+            messagebox.showerror("저장 실패", f"대회 DB에 저장하는 중 오류가 발생했습니다:\n{e}", parent=self)
+            return
+        self.last_db_day = day
+        messagebox.showinfo("성공", f"{day} 겨루기 계산 결과가 대회 DB에 저장되었습니다.", parent=self)
 
-        # Ensure start_round_size is at least as large as end_round_size for a valid range
-        if start_round_size < end_round_size:
-            start_round_size = end_round_size
+    def load_from_db(self):
+        # 대회 DB 에 저장한 일자의 체급을 입력 표에 다시 채운다 (선택했던 행은 다시 선택)
+        store = TournamentStore(TOURNAMENT_DB_FILE)
+        try:
+            days = store.days(KYORUGI_SOURCE)
+            if not days:
+                messagebox.showinfo("알림", "대회 DB에 저장된 겨루기 계산 결과가 없습니다.", parent=self)
+                return
+            day = ask_tournament_day(self, days, self.last_db_day or days[-1])
+            if day is None:
+                return
+            entries = store.load_entries(day, KYORUGI_SOURCE)
+        except sqlite3.Error as e:
+            messagebox.showerror("불러오기 실패", f"대회 DB를 읽는 중 오류가 발생했습니다:\n{e}", parent=self)
+            return
+        if not entries:
+            messagebox.showinfo("알림", f"{day} 에 저장된 겨루기 계산 결과가 없습니다.", parent=self)
+            return
+        self.last_db_day = day
+        rows = []
+        for _, division, weight_class, _, count_text, checked, start_round, end_round in entries:
+            row = self._make_row({"참가부": division, "체급": weight_class, "인원수": count_text,
+                                  "시작강수": start_round, "종료강수": end_round})
+            row['check'] = checked
+            rows.append(row)
+        self.input_grid.set_rows(rows)
+        self._reset_live_totals()
+        self._update_filter_options()
+        self._apply_filters()
 
-        total_matches = 0
-        
-        # Find the smallest power of 2 that is greater than or equal to headcount
-        initial_bracket_size = 2
-        while initial_bracket_size < headcount:
-            initial_bracket_size *= 2
-        
-        # Iterate through bracket sizes from the initial_bracket_size down to 2 (결승)
-        current_bracket_power = initial_bracket_size
+    def _get_matches_for_round_range(self, headcount, start_round_str, end_round_str):
+        return matches_in_round_range(headcount, round_label_to_size(start_round_str), round_label_to_size(end_round_str))
 
-        while current_bracket_power >= 2:
-            matches_in_this_round = 0
-            
-            if current_bracket_power == initial_bracket_size:
-                # This is the first round where byes might occur
-                # Number of players who actually play in this round
-                players_playing_this_round = headcount - (current_bracket_power - headcount)
-                matches_in_this_round = players_playing_this_round // 2
-            else:
-                # For subsequent rounds, the number of participants is exactly the bracket size
-                matches_in_this_round = current_bracket_power // 2
-            
-            # Check if this round (bracket size) is within the user's selected range
-            if current_bracket_power <= start_round_size and current_bracket_power >= end_round_size:
-                total_matches += matches_in_this_round
-            
-            current_bracket_power //= 2 # Move to the next smaller bracket (e.g., 64 -> 32)
+    def _row_headcount(self, row):
+        try:
+            return int(row['count'] or 0)
+        except ValueError:
+            return 0
 
-        return total_matches
+    def _row_round_options(self, row):
+        return round_options(self._row_headcount(row))
 
-    def _update_division_entry_color(self, entry):
-        text = entry.get()
-        if text:
-            color = self._get_color_for_text(text)
-            entry.config(bg=color, fg="black")
-        else:
-            entry.config(bg="white", fg="black")
+    def _cell_style(self, row, key):
+        if key == 'division' and row['division']:
+            return {"bg": self._get_color_for_text(row['division']), "fg": "black"}
+        if key == 'count':
+            try:
+                if int(row['count']) < 4:
+                    return {"bg": "red", "fg": "white"}
+            except ValueError:
+                pass # Reset if not a valid number
+        return None
 
-    def _update_count_entry_style(self, entry, var, row_widgets):
+    def _on_row_change(self, index, key):
+        # Update round options whenever headcount changes
+        if key == 'count':
+            self._update_row_round_options(self.input_rows[index])
+            self.input_grid.refresh_row(index)
+        elif key in ('division', 'weight_class'):
+            self.filter_options_debouncer.schedule()
+        self.live_totals.update(self.input_rows[index])
+        self.live_label_debouncer.schedule()
+
+    def _live_contribution(self, row):
+        # 계산하기와 같은 규칙: 참가부가 없거나 인원수가 0 이면 제외. 잘못된 입력도 제외 (계산하기에서 오류 표시)
+        if not row['division']:
+            return None
         try:
-            count = int(var.get())
-            if count < 4:
-                entry.config(bg="red", fg="white")
-            else:
-                entry.config(bg="white", fg="black")
+            result = kyorugi_row(row['division'], row['weight_class'], int(row['count'] or 0),
+                                 row['start_round'], row['end_round'], self.live_settings)
         except ValueError:
-            entry.config(bg="white", fg="black") # Reset if not a valid number
-        
-        # Update round options whenever headcount changes
-        if row_widgets:
-            self._update_row_round_options(row_widgets)
+            return None
+        if result.headcount == 0:
+            return None
+        return LiveContribution(result.division, result.matches, result.total_seconds)
+
+    def _reset_live_totals(self):
+        self.live_settings = settings_store.load()
+        self.live_totals.reset(self.input_rows)
+        self._refresh_live_label()
+
+    def _refresh_live_label(self):
+        self.live_label_debouncer.cancel()
+        if self.live_total_label is None:
+            return
+        totals = self.live_totals.current()
+        scope = f"선택 {self.live_totals.checked_rows}행" if self.live_totals.checked_rows else "전체"
+        text = f"실시간 합계 ({scope}): {totals.row_count}개 체급, 총 {totals.games} 경기, {format_time(totals.seconds)}"
+        try:
+            court_count = int(self.court_entry.get())
+        except ValueError:
+            court_count = 0
+        if court_count > 0:
+            text += f"\n  {court_count}코트 단순 계산: 약 {format_time(totals.seconds / court_count)}"
+        self.live_total_label.config(text=text)
 
     def _get_color_for_text(self, text):
         if text not in self.text_color_map:
@@ -338,8 +445,10 @@ class KyorugiTab(ttk.Frame):
         return self.text_color_map[text]
 
     def _update_filter_options(self):
-        divisions = sorted(list(set(row['division'].get() for row in self.input_rows if row['division'].get())))
-        weight_classes = sorted(list(set(row['weight_class'].get() for row in self.input_rows if row['weight_class'].get())))
+        self.filter_options_debouncer.cancel()
+        # 색인에 있는 값만 정렬 (행 전체를 훑지 않음)
+        divisions = sorted(value for value in self.input_grid.index.distinct('division') if value)
+        weight_classes = sorted(value for value in self.input_grid.index.distinct('weight_class') if value)
 
         self.division_filter_combo['values'] = [""] + divisions
         self.weight_class_filter_combo['values'] = [""] + weight_classes
@@ -348,15 +457,13 @@ class KyorugiTab(ttk.Frame):
         selected_division = self.division_filter_combo.get()
         selected_weight_class = self.weight_class_filter_combo.get()
 
-        for row_widgets in self.input_rows:
-            division_match = (selected_division == "" or selected_division == "참가부 필터" or row_widgets['division'].get() == selected_division)
-            weight_class_match = (selected_weight_class == "" or selected_weight_class == "체급 필터" or row_widgets['weight_class'].get() == selected_weight_class)
+        criteria = {}
+        if selected_division not in ("", "참가부 필터"):
+            criteria['division'] = selected_division
+        if selected_weight_class not in ("", "체급 필터"):
+            criteria['weight_class'] = selected_weight_class
 
-            if division_match and weight_class_match:
-                row_widgets['frame'].pack(fill='x', pady=2, anchor='w')
-            else:
-                row_widgets['frame'].pack_forget()
-        self.canvas.yview_moveto(0) # Scroll to top
+        self.input_grid.set_filter(criteria) # Scrolls to top
 
     def _clear_filters(self):
         self.division_filter_combo.set("참가부 필터")
@@ -369,116 +476,48 @@ class KyorugiTab(ttk.Frame):
         self.start_time_var.set(current_time)
 
     def populate_default_rows(self):
-        for i in range(len(self.input_rows) - 1, -1, -1):
-            self.input_rows[i]['frame'].destroy()
-            self.input_rows.pop(i)
-        
-        for _ in range(10):
-            self.add_input_row()
+        self.input_grid.set_rows([self._make_row() for _ in range(10)])
+        self._reset_live_totals()
         self._update_filter_options()
         self._apply_filters()
 
     def toggle_all_checks(self):
         is_checked = self.header_check_var.get()
-        for row_widgets in self.input_rows:
-            # Only toggle if the row is currently visible (packed)
-            if row_widgets['frame'].winfo_ismapped():
-                row_widgets['check_var'].set(is_checked)
+        # Only toggle rows that pass the current filter
+        for index in self.input_grid.view:
+            self.input_rows[index]['check'] = is_checked
+            self.live_totals.update(self.input_rows[index])
+        self.input_grid.refresh()
+        self.live_label_debouncer.schedule()
+
+    def _make_row(self, data=None):
+        data = data or {}
+        def text(key):
+            value = data.get(key)
+            return "" if value is None else str(value)
+
+        row = KyorugiInputRow(division=text("참가부"), weight_class=text("체급"), count=text("인원수"))
+        self._update_row_round_options(row, data.get("시작강수"), data.get("종료강수"))
+        return row
 
     def add_input_row(self, data=None):
-        row_frame = tk.Frame(self.rows_container)
-        row_frame.pack(fill='x', pady=2, anchor='w')
-
-        check_var = tk.IntVar()
-        check = tk.Checkbutton(row_frame, variable=check_var)
-        check.pack(side="left", padx=2)
-
-        division_var = tk.StringVar()
-        division_entry = tk.Entry(row_frame, width=15, textvariable=division_var)
-        division_entry.pack(side="left", padx=2)
-        division_var.trace_add("write", lambda name, index, mode, entry=division_entry: self._update_division_entry_color(entry))
-
-        weight_class_entry = tk.Entry(row_frame, width=13, bg="white", fg="black") # Set default color
-        weight_class_entry.pack(side="left", padx=2)
-
-        count_var = tk.StringVar()
-        count_entry = tk.Entry(row_frame, width=8, textvariable=count_var)
-        count_entry.pack(side="left", padx=2)
-        count_var.trace_add("write", lambda name, index, mode, entry=count_entry, var=count_var, row_widgets=None: self._update_count_entry_style(entry, var, row_widgets))
-
-        tk.Label(row_frame, text="(").pack(side="left")
-        start_round_var = tk.StringVar()
-        start_round_combo = ttk.Combobox(row_frame, textvariable=start_round_var, values=[], width=10, state="readonly")
-        start_round_combo.pack(side="left", padx=2)
-
-        tk.Label(row_frame, text="~").pack(side="left")
-        end_round_var = tk.StringVar()
-        end_round_combo = ttk.Combobox(row_frame, textvariable=end_round_var, values=[], width=10, state="readonly")
-        end_round_combo.pack(side="left", padx=2)
-        tk.Label(row_frame, text=")").pack(side="left")
-        
-        delete_button = tk.Button(row_frame, text="-", command=lambda: self.remove_input_row(row_widgets))
-        delete_button.pack(side="left", padx=2)
-
-        row_widgets = {
-            'frame': row_frame, 'check_var': check_var, 'division': division_entry, 
-            'weight_class': weight_class_entry, 'count': count_entry,
-            'division_var': division_var, 'count_var': count_var,
-            'start_round_var': start_round_var, 'end_round_var': end_round_var,
-            'start_round_combo': start_round_combo, 'end_round_combo': end_round_combo
-        }
-        self.input_rows.append(row_widgets)
-
-        # Pass row_widgets to the trace after it's fully defined
-        count_var.trace_add("write", lambda name, index, mode, entry=count_entry, var=count_var: self._update_count_entry_style(entry, var, row_widgets))
-
-        if data:
-            division_entry.insert(0, data.get("참가부", ""))
-            weight_class_entry.insert(0, data.get("체급", ""))
-            count_entry.insert(0, str(data.get("인원수", "")))
-            self._update_count_entry_style(count_entry, count_var, row_widgets)
-            self._update_row_round_options(row_widgets, data.get("시작강수"), data.get("종료강수"))
-        else:
-            # For new rows, ensure initial round options are set
-            self._update_row_round_options(row_widgets)
-
-        self._update_filter_options()
-        self._apply_filters()
-
-    def _update_row_round_options(self, row_widgets, initial_start_round=None, initial_end_round=None):
-        try:
-            headcount = int(row_widgets['count_var'].get() or 0)
-        except ValueError:
-            headcount = 0
-
-        options = self._generate_round_options(headcount)
-        
-        row_widgets['start_round_combo']['values'] = options
-        row_widgets['end_round_combo']['values'] = options
-
-        # Set start round
-        if initial_start_round and initial_start_round in options:
-            row_widgets['start_round_var'].set(initial_start_round)
-        elif options:
-            row_widgets['start_round_var'].set(options[0])
-        else:
-            row_widgets['start_round_var'].set("")
-
-        # Set end round
-        if initial_end_round and initial_end_round in options:
-            row_widgets['end_round_var'].set(initial_end_round)
-        elif options:
-            row_widgets['end_round_var'].set(options[-1])
-        else:
-            row_widgets['end_round_var'].set("")
-
-    def remove_input_row(self, row_widgets):
-        row_widgets['frame'].destroy()
-        self.input_rows.remove(row_widgets)
+        # append_row 가 현재 필터를 적용하므로 전체 필터를 다시 만들지 않는다
+        row = self._make_row(data)
+        self.input_grid.append_row(row)
+        self.live_totals.update(row)
+        self.live_label_debouncer.schedule()
+        self.filter_options_debouncer.schedule()
+
+    def _update_row_round_options(self, row, initial_start_round=None, initial_end_round=None):
+        row['start_round'], row['end_round'] = default_round_range(self._row_headcount(row), initial_start_round, initial_end_round)
+
+    def remove_input_row(self, index):
+        self.live_totals.remove(self.input_rows[index])
+        self.input_grid.delete_row(index) # 현재 필터로 다시 그림
         if not self.input_rows:
             self.add_input_row()
-        self._update_filter_options()
-        self._apply_filters()
+        self.live_label_debouncer.schedule()
+        self.filter_options_debouncer.schedule()
 
     def import_from_excel(self):
         file_path = filedialog.askopenfilename(
@@ -489,30 +528,27 @@ class KyorugiTab(ttk.Frame):
         if not file_path:
             return
 
-        try:
-            workbook = openpyxl.load_workbook(file_path)
-            sheet = workbook.active
-
-            for i in range(len(self.input_rows) - 1, -1, -1):
-                self.input_rows[i]['frame'].destroy()
-                self.input_rows.pop(i)
-
-            for row in sheet.iter_rows(min_row=2, values_only=True):
+        rows = []
+        def on_batch(batch):
+            for row in batch:
                 if all(cell is None or str(cell).strip() == "" for cell in row):
                     continue
                 data = {"참가부": row[0], "체급": row[1], "인원수": row[2]}
                 # Assuming Excel might have '시작강수' and '종료강수' columns
                 if len(row) > 3: data["시작강수"] = row[3]
                 if len(row) > 4: data["종료강수"] = row[4]
-                self.add_input_row(data)
-            
+                rows.append(self._make_row(data))
+
+        def on_done():
+            self.input_grid.set_rows(rows)
+            self._reset_live_totals()
             if not self.input_rows: 
                 self.add_input_row()
             self._update_filter_options()
             self._apply_filters()
 
-        except Exception as e:
-            messagebox.showerror("가져오기 실패", f"엑셀 파일을 읽는 중 오류가 발생했습니다:\n{e}", parent=self)
+        # Rows are read on a worker thread; errors are reported by the dialog
+        ExcelImportDialog(self, file_path, on_batch, on_done, phase="겨루기 / 엑셀 가져오기")
 
     def download_excel_template(self):
         download_template_file(TEMPLATE_PATH, "겨루기_경기시간_계산_양식.xlsx", [("Excel files", "*.xlsx"), ("All files", "*.* ")])
@@ -524,7 +560,7 @@ class KyorugiTab(ttk.Frame):
         settings_window.transient(self)
         settings_window.grab_set()
 
-        unique_divisions = list(set(row['division'].get() for row in self.input_rows if row['division'].get()))
+        unique_divisions = list(set(row['division'] for row in self.input_rows if row['division']))
 
         sort_order = ["초", "중", "고", "대", "일"]
         def custom_sort_key(division_name):
@@ -609,11 +645,7 @@ class KyorugiTab(ttk.Frame):
         self.load_settings()
 
     def load_settings(self):
-        try:
-            with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            settings = {}
+        settings = settings_store.load()
 
         for division, var in self.settings_entries.items():
             var.set(settings.get(division, "450"))
@@ -624,8 +656,8 @@ class KyorugiTab(ttk.Frame):
             settings[division] = var.get()
 
         try:
-            with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, ensure_ascii=False, indent=4)
+            settings_store.save(settings)
+            self._reset_live_totals() # 경기 시간 설정이 바뀌면 모든 행의 기여분이 바뀜
             window.destroy()
         except Exception as e:
             messagebox.showerror("저장 실패", f"설정을 저장하는 중 오류가 발생했습니다:\n{e}", parent=window)
@@ -1,25 +1,53 @@
 import tkinter as tk
 from tkinter import ttk, font, messagebox, filedialog
-import json
 import shutil
 import os
-import openpyxl
+import sqlite3
 from datetime import datetime, timedelta
 
 from common.constants import POOMSAE_SETTINGS_FILE as SETTINGS_FILE
 from common.constants import POOMSAE_TEMPLATE_PATH as TEMPLATE_PATH
+from common.constants import POOMSAE_SESSION_FILE as SESSION_FILE
+from common.constants import TOURNAMENT_DB_FILE
+from common.settings_store import SettingsStore
+from common.session_store import SessionStore
 from utils.file_operations import download_template_file
+from utils.game_time_engine import DEFAULT_POOMSAE_SETTINGS as DEFAULT_SETTINGS
+from utils.game_time_engine import FREESTYLE, GONGIN, POOMSAE_DIVISIONS, POOMSAE_EVENT_TYPES, format_time, poomsae_row, poomsae_schedule_categories, summarize_poomsae
+from utils.court_scheduler import simulate_courts
+from utils.allocation_dialog import CourtAllocationDialog
+from utils.live_totals import LiveContribution, LiveTotals
+from utils.debounce import Debouncer
+from utils.result_export import write_xlsx
+from utils.tournament_report import PoomsaeReport, poomsae_report_sheets
+from utils.virtual_grid import VirtualGrid
+from utils.import_dialog import ExcelImportDialog
+from utils.profiler import profiled, profiled_render
+from utils.row_model import row_record
+from utils.autosave import RowAutosave
+from utils.tournament_store import POOMSAE_SOURCE, TournamentStore
+from utils.tournament_day_dialog import ask_tournament_day
+
+settings_store = SettingsStore(SETTINGS_FILE, DEFAULT_SETTINGS)
+
+# 입력 표의 한 행 (check 는 계산 대상 선택 체크박스)
+PoomsaeInputRow = row_record("PoomsaeInputRow", {"check": 0, "event": "", "division": "", "class": "", "gender": "", "count": ""})
+
+EVENT_COLORS = {
+    "개인전": "#E0FFFF", # Light Cyan
+    "복식전": "#F08080", # Light Coral
+    "단체전": "#FAFAD2", # Light Goldenrod Yellow
+    "개인전(자유품새)": "#98FB98", # Pale Green
+    "복식전(자유품새)": "#FFA07A", # Light Salmon
+    "단체전(자유품새)": "#B0C4DE"  # Light Steel Blue
+}
 
-DEFAULT_SETTINGS = {
-    "individual": {
-        "초등부": "210", "중등부": "210", "고등부": "210", "대학부": "240", "일반부": "240"
-    },
-    "team": {
-        "초등부": "390", "중등부": "420", "고등부": "390", "대학부": "450", "일반부": "420"
-    },
-    "freestyle": {
-        "개인": "140", "복식": "140", "단체": "140"
-    }
+DIVISION_COLORS = {
+    "초등부": "#ADD8E6", # Light Blue
+    "중등부": "#90EE90", # Light Green
+    "고등부": "#FFFFE0", # Light Yellow
+    "대학부": "#FFDAB9", # Peach Puff
+    "일반부": "#E6E6FA"  # Lavender
 }
 
 class PoomsaeTab(ttk.Frame):
@@ -27,7 +55,12 @@ class PoomsaeTab(ttk.Frame):
         super().__init__(notebook)
         self.parent_app = parent_app # Reference to the main GameTimeCalculator app
         self.input_rows = []
-        self.rows_container = None # Initialize rows_container
+        self.live_settings = settings_store.load()
+        self.live_totals = LiveTotals(self._live_contribution)
+        self.live_total_label = None
+        self.last_report = None # 마지막 계산하기 결과 (보고서 저장용)
+        self.last_db_day = None
+        self.live_label_debouncer = Debouncer(self, self._refresh_live_label) # 키 입력 동안 합계 표시를 모아서 갱신
         self.create_widgets()
 
     def create_widgets(self):
@@ -95,17 +128,28 @@ class PoomsaeTab(ttk.Frame):
         tk.Label(header_frame, text="성별", width=10, anchor='w').pack(side="left", padx=2)
         tk.Label(header_frame, text="인원수", width=15, anchor='w').pack(side="left", padx=2)
 
-        
-        canvas = tk.Canvas(input_grid_frame)
-        scrollbar = tk.Scrollbar(input_grid_frame, orient="vertical", command=canvas.yview)
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-
-        self.rows_container = tk.Frame(canvas)
-        self.rows_container.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=self.rows_container, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        self.populate_default_rows()
+        columns = [
+            {"key": "check", "kind": "check"},
+            {"key": "event", "width": 18},
+            {"key": "division", "width": 18},
+            {"key": "class", "width": 15},
+            {"key": "gender", "width": 10},
+            # Tab / Shift-Tab moves focus to the next / previous game count entry
+            {"key": "count", "width": 10, "tab_cycle": True},
+            {"kind": "delete", "text": "-"},
+        ]
+        self.input_grid = VirtualGrid(input_grid_frame, columns, on_change=self._on_row_change,
+                                      on_delete=self.remove_input_row, cell_style=self._cell_style,
+                                      index_keys=("event", "division", "gender"))
+        self.input_grid.pack(side="left", fill="both", expand=True)
+        self.input_rows = self.input_grid.rows
+        # 지난번 입력 행이 있으면 엑셀을 다시 읽지 않고 바로 복원, 없으면 기본 행
+        self.autosave = RowAutosave(self.input_grid, SessionStore(SESSION_FILE, PoomsaeInputRow))
+        if self.autosave.restore():
+            self._reset_live_totals()
+            self._clear_filters()
+        else:
+            self.populate_default_rows()
 
         results_labelframe = tk.LabelFrame(right_frame, text="결과")
         results_labelframe.pack(expand=True, fill="both", padx=10, pady=10)
@@ -132,10 +176,15 @@ class PoomsaeTab(ttk.Frame):
         self.jayu_court_entry = tk.Entry(court_frame, width=5)
         self.jayu_court_entry.insert(0, "2")
         self.jayu_court_entry.pack(side="left")
+        for entry in (self.gongin_court_entry, self.jayu_court_entry):
+            entry.bind("<KeyRelease>", lambda event: self.live_label_debouncer.schedule())
 
         self.freestyle_simultaneous_var = tk.IntVar(value=0) # Default to unchecked
-        freestyle_simultaneous_check = tk.Checkbutton(court_frame, text="자유품새 동시진행", variable=self.freestyle_simultaneous_var)
+        freestyle_simultaneous_check = tk.Checkbutton(court_frame, text="자유품새 동시진행", variable=self.freestyle_simultaneous_var,
+                                                       command=self._refresh_live_label)
         freestyle_simultaneous_check.pack(side="left", padx=5)
+        allocation_button = tk.Button(court_frame, text="코트 배정", command=self.open_court_allocation)
+        allocation_button.pack(side="left")
 
         freestyle_calc_options_frame = ttk.LabelFrame(results_labelframe, text="자유품새 계산")
         freestyle_calc_options_frame.pack(fill="x", padx=10, pady=(0, 10))
@@ -147,10 +196,23 @@ class PoomsaeTab(ttk.Frame):
         ttk.Checkbutton(freestyle_calc_options_frame, text="예선", variable=self.prelim_var).pack(side="left", padx=5, pady=5)
         ttk.Checkbutton(freestyle_calc_options_frame, text="본선", variable=self.main_var).pack(side="left", padx=5, pady=5)
         ttk.Checkbutton(freestyle_calc_options_frame, text="결선", variable=self.final_var).pack(side="left", padx=5, pady=5)
+        for var in (self.prelim_var, self.main_var, self.final_var):
+            var.trace_add("write", lambda name, index, mode: self._reset_live_totals())
 
         calc_button = tk.Button(results_labelframe, text="계산하기", bg="red", fg="white", font=("Helvetica", 10, "bold"), command=self.calculate_time)
         calc_button.pack(fill='x', padx=5, pady=10)
         self.bind('<Return>', lambda event=None: calc_button.invoke())
+        report_button = tk.Button(results_labelframe, text="보고서 저장", command=self.export_report)
+        report_button.pack(fill='x', padx=5, pady=(0, 10))
+        db_frame = tk.Frame(results_labelframe)
+        db_frame.pack(fill='x', padx=5, pady=(0, 10))
+        tk.Button(db_frame, text="DB 저장", command=self.save_to_db).pack(side="left", fill='x', expand=True)
+        tk.Button(db_frame, text="DB 불러오기", command=self.load_from_db).pack(side="left", fill='x', expand=True, padx=(5, 0))
+
+        # 입력하는 동안 바로 바뀌는 합계 (코트 시뮬레이션은 계산하기에서)
+        self.live_total_label = tk.Label(results_labelframe, justify="left", anchor="w", fg="gray25")
+        self.live_total_label.pack(fill='x', padx=5)
+        self._reset_live_totals()
 
         self.result_text = tk.Text(results_labelframe, height=15, wrap="word", state="disabled", relief="flat")
         self.result_text.pack(expand=True, fill="both", padx=5, pady=5)
@@ -164,13 +226,8 @@ class PoomsaeTab(ttk.Frame):
         footer_label = tk.Label(footer_frame, text="Copyright (c) FEELJAE-WON. All rights reserved.", font=footer_font, fg="gray")
         footer_label.pack(side=tk.LEFT, padx=5)
 
-    def calculate_time(self):
-        try:
-            with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            settings = DEFAULT_SETTINGS
-
+    def _read_time_inputs(self):
+        # (시작 시간, 공인 코트 수, 자유 코트 수). 잘못된 입력이면 오류를 보여주고 None
         try:
             start_time = datetime.strptime(self.start_time_var.get(), "%H:%M")
             gongin_courts = int(self.gongin_court_entry.get())
@@ -179,171 +236,92 @@ class PoomsaeTab(ttk.Frame):
                 raise ValueError("코트 수는 0보다 커야 합니다.")
         except ValueError as e:
             messagebox.showerror("입력 오류", f"시작 시간 또는 코트 수 입력이 잘못되었습니다.\n{e}", parent=self)
-            return
+            return None
+        return start_time, gongin_courts, jayu_courts
 
-        selected_rows = [row for row in self.input_rows if row['check_var'].get() == 1]
+    def _collect_poomsae_rows(self):
+        # 체크된 행(없으면 전체)의 (입력 행, PoomsaeRow) 목록. 잘못된 데이터가 있으면 오류를 보여주고 None
+        settings = settings_store.load()
+        selected_rows = [row for row in self.input_rows if row['check'] == 1]
         rows_to_process = selected_rows if selected_rows else self.input_rows
 
-        total_seconds_gongin_raw = 0
-        total_seconds_jayu_raw = 0
-
-        sub_totals = {
-            "공인품새": {"개인전": {"time": 0, "games": 0}, "복식전": {"time": 0, "games": 0}, "단체전": {"time": 0, "games": 0}},
-            "자유품새": {"개인전": {"time": 0, "games": 0}, "복식전": {"time": 0, "games": 0}, "단체전": {"time": 0, "games": 0}}
-        }
-
+        poomsae_rows = []
         for row in rows_to_process:
             try:
-                event_input = row['event'].get() # e.g., "개인전", "개인전(자유품새)"
-                division_input = row['division'].get() # e.g., "초등부", "일반부"
-                category = row['class'].get()
-                gender = row['gender'].get()
-                original_headcount = int(row['count'].get() or 0)
-                calculated_headcount = original_headcount # Initialize with original headcount
-
-                # Determine the actual event type (공인품새 or 자유품새) for calculation and sub_totals key
-                actual_event_type = "공인품새"
-                if "자유품새" in event_input:
-                    actual_event_type = "자유품새"
-
-                # Determine the actual division type (개인전, 복식전, 단체전) from event_input
-                actual_division_type = event_input.replace("(자유품새)", "").strip()
+                event_input = row['event'] # e.g., "개인전", "개인전(자유품새)"
+                division_input = row['division'] # e.g., "초등부", "일반부"
+                category = row['class']
+                gender = row['gender']
+                original_headcount = int(row['count'] or 0)
 
                 # Validate division_input (참가부) against expected categories
-                valid_categories = ["초등부", "중등부", "고등부", "대학부", "일반부"]
-                if division_input not in valid_categories:
-                    messagebox.showerror("데이터 오류", f"참가부 입력이 잘못되었습니다. {', '.join(valid_categories)} 중 하나여야 합니다.\n잘못된 값: {division_input}", parent=self)
-                    return # Stop calculation if invalid data is found
-
-                # Apply headcount adjustments based on actual_event_type and actual_division_type
-                if actual_event_type == "공인품새":
-                    if actual_division_type == "개인전":
-                        calculated_headcount = original_headcount - 1
-                    elif actual_division_type == "복식전":
-                        calculated_headcount = (original_headcount / 2) - 1
-                    elif actual_division_type == "단체전":
-                        calculated_headcount = (original_headcount / 3) - 1
-                else: # 자유품새
-                    if actual_division_type == "개인전":
-                        if original_headcount > 22:
-                            participants = original_headcount
-                            num_prelim_groups = 2
-                            while participants / num_prelim_groups > 11.5 and num_prelim_groups % 2 == 0:
-                                num_prelim_groups += 2
-
-                            if num_prelim_groups < 2:
-                                num_prelim_groups = 2
-                            if num_prelim_groups % 2 != 0:
-                                num_prelim_groups += 1
-
-                            base_prelim_group_size = participants // num_prelim_groups
-                            remainder_prelim = participants % num_prelim_groups
-
-                            prelim_group_sizes = []
-                            for g in range(num_prelim_groups):
-                                size = base_prelim_group_size
-                                if g < remainder_prelim:
-                                    size += 1
-                                prelim_group_sizes.append(size)
-
-                            # Calculate advancement to main round based on first group size
-                            first_group_size = prelim_group_sizes[0] if prelim_group_sizes else 0
-                            advancement_per_group = (first_group_size + 1) // 2 # Round up
-                            total_main_round_participants_for_next_stage = advancement_per_group * num_prelim_groups
-
-                            # Now, calculate main round groups based on total_main_round_participants_for_next_stage
-                            num_main_groups = 2
-                            while total_main_round_participants_for_next_stage / num_main_groups > 11.5 and num_main_groups % 2 == 0:
-                                num_main_groups += 2
-
-                            if num_main_groups < 2:
-                                num_main_groups = 2
-                            if num_main_groups % 2 != 0:
-                                num_main_groups += 1
-
-                            base_main_group_size = total_main_round_participants_for_next_stage // num_main_groups
-                            remainder_main = total_main_round_participants_for_next_stage % num_main_groups
-
-                            main_group_sizes = []
-                            for g in range(num_main_groups):
-                                size = base_main_group_size
-                                if g < remainder_main:
-                                    size += 1
-                                main_group_sizes.append(size)
-
-                            calculated_headcount = 0
-                            if self.prelim_var.get():
-                                calculated_headcount += sum(prelim_group_sizes)
-                            if self.main_var.get():
-                                calculated_headcount += sum(main_group_sizes)
-                            if self.final_var.get():
-                                calculated_headcount += 8 # 결선은 항상 8명
-
-                        elif 12 <= original_headcount <= 21:
-                            calculated_headcount = 0
-                            if self.main_var.get():
-                                calculated_headcount += original_headcount
-                            if self.final_var.get():
-                                calculated_headcount += 8 # 결선은 항상 8명
-                        # else: original_headcount <= 11, calculated_headcount remains original_headcount
-                        # If only final is checked for <= 11 participants, it should be 8
-                        if original_headcount <= 11 and self.final_var.get() and not self.prelim_var.get() and not self.main_var.get():
-                            calculated_headcount = 8
-                        elif original_headcount <= 11 and not self.final_var.get() and not self.prelim_var.get() and not self.main_var.get():
-                            calculated_headcount = 0 # If nothing is checked, and participants <= 11, then 0
-                        elif original_headcount <= 11 and self.final_var.get() and (self.prelim_var.get() or self.main_var.get()):
-                            calculated_headcount = original_headcount + 8 # If final is checked and other rounds are also checked, add 8 for final
-                        elif original_headcount <= 11 and (self.prelim_var.get() or self.main_var.get()):
-                            calculated_headcount = original_headcount # If only prelim/main are checked, use original headcount
-                    elif actual_division_type == "복식전":
-                        calculated_headcount = original_headcount / 2
-                    elif actual_division_type == "단체전":
-                        calculated_headcount = original_headcount / 5
-
-                time_per_game = 0
-                if actual_event_type == "공인품새":
-                    if actual_division_type == "개인전":
-                        time_per_game = int(settings['individual'].get(division_input, 0)) # Use division_input as category
-                    elif actual_division_type == "복식전" or actual_division_type == "단체전":
-                        time_per_game = int(settings['team'].get(division_input, 0)) # Use division_input as category
-                else: # 자유품새
-                    freestyle_map = {"개인전": "개인", "복식전": "복식", "단체전": "단체"}
-                    time_per_game = int(settings['freestyle'].get(freestyle_map.get(actual_division_type), 0))
-                
-                row_total_seconds = calculated_headcount * time_per_game
-                
-                # Accumulate raw total seconds for each poomsae type
-                if actual_event_type == "공인품새":
-                    total_seconds_gongin_raw += row_total_seconds
-                else:
-                    total_seconds_jayu_raw += row_total_seconds
-
-                # Accumulate raw sub-totals for each division
-                # Use actual_event_type for the first level key
-                sub_totals[actual_event_type][actual_division_type]["time"] += row_total_seconds
-                sub_totals[actual_event_type][actual_division_type]["games"] += calculated_headcount # Store calculated games
+                if division_input not in POOMSAE_DIVISIONS:
+                    messagebox.showerror("데이터 오류", f"참가부 입력이 잘못되었습니다. {', '.join(POOMSAE_DIVISIONS)} 중 하나여야 합니다.\n잘못된 값: {division_input}", parent=self)
+                    return None # Stop calculation if invalid data is found
+
+                poomsae_rows.append((row, poomsae_row(event_input, division_input, original_headcount, settings,
+                                                      self.prelim_var.get(), self.main_var.get(), self.final_var.get())))
 
             except (ValueError, KeyError) as e:
                 messagebox.showerror("데이터 오류", f"입력 데이터에 오류가 있습니다. 확인해주세요.\n종목: {event_input}, 참가부: {division_input}, 세부부별: {category}, 성별: {gender}\n오류: {e}", parent=self)
-                return
+                return None
+        return poomsae_rows
+
+    def open_court_allocation(self):
+        # 공인품새는 공인 코트에, 자유품새는 동시진행일 때만 자유 코트에 나눠 배정
+        time_inputs = self._read_time_inputs()
+        if time_inputs is None:
+            return
+        collected = self._collect_poomsae_rows()
+        if collected is None:
+            return
+
+        start_time, gongin_courts, jayu_courts = time_inputs
+        pools = [(GONGIN, gongin_courts)]
+        if self.freestyle_simultaneous_var.get() == 1:
+            pools.append((FREESTYLE, jayu_courts))
+        for poomsae_type, court_count in pools:
+            items = [(result.division, " ".join(part for part in (row['event'], row['class'], row['gender']) if part), result.total_seconds)
+                     for row, result in collected if result.poomsae_type == poomsae_type and result.total_seconds > 0]
+            dialog = CourtAllocationDialog(self, items, court_count, start_time, ("참가부", "종목"))
+            dialog.title(f"코트 배정 - {poomsae_type}")
+
+    @profiled("품새 / 계산하기")
+    def calculate_time(self):
+        self.last_report = None
+        time_inputs = self._read_time_inputs()
+        if time_inputs is None:
+            return
+        start_time, gongin_courts, jayu_courts = time_inputs
+
+        with profiled("품새 / 입력 읽기"):
+            collected = self._collect_poomsae_rows()
+        if collected is None:
+            return
+        poomsae_rows = [result for _, result in collected]
+
+        with profiled("품새 / 시간 계산"):
+            summary = summarize_poomsae(poomsae_rows)
+        sub_totals = summary.sub_totals
 
         # Calculate court-applied durations for each poomsae type
-        gongin_duration_per_court = total_seconds_gongin_raw / gongin_courts if gongin_courts > 0 else 0
-        
-        jayu_duration_per_court = total_seconds_jayu_raw
-        if self.freestyle_simultaneous_var.get() == 1: # If checkbox is checked, divide by court count
-            jayu_duration_per_court = total_seconds_jayu_raw / jayu_courts if jayu_courts > 0 else 0
+        # 종목(행)을 코트에 실제로 배정해서 계산 (한 종목은 한 코트에서 진행)
+        jayu_court_count = jayu_courts if self.freestyle_simultaneous_var.get() == 1 else 1 # If checkbox is checked, use all courts
+        with profiled("품새 / 코트 시뮬레이션"):
+            gongin_schedule = simulate_courts(poomsae_schedule_categories([r for r in summary.rows if r.poomsae_type == GONGIN]), gongin_courts)
+            jayu_schedule = simulate_courts(poomsae_schedule_categories([r for r in summary.rows if r.poomsae_type == FREESTYLE]), jayu_court_count)
+        gongin_duration_per_court = gongin_schedule.finish_seconds
+        jayu_duration_per_court = jayu_schedule.finish_seconds
+        self.last_report = PoomsaeReport([row for row, _ in collected], summary, gongin_schedule, jayu_schedule, gongin_courts,
+                                         jayu_courts, self.freestyle_simultaneous_var.get() == 1,
+                                         (self.prelim_var.get(), self.main_var.get(), self.final_var.get()),
+                                         settings_store.load(), start_time)
 
         # Total estimated time is the sum of court-applied times for each poomsae type
         total_duration_seconds = gongin_duration_per_court + jayu_duration_per_court
         end_time = start_time + timedelta(seconds=total_duration_seconds)
 
         # --- Display Results ---
-        def format_time(seconds):
-            m, s = divmod(seconds, 60)
-            h, m = divmod(m, 60)
-            return f"{int(h)}시간 {int(m)}분 {int(s)}초"
-
         def format_subtotal_with_games(seconds, games_count, court_divisor=1):
             # Apply court division here for individual division times
             effective_seconds = seconds / court_divisor if court_divisor > 0 else 0
@@ -377,6 +355,13 @@ class PoomsaeTab(ttk.Frame):
         result_str += f"  단체전 소요시간: {format_subtotal_with_games(sub_totals['자유품새']['단체전']['time'], sub_totals['자유품새']['단체전']['games'], jayu_courts if self.freestyle_simultaneous_var.get() == 1 else 1)}\n\n"
         result_str += f"  자유품새 총 소요시간: {format_time(jayu_duration_per_court)} (총 {int(total_jayu_games)} 게임)\n"
 
+        # 코트별 종료 예상 (공인품새 후 자유품새 진행)
+        result_str += "\n==================== 코트별 진행 예상 ====================\n\n"
+        for label, schedule, offset in (("공인품새", gongin_schedule, 0), ("자유품새", jayu_schedule, gongin_duration_per_court)):
+            for court, timeline in enumerate(schedule.court_timelines):
+                court_end = start_time + timedelta(seconds=offset + schedule.court_finish_seconds[court])
+                result_str += f"  {label} {court + 1}코트: {court_end.strftime('%H:%M')} 종료 (총 {len(timeline)} 종목)\n"
+
         result_str += "\n============================================================\n"
         
         result_str += "\n ** 설명 **\n\n"
@@ -393,30 +378,135 @@ class PoomsaeTab(ttk.Frame):
         result_str += "       * 11명(팀) 이하일 경우 결선으로 계산\n"
         
 
-        self.result_text.config(state="normal")
-        self.result_text.delete("1.0", tk.END)
-        self.result_text.insert(tk.END, result_str)
-
-        # Apply bold tags
-        self.result_text.tag_add("bold", "3.0", "3.end") # 총 예상 소요시간
-        self.result_text.tag_add("bold", "5.0", "5.end") # 시작 시간
-        self.result_text.tag_add("bold", "7.0", "7.end") # 예상 종료 시간
-
-        # Find and bold "공인품새 총 소요시간" and "자유품새 총 소요시간"
-        # These lines might shift, so find them dynamically
-        gongin_total_time_start = self.result_text.search("공인품새 총 소요시간", "1.0", tk.END)
-        if gongin_total_time_start:
-            gongin_total_time_end = self.result_text.search("\n", gongin_total_time_start, tk.END)
-            if gongin_total_time_end:
-                self.result_text.tag_add("bold", gongin_total_time_start, gongin_total_time_end)
+        with profiled_render(self, "품새 / 결과 표시"):
+            self.result_text.config(state="normal")
+            self.result_text.delete("1.0", tk.END)
+            self.result_text.insert(tk.END, result_str)
+
+            # Apply bold tags
+            self.result_text.tag_add("bold", "3.0", "3.end") # 총 예상 소요시간
+            self.result_text.tag_add("bold", "5.0", "5.end") # 시작 시간
+            self.result_text.tag_add("bold", "7.0", "7.end") # 예상 종료 시간
+
+            # Find and bold "공인품새 총 소요시간" and "자유품새 총 소요시간"
+            # These lines might shift, so find them dynamically
+            gongin_total_time_start = self.result_text.search("공인품새 총 소요시간", "1.0", tk.END)
+            if gongin_total_time_start:
+                gongin_total_time_end = self.result_text.search("\n", gongin_total_time_start, tk.END)
+                if gongin_total_time_end:
+                    self.result_text.tag_add("bold", gongin_total_time_start, gongin_total_time_end)
+
+            jayu_total_time_start = self.result_text.search("자유품새 총 소요시간", "1.0", tk.END)
+            if jayu_total_time_start:
+                jayu_total_time_end = self.result_text.search("\n", jayu_total_time_start, tk.END)
+                if jayu_total_time_end:
+                    self.result_text.tag_add("bold", jayu_total_time_start, jayu_total_time_end)
+
+            self.result_text.config(state="disabled")
+
+    def _on_row_change(self, index, key):
+        self.live_totals.update(self.input_rows[index])
+        self.live_label_debouncer.schedule()
+
+    def _live_contribution(self, row):
+        # 계산하기와 같은 규칙. 잘못된 입력은 제외 (계산하기에서 오류 표시)
+        try:
+            result = poomsae_row(row['event'], row['division'], int(row['count'] or 0), self.live_settings,
+                                 self.prelim_var.get(), self.main_var.get(), self.final_var.get())
+        except ValueError:
+            return None
+        return LiveContribution((result.poomsae_type, result.event_type), result.games, result.total_seconds)
+
+    def _reset_live_totals(self):
+        if self.live_total_label is None:
+            return # 위젯을 만드는 중
+        self.live_settings = settings_store.load()
+        self.live_totals.reset(self.input_rows)
+        self._refresh_live_label()
+
+    def _refresh_live_label(self):
+        self.live_label_debouncer.cancel()
+        totals = self.live_totals.current()
+        scope = f"선택 {self.live_totals.checked_rows}행" if self.live_totals.checked_rows else "전체"
+        lines = [f"실시간 합계 ({scope}):"]
+        for poomsae_type, court_entry, divide in ((GONGIN, self.gongin_court_entry, True),
+                                                  (FREESTYLE, self.jayu_court_entry, self.freestyle_simultaneous_var.get() == 1)):
+            games = seconds = 0
+            for event_type in POOMSAE_EVENT_TYPES:
+                group_games, group_seconds = totals.groups.get((poomsae_type, event_type), (0, 0))
+                games += group_games
+                seconds += group_seconds
+            text = f"  {poomsae_type}: 총 {round(games)} 게임, {format_time(seconds)}"
+            try:
+                court_count = int(court_entry.get()) if divide else 1
+            except ValueError:
+                court_count = 0
+            if court_count > 0:
+                text += f" (코트 적용 약 {format_time(seconds / court_count)})"
+            lines.append(text)
+        self.live_total_label.config(text="\n".join(lines))
+
+    def export_report(self):
+        # 지금 입력으로 다시 계산한 뒤 조 편성/종목별/구분별/코트별/설정 시트를 한 통합문서로 저장
+        self.calculate_time()
+        if self.last_report is None:
+            return
+        file_path = filedialog.asksaveasfilename(parent=self, defaultextension=".xlsx",
+                                                 initialfile=f"품새_보고서_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                                                 filetypes=[("Excel files", "*.xlsx")])
+        if not file_path:
+            return
+        try:
+            write_xlsx(file_path, poomsae_report_sheets(self.last_report))
+            messagebox.showinfo("성공", f"보고서가 {file_path}에 저장되었습니다.", parent=self)
+        except Exception as e:
+            messagebox.showerror("저장 실패", f"보고서를 저장하는 중 오류가 발생했습니다:\n{e}", parent=self)
 
-        jayu_total_time_start = self.result_text.search("자유품새 총 소요시간", "1.0", tk.END)
-        if jayu_total_time_start:
-            jayu_total_time_end = self.result_text.search("\n", jayu_total_time_start, tk.END)
-            if jayu_total_time_end:
-                self.result_text.tag_add("bold", jayu_total_time_start, jayu_total_time_end)
+    def save_to_db(self):
+        # 지금 입력으로 다시 계산한 뒤 대회 일자별로 대회 DB 에 저장 (같은 일자는 덮어쓴다)
+        self.calculate_time()
+        if self.last_report is None:
+            return
+        store = TournamentStore(TOURNAMENT_DB_FILE)
+        try:
+            day = ask_tournament_day(self, store.days(POOMSAE_SOURCE), self.last_db_day)
+            if day is None:
+                return
+            with profiled("품새 / DB 저장"):
+                store.save_poomsae(day, self.last_report, self.input_rows)
+        except sqlite3.Error as e:
+            messagebox.showerror("저장 실패", f"대회 DB에 저장하는 중 오류가 발생했습니다:\n{e}", parent=self)
+            return
+        self.last_db_day = day
+        messagebox.showinfo("성공", f"{day} 품새 계산 결과가 대회 DB에 저장되었습니다.", parent=self)
 
-        self.result_text.config(state="disabled")
+    def load_from_db(self):
+        # 대회 DB 에 저장한 일자의 종목을 입력 표에 다시 채운다 (선택했던 행은 다시 선택)
+        store = TournamentStore(TOURNAMENT_DB_FILE)
+        try:
+            days = store.days(POOMSAE_SOURCE)
+            if not days:
+                messagebox.showinfo("알림", "대회 DB에 저장된 품새 계산 결과가 없습니다.", parent=self)
+                return
+            day = ask_tournament_day(self, days, self.last_db_day or days[-1])
+            if day is None:
+                return
+            entries = store.load_entries(day, POOMSAE_SOURCE)
+        except sqlite3.Error as e:
+            messagebox.showerror("불러오기 실패", f"대회 DB를 읽는 중 오류가 발생했습니다:\n{e}", parent=self)
+            return
+        if not entries:
+            messagebox.showinfo("알림", f"{day} 에 저장된 품새 계산 결과가 없습니다.", parent=self)
+            return
+        self.last_db_day = day
+        rows = []
+        for event, division, category, gender, count_text, checked, _, _ in entries:
+            row = self._make_row({"종목": event, "참가부": division, "세부부별": category, "성별": gender, "인원수": count_text})
+            row['check'] = checked
+            rows.append(row)
+        self.input_grid.set_rows(rows)
+        self._reset_live_totals()
+        self._clear_filters()
 
     def set_current_time(self):
         now = datetime.now()
@@ -424,16 +514,6 @@ class PoomsaeTab(ttk.Frame):
         self.start_time_var.set(current_time)
 
     def populate_default_rows(self):
-        for i in range(len(self.input_rows) - 1, -1, -1):
-            self.input_rows[i]['frame'].destroy()
-            self.input_rows.pop(i)
-
-        try:
-            with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            settings = DEFAULT_SETTINGS
-
         all_rows_data = []
 
         # 공인품새
@@ -459,12 +539,13 @@ class PoomsaeTab(ttk.Frame):
             division_order.get(x["참가부"], 99)
         ))
 
-        for data in all_rows_data:
-            self.add_input_row(data)
+        rows = [self._make_row(data) for data in all_rows_data]
 
         # Ensure there are at least 10 rows
-        while len(self.input_rows) < 10:
-            self.add_input_row()
+        while len(rows) < 10:
+            rows.append(self._make_row())
+        self.input_grid.set_rows(rows)
+        self._reset_live_totals()
         self._clear_filters() # Apply filters after populating rows
 
     def _apply_filters(self, event=None):
@@ -472,15 +553,13 @@ class PoomsaeTab(ttk.Frame):
         selected_division = self.division_filter_combo.get()
         selected_gender = self.gender_filter_combo.get()
 
-        for row_widgets in self.input_rows:
-            event_match = (selected_event == "" or selected_event == "종목 필터" or row_widgets['event'].get() == selected_event)
-            division_match = (selected_division == "" or selected_division == "참가부 필터" or row_widgets['division'].get() == selected_division)
-            gender_match = (selected_gender == "" or selected_gender == "성별 필터" or row_widgets['gender'].get() == selected_gender)
+        criteria = {}
+        for key, selected, placeholder in (('event', selected_event, "종목 필터"), ('division', selected_division, "참가부 필터"),
+                                           ('gender', selected_gender, "성별 필터")):
+            if selected not in ("", placeholder):
+                criteria[key] = selected
 
-            if event_match and division_match and gender_match:
-                row_widgets['frame'].pack(fill='x', pady=2, anchor='w')
-            else:
-                row_widgets['frame'].pack_forget()
+        self.input_grid.set_filter(criteria)
 
     def _clear_filters(self):
         self.event_filter_combo.set("종목 필터")
@@ -490,71 +569,42 @@ class PoomsaeTab(ttk.Frame):
 
     def toggle_all_checks(self):
         is_checked = self.header_check_var.get()
-        for row_widgets in self.input_rows:
-            # Only toggle if the row is currently visible (packed)
-            if row_widgets['frame'].winfo_ismapped():
-                row_widgets['check_var'].set(is_checked)
+        # Only toggle rows that pass the current filter
+        for index in self.input_grid.view:
+            self.input_rows[index]['check'] = is_checked
+            self.live_totals.update(self.input_rows[index])
+        self.input_grid.refresh()
+        self.live_label_debouncer.schedule()
+
+    def _make_row(self, data=None):
+        data = data or {}
+        def text(key):
+            value = data.get(key)
+            return "" if value is None else str(value)
+
+        return PoomsaeInputRow(**{'event': text("종목"), 'division': text("참가부"), 'class': text("세부부별"),
+                                  'gender': text("성별"), 'count': text("인원수")})
 
     def add_input_row(self, data=None):
-        row_frame = tk.Frame(self.rows_container)
-        row_frame.pack(fill='x', pady=2, anchor='w')
-
-        check_var = tk.IntVar()
-        check = tk.Checkbutton(row_frame, variable=check_var)
-        check.pack(side="left", padx=2)
-
-        event_var = tk.StringVar()
-        event_entry = tk.Entry(row_frame, width=18, textvariable=event_var)
-        event_entry.pack(side="left", padx=2)
-        event_var.trace_add("write", lambda name, index, mode, entry=event_entry: self._update_event_color(entry))
-
-        division_var = tk.StringVar()
-        division_entry = tk.Entry(row_frame, width=18, textvariable=division_var)
-        division_entry.pack(side="left", padx=2)
-        division_var.trace_add("write", lambda name, index, mode, entry=division_entry: self._update_division_color(entry))
-
-        category_entry = tk.Entry(row_frame, width=15)
-        category_entry.pack(side="left", padx=2)
-
-        gender_entry = tk.Entry(row_frame, width=10)
-        gender_entry.pack(side="left", padx=2)
-
-        count_var = tk.StringVar()
-        count_entry = tk.Entry(row_frame, width=10, textvariable=count_var)
-        count_entry.pack(side="left", padx=2)
-        count_var.trace_add("write", lambda name, index, mode, event_entry=event_entry, count_entry=count_entry: self._update_headcount_color(event_entry, count_entry))
-        
-        # Bind Tab key to move focus to the next game count entry
-        count_entry.bind("<Tab>", self.focus_next_game_count)
-        # Bind Shift-Tab for reverse navigation
-        count_entry.bind("<Shift-Tab>", self.focus_prev_game_count)
-
-        delete_button = tk.Button(row_frame, text="-", command=lambda: self.remove_input_row(row_widgets))
-        delete_button.pack(side="left", padx=2)
-
-        row_widgets = {
-            'frame': row_frame, 'check_var': check_var, 'event': event_entry, 
-            'division': division_entry, 'class': category_entry, 'gender': gender_entry, 'count': count_entry
-        }
-        self.input_rows.append(row_widgets)
-
-        if data:
-            event_entry.insert(0, data.get("종목", ""))
-            division_entry.insert(0, data.get("참가부", ""))
-            category_entry.insert(0, data.get("세부부별", ""))
-            gender_entry.insert(0, data.get("성별", ""))
-            count_entry.insert(0, str(data.get("인원수", "")))
-        self._apply_filters()
-
-    def _update_headcount_color(self, event_entry, count_entry):
-        event_text = event_entry.get()
-        count_text = count_entry.get()
-
+        row = self._make_row(data)
+        self.input_grid.append_row(row)
+        self.live_totals.update(row)
+        self.live_label_debouncer.schedule()
+
+    def _cell_style(self, row, key):
+        if key == 'event':
+            return {"bg": EVENT_COLORS.get(row['event'], "white")}
+        if key == 'division':
+            return {"bg": DIVISION_COLORS.get(row['division'], "white")}
+        if key == 'count':
+            return self._headcount_style(row['event'], row['count'])
+        return None
+
+    def _headcount_style(self, event_text, count_text):
         try:
             original_headcount = int(count_text)
         except ValueError:
-            count_entry.config(bg="white", fg="black")
-            return
+            return {"bg": "white", "fg": "black"}
 
         calculated_headcount = original_headcount
 
@@ -568,62 +618,14 @@ class PoomsaeTab(ttk.Frame):
             calculated_headcount = original_headcount / 5
 
         if calculated_headcount < 4 and original_headcount > 0:
-            count_entry.config(bg="red", fg="white")
-        else:
-            count_entry.config(bg="white", fg="black")
-
-    def _update_event_color(self, entry):
-        event_text = entry.get()
-        color_map = {
-            "개인전": "#E0FFFF", # Light Cyan
-            "복식전": "#F08080", # Light Coral
-            "단체전": "#FAFAD2", # Light Goldenrod Yellow
-            "개인전(자유품새)": "#98FB98", # Pale Green
-            "복식전(자유품새)": "#FFA07A", # Light Salmon
-            "단체전(자유품새)": "#B0C4DE"  # Light Steel Blue
-        }
-        entry.config(bg=color_map.get(event_text, "white"))
-        # Also update headcount color when event changes
-        for row_widgets in self.input_rows:
-            if row_widgets['event'] == entry:
-                self._update_headcount_color(row_widgets['event'], row_widgets['count'])
-                break
-
-    def _update_division_color(self, entry):
-        division_text = entry.get()
-        color_map = {
-            "초등부": "#ADD8E6", # Light Blue
-            "중등부": "#90EE90", # Light Green
-            "고등부": "#FFFFE0", # Light Yellow
-            "대학부": "#FFDAB9", # Peach Puff
-            "일반부": "#E6E6FA"  # Lavender
-        }
-        entry.config(bg=color_map.get(division_text, "white"))
-
-    def focus_next_game_count(self, event):
-        current_entry = event.widget
-        for i, row_widgets in enumerate(self.input_rows):
-            if row_widgets['count'] == current_entry:
-                next_index = (i + 1) % len(self.input_rows)
-                self.input_rows[next_index]['count'].focus_set()
-                self.input_rows[next_index]['count'].selection_range(0, tk.END) # Select all text
-                return "break" # Prevent default tab behavior
-        return "continue" # Allow default tab behavior if not found
-
-    def focus_prev_game_count(self, event):
-        current_entry = event.widget
-        for i, row_widgets in enumerate(self.input_rows):
-            if row_widgets['count'] == current_entry:
-                prev_index = (i - 1 + len(self.input_rows)) % len(self.input_rows)
-                self.input_rows[prev_index]['count'].focus_set()
-                self.input_rows[prev_index]['count'].selection_range(0, tk.END) # Select all text
-                return "break" # Prevent default tab behavior
-        return "continue" # Allow default tab behavior if not found
-
-    def remove_input_row(self, row_widgets):
+            return {"bg": "red", "fg": "white"}
+        return {"bg": "white", "fg": "black"}
+
+    def remove_input_row(self, index):
         if len(self.input_rows) > 1:
-            row_widgets['frame'].destroy()
-            self.input_rows.remove(row_widgets)
+            self.live_totals.remove(self.input_rows[index])
+            self.input_grid.delete_row(index)
+            self.live_label_debouncer.schedule()
         else:
             messagebox.showwarning("삭제 불가", "마지막 행은 삭제할 수 없습니다.", parent=self)
 
@@ -636,25 +638,22 @@ class PoomsaeTab(ttk.Frame):
         if not file_path:
             return
 
-        try:
-            workbook = openpyxl.load_workbook(file_path)
-            sheet = workbook.active
-
-            for i in range(len(self.input_rows) - 1, -1, -1):
-                self.input_rows[i]['frame'].destroy()
-                self.input_rows.pop(i)
-
-            for row in sheet.iter_rows(min_row=2, values_only=True):
+        rows = []
+        def on_batch(batch):
+            for row in batch:
                 if all(cell is None or str(cell).strip() == "" for cell in row):
                     continue
                 data = {"종목": row[0], "참가부": row[1], "세부부별": row[2], "성별": row[3], "인원수": row[4]}
-                self.add_input_row(data)
-            
+                rows.append(self._make_row(data))
+
+        def on_done():
+            self.input_grid.set_rows(rows)
+            self._reset_live_totals()
             if not self.input_rows: 
                 self.add_input_row()
 
-        except Exception as e:
-            messagebox.showerror("가져오기 실패", f"엑셀 파일을 읽는 중 오류가 발생했습니다:\n{e}", parent=self)
+        # Rows are read on a worker thread; errors are reported by the dialog
+        ExcelImportDialog(self, file_path, on_batch, on_done, phase="품새 / 엑셀 가져오기")
 
     def download_excel_template(self):
         download_template_file(TEMPLATE_PATH, "품새_경기시간_계산_양식.xlsx", [("Excel files", "*.xlsx"), ("All files", "*.* ")])
@@ -738,8 +737,8 @@ class PoomsaeTab(ttk.Frame):
 
     def _save_logic(self, settings_to_save):
         try:
-            with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(settings_to_save, f, ensure_ascii=False, indent=4)
+            settings_store.save(settings_to_save)
+            self._reset_live_totals() # 경기 시간 설정이 바뀌면 모든 행의 기여분이 바뀜
             return True
         except Exception as e:
             messagebox.showerror("저장 실패", f"설정을 저장하는 중 오류가 발생했습니다:\n{e}", parent=self)
@@ -755,11 +754,7 @@ class PoomsaeTab(ttk.Frame):
             window.destroy()
 
     def load_settings(self):
-        try:
-            with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                settings_to_load = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            settings_to_load = DEFAULT_SETTINGS
+        settings_to_load = settings_store.load()
 
         for cat in ["초등부", "중등부", "고등부", "대학부", "일반부"]:
             self.entries[f'individual_{cat}'].set(settings_to_load.get('individual', {}).get(cat, ''))
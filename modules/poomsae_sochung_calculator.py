@@ -4,6 +4,7 @@ import math
 from decimal import Decimal, getcontext, ROUND_HALF_UP
 from common.version import __version__ as app_version
 from common.version import __build_date__ as app_date
+from utils.profiler import profiled
 
 class PoomsaeSochungCalculator(tk.Toplevel):
     def __init__(self, master):
@@ -341,6 +342,7 @@ class PoomsaeSochungCalculator(tk.Toplevel):
             self.description_label.config(text="* 태권소프트 방식 점수 계산\n   - 태권소프트는 항목평점 및 평점 계산 할 때 아래 식에 따릅니다.\n   - 각 품새 평점 : 소수점 3자리에서 반올림.\n   - 총 평점 : 소수점 4자리에서 반올림.\n   - 총점 : 소수점 3자리에서 반올림.  \n * 동점 처리 \n   - 1) 표현력 > 2) 정확성 > 3) 총점")
         self.calculate_all_scores()
 
+    @profiled("품새 소청 / 점수 계산")
     def calculate_all_scores(self):
         # Reset all entry backgrounds to white before calculation
         for poomsae_key in ["poomsae1", "poomsae2"]:
@@ -0,0 +1,102 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+from datetime import timedelta
+
+from utils.court_allocator import AllocationJob, allocate_courts
+from utils.game_time_engine import format_time
+
+# 코트 배정 창. 참가부 또는 체급(종목) 단위로 묶음을 코트에 배정하고,
+# 특정 묶음을 원하는 코트에 고정한 뒤 다시 배정할 수 있다.
+
+
+class CourtAllocationDialog(tk.Toplevel):
+    def __init__(self, master, items, court_count, start_time, unit_labels=("참가부", "체급")):
+        # items: (묶음 이름, 세부 이름, 소요 시간(초)) 목록. 예: ("남중부", "-45kg", 3600)
+        super().__init__(master)
+        self.title("코트 배정")
+        self.geometry("560x520")
+        self.transient(master)
+
+        self.items = items
+        self.court_count = court_count
+        self.start_time = start_time
+        self.locks = {} # (단위, 이름) -> 고정 코트 (0 부터)
+        self.jobs = []
+        self.row_names = {} # 표 항목 iid -> 묶음 이름. 빈 이름("")은 Treeview 루트 id 라 iid 로 쓰지 않는다
+
+        unit_frame = tk.Frame(self)
+        unit_frame.pack(fill='x', padx=10, pady=(10, 0))
+        tk.Label(unit_frame, text="배정 단위:").pack(side="left")
+        self.unit_var = tk.StringVar(value="group")
+        for value, label in zip(("group", "item"), unit_labels):
+            tk.Radiobutton(unit_frame, text=label, variable=self.unit_var, value=value, command=self.allocate).pack(side="left", padx=5)
+
+        tree_frame = tk.Frame(self)
+        tree_frame.pack(expand=True, fill="both", padx=10, pady=10)
+        self.tree = ttk.Treeview(tree_frame, columns=("코트", "구분", "소요시간", "고정"), show="headings", selectmode="extended")
+        for col, width in (("코트", 60), ("구분", 220), ("소요시간", 140), ("고정", 50)):
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=width, anchor="center" if col != "구분" else "w")
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side="left", expand=True, fill="both")
+        scrollbar.pack(side="right", fill="y")
+
+        lock_frame = tk.Frame(self)
+        lock_frame.pack(fill='x', padx=10)
+        self.court_combo = ttk.Combobox(lock_frame, values=[f"{c + 1}코트" for c in range(court_count)], width=8, state="readonly")
+        self.court_combo.current(0)
+        self.court_combo.pack(side="left")
+        tk.Button(lock_frame, text="선택 항목 코트 고정", command=self.lock_selected).pack(side="left", padx=5)
+        tk.Button(lock_frame, text="고정 해제", command=self.unlock_selected).pack(side="left")
+
+        self.summary_label = tk.Label(self, justify="left", anchor="w")
+        self.summary_label.pack(fill='x', padx=10, pady=10)
+
+        self.allocate()
+
+    def _build_jobs(self):
+        unit = self.unit_var.get()
+        totals = {}
+        for group, name, seconds in self.items:
+            key = group if unit == "group" else f"{group} {name}".strip()
+            totals[key] = totals.get(key, 0) + max(0, seconds)
+        return [AllocationJob(name, seconds, self.locks.get((unit, name))) for name, seconds in totals.items()]
+
+    def allocate(self):
+        self.jobs = self._build_jobs()
+        try:
+            allocation = allocate_courts(self.jobs, self.court_count)
+        except ValueError as e:
+            messagebox.showerror("배정 오류", str(e), parent=self)
+            return
+
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self.row_names = {}
+        for court, indexes in enumerate(allocation.court_jobs):
+            for index in indexes:
+                job = self.jobs[index]
+                iid = self.tree.insert("", "end", values=(f"{court + 1}코트", job.name, format_time(job.seconds),
+                                                          "고정" if job.locked_court is not None else ""))
+                self.row_names[iid] = job.name
+
+        lines = []
+        for court, seconds in enumerate(allocation.court_seconds):
+            end = self.start_time + timedelta(seconds=seconds)
+            lines.append(f"  {court + 1}코트: {format_time(seconds)} ({end.strftime('%H:%M')} 종료)")
+        gap = (allocation.makespan / allocation.lower_bound - 1) * 100 if allocation.lower_bound else 0
+        lines.append(f"가장 늦은 코트: {format_time(allocation.makespan)} / 이론상 최소: {format_time(allocation.lower_bound)} (차이 {gap:.1f}%)")
+        self.summary_label.config(text="\n".join(lines))
+
+    def lock_selected(self):
+        court = self.court_combo.current()
+        for iid in self.tree.selection():
+            self.locks[(self.unit_var.get(), self.row_names[iid])] = court
+        self.allocate()
+
+    def unlock_selected(self):
+        for iid in self.tree.selection():
+            self.locks.pop((self.unit_var.get(), self.row_names[iid]), None)
+        self.allocate()
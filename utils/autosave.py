@@ -0,0 +1,98 @@
+import threading
+
+# 입력 표(VirtualGrid) 자동 저장. 일정 간격으로 표의 변경 번호(grid.version)를 보고
+# 바뀐 경우에만 행 값을 떠서(메인 스레드) 작업 스레드에서 세션 파일에 쓴다.
+# 쓰는 중에 다시 바뀌면 가장 최근 상태 하나만 이어서 쓴다.
+# 표가 없어질 때(창 닫기)는 남은 변경을 바로 써서 마지막 입력을 잃지 않는다.
+
+AUTOSAVE_INTERVAL_MS = 5000
+
+
+class RowAutosave:
+    def __init__(self, grid, store, interval_ms=AUTOSAVE_INTERVAL_MS):
+        self.grid = grid
+        self.store = store # common.session_store.SessionStore
+        self.interval_ms = interval_ms
+        self.saved_version = grid.version
+        self.error = None # 마지막 저장 오류 (다음 변경 때 다시 시도)
+        self._lock = threading.Lock()
+        self._pending = None # 작업 스레드가 쓸 행 값 목록
+        self._writing = False
+        self._file_lock = threading.Lock()
+        self._written_version = None # 파일에 마지막으로 쓴 변경 번호
+        self._job = grid.after(interval_ms, self._tick)
+        grid.bind("<Destroy>", self._on_destroy, "+")
+
+    def restore(self):
+        # 지난 세션이 있으면 표에 채우고 True
+        rows = self.store.load()
+        if not rows:
+            return False
+        self.grid.set_rows(rows)
+        self.saved_version = self.grid.version
+        return True
+
+    def _snapshot(self):
+        # (변경 번호, 행 값 목록). 마지막으로 뜬 뒤 바뀐 게 없으면 None
+        if self.grid.version == self.saved_version:
+            return None
+        self.saved_version = self.grid.version
+        return self.grid.version, [row.values() for row in self.grid.rows]
+
+    def _tick(self):
+        self.save_in_background()
+        self._job = self.grid.after(self.interval_ms, self._tick)
+
+    def save_in_background(self):
+        snapshot = self._snapshot()
+        if snapshot is None:
+            return
+        with self._lock:
+            self._pending = snapshot
+            if self._writing:
+                return # 쓰고 있는 스레드가 이어서 쓴다
+            self._writing = True
+        threading.Thread(target=self._write_pending, daemon=True).start()
+
+    def _write_pending(self):
+        while True:
+            with self._lock:
+                snapshot, self._pending = self._pending, None
+                if snapshot is None:
+                    self._writing = False
+                    return
+            try:
+                self._write(snapshot)
+                self.error = None
+            except OSError as e:
+                self.error = e
+                self.saved_version = None # 다음 확인 때 다시 저장
+
+    def _write(self, snapshot):
+        # 파일 쓰기는 한 번에 하나씩, 이미 쓴 것보다 오래된 상태는 쓰지 않는다
+        version, values = snapshot
+        with self._file_lock:
+            if self._written_version is not None and version <= self._written_version:
+                return
+            self.store.save(values)
+            self._written_version = version
+
+    def save_now(self):
+        # 최신 상태를 바로 쓴다. 작업 스레드가 쓰는 중이면 그 뒤에 쓴다
+        snapshot = self._snapshot()
+        with self._lock:
+            pending, self._pending = self._pending, None
+        snapshot = snapshot or pending
+        if snapshot is not None:
+            self._write(snapshot)
+
+    def _on_destroy(self, event):
+        if event.widget is not self.grid:
+            return
+        if self._job is not None:
+            self.grid.after_cancel(self._job)
+            self._job = None
+        try:
+            self.save_now()
+        except OSError as e:
+            self.error = e
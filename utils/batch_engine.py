@@ -0,0 +1,175 @@
+from collections import namedtuple
+
+import numpy as np
+
+from utils.bracket_engine import round_label_to_size
+from utils.game_time_engine import DEFAULT_KYORUGI_SECONDS, FREESTYLE_SETTING_KEYS, POOMSAE_DIVISIONS, POOMSAE_EVENT_TYPES
+
+# 대회 전체(수만 개 체급)를 NumPy 배열로 한 번에 계산하는 일괄 처리 모드.
+# 행 단위 결과는 utils.bracket_engine / utils.game_time_engine 과 같다.
+
+KyorugiArrays = namedtuple("KyorugiArrays", ["headcount", "division_code", "divisions", "seconds_per_match", "start_size", "end_size"])
+
+PoomsaeArrays = namedtuple("PoomsaeArrays", ["headcount", "is_freestyle", "event_type_code", "division_code", "seconds_per_game"])
+
+
+def _encode(values, codes):
+    # 문자열 값을 정수 코드로 변환 (처음 나온 순서대로 번호 부여)
+    result = np.empty(len(values), dtype=np.int32)
+    for i, value in enumerate(values):
+        if value not in codes:
+            codes[value] = len(codes)
+        result[i] = codes[value]
+    return result
+
+
+def bracket_sizes(headcount):
+    # headcount 이상인 가장 작은 2의 거듭제곱 (최소 2)
+    headcount = np.asarray(headcount, dtype=np.int64)
+    _, exponent = np.frexp(np.maximum(headcount - 1, 1))
+    return np.left_shift(np.int64(1), exponent.astype(np.int64))
+
+
+def bye_counts(headcount):
+    headcount = np.asarray(headcount, dtype=np.int64)
+    return np.where(headcount >= 2, bracket_sizes(headcount) - headcount, 0)
+
+
+def round_matches(headcount):
+    # (행 수, 라운드 수) 배열. k 번째 열은 2^(k+1)강의 경기 수
+    headcount = np.asarray(headcount, dtype=np.int64)
+    sizes = bracket_sizes(headcount)
+    max_exponent = int(np.log2(sizes.max())) if sizes.size else 1
+    round_sizes = np.left_shift(np.int64(1), np.arange(1, max_exponent + 1, dtype=np.int64))
+
+    matches = np.where(round_sizes[None, :] < sizes[:, None], round_sizes[None, :] // 2, 0)
+    first_round = round_sizes[None, :] == sizes[:, None]
+    matches = np.where(first_round, (headcount - sizes // 2)[:, None], matches)
+    matches[headcount < 2] = 0
+    return round_sizes, matches
+
+
+def range_matches(headcount, start_size, end_size):
+    # 시작 강수 ~ 종료 강수 사이 경기 수 (matches_in_round_range 의 배열 버전)
+    start_size = np.asarray(start_size, dtype=np.int64)
+    end_size = np.asarray(end_size, dtype=np.int64)
+    start_size = np.maximum(start_size, end_size)
+
+    round_sizes, matches = round_matches(headcount)
+    in_range = (round_sizes[None, :] <= start_size[:, None]) & (round_sizes[None, :] >= end_size[:, None])
+    return np.where(in_range, matches, 0).sum(axis=1)
+
+
+def kyorugi_arrays(records, settings):
+    # records: (참가부, 체급, 인원수, 시작강수, 종료강수)
+    records = [record for record in records if record[0]]
+    division_codes = {}
+    division_code = _encode([record[0] for record in records], division_codes)
+    divisions = list(division_codes)
+    seconds_by_division = np.array([int(settings.get(division, DEFAULT_KYORUGI_SECONDS)) for division in divisions], dtype=np.int64)
+
+    return KyorugiArrays(
+        headcount=np.array([int(record[2] or 0) for record in records], dtype=np.int64),
+        division_code=division_code,
+        divisions=divisions,
+        seconds_per_match=seconds_by_division[division_code] if divisions else np.zeros(0, dtype=np.int64),
+        start_size=np.array([round_label_to_size(record[3]) for record in records], dtype=np.int64),
+        end_size=np.array([round_label_to_size(record[4]) for record in records], dtype=np.int64),
+    )
+
+
+def kyorugi_totals(arrays, seconds_per_match=None):
+    # seconds_per_match 를 넘기면 설정값 대신 그 값으로 다시 계산 (what-if 비교용)
+    if seconds_per_match is None:
+        seconds_per_match = arrays.seconds_per_match
+
+    matches = range_matches(arrays.headcount, arrays.start_size, arrays.end_size)
+    seconds = matches * np.asarray(seconds_per_match, dtype=np.int64)
+    counted = arrays.headcount != 0
+    division_count = len(arrays.divisions)
+
+    return {
+        "matches": matches,
+        "seconds": seconds,
+        "total_seconds": int(seconds[counted].sum()),
+        "division_seconds": np.bincount(arrays.division_code[counted], weights=seconds[counted], minlength=division_count),
+        "division_games": np.bincount(arrays.division_code[counted], weights=matches[counted], minlength=division_count),
+    }
+
+
+def poomsae_arrays(records, settings):
+    # records: (종목, 참가부, 인원수). 예: ("개인전(자유품새)", "초등부", 24)
+    headcount = np.empty(len(records), dtype=np.int64)
+    is_freestyle = np.empty(len(records), dtype=bool)
+    event_type_code = np.empty(len(records), dtype=np.int32)
+    division_code = np.empty(len(records), dtype=np.int32)
+    seconds_per_game = np.empty(len(records), dtype=np.int64)
+
+    for i, (event, division, count) in enumerate(records):
+        event = event or ""
+        event_type = event.replace("(자유품새)", "").strip()
+        if event_type not in POOMSAE_EVENT_TYPES:
+            raise ValueError(f"알 수 없는 종목입니다: {event}")
+        if division not in POOMSAE_DIVISIONS:
+            raise ValueError(f"참가부 입력이 잘못되었습니다. {', '.join(POOMSAE_DIVISIONS)} 중 하나여야 합니다.\n잘못된 값: {division}")
+
+        headcount[i] = int(count or 0)
+        is_freestyle[i] = "자유품새" in event
+        event_type_code[i] = POOMSAE_EVENT_TYPES.index(event_type)
+        division_code[i] = POOMSAE_DIVISIONS.index(division)
+        if is_freestyle[i]:
+            seconds_per_game[i] = int(settings['freestyle'].get(FREESTYLE_SETTING_KEYS[event_type], 0))
+        elif event_type == "개인전":
+            seconds_per_game[i] = int(settings['individual'].get(division, 0))
+        else:
+            seconds_per_game[i] = int(settings['team'].get(division, 0))
+
+    return PoomsaeArrays(headcount, is_freestyle, event_type_code, division_code, seconds_per_game)
+
+
+def poomsae_games(arrays, prelim=True, main=True, final=True):
+    # PoomsaeTab.calculate_time 의 인원수 보정 규칙을 배열로 계산
+    h = arrays.headcount.astype(np.float64)
+    individual = arrays.event_type_code == 0
+    doubles = arrays.event_type_code == 1
+    team = arrays.event_type_code == 2
+
+    gongin = np.select([individual, doubles, team], [h - 1, h / 2 - 1, h / 3 - 1])
+
+    # 자유품새 개인전: 예선 조 수는 조당 11.5명 이하가 되는 가장 작은 짝수
+    num_groups = np.maximum(2, 2 * np.ceil(h / 23))
+    first_group_size = np.ceil(h / num_groups)
+    main_round = np.ceil(first_group_size / 2) * num_groups
+    large = h * prelim + main_round * main + 8 * final
+    medium = h * main + 8 * final
+    if final and not (prelim or main):
+        small = np.full_like(h, 8)
+    elif final:
+        small = h + 8
+    elif prelim or main:
+        small = h.copy()
+    else:
+        small = np.zeros_like(h)
+    freestyle_individual = np.select([h >= 22, (h >= 12) & (h <= 21), h <= 11], [large, medium, small], h)
+    freestyle = np.select([individual, doubles, team], [freestyle_individual, h / 2, h / 5])
+
+    return np.where(arrays.is_freestyle, freestyle, gongin)
+
+
+def poomsae_totals(arrays, prelim=True, main=True, final=True, seconds_per_game=None):
+    if seconds_per_game is None:
+        seconds_per_game = arrays.seconds_per_game
+
+    games = poomsae_games(arrays, prelim, main, final)
+    seconds = games * np.asarray(seconds_per_game, dtype=np.float64)
+    # 공인(0)/자유(1) x 개인/복식/단체 소계
+    bucket = arrays.is_freestyle.astype(np.int32) * 3 + arrays.event_type_code
+
+    return {
+        "games": games,
+        "seconds": seconds,
+        "gongin_seconds": float(seconds[~arrays.is_freestyle].sum()),
+        "freestyle_seconds": float(seconds[arrays.is_freestyle].sum()),
+        "sub_total_seconds": np.bincount(bucket, weights=seconds, minlength=6).reshape(2, 3),
+        "sub_total_games": np.bincount(bucket, weights=games, minlength=6).reshape(2, 3),
+    }
@@ -0,0 +1,251 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+from utils.bracket_engine import FREESTYLE_EVENT, default_round_range, plan_tournament, result_rows, sequence_games_across_courts
+from utils.court_scheduler import simulate_courts
+from utils.excel_import import iter_row_batches
+from utils.game_time_engine import (FREESTYLE, GONGIN, POOMSAE_EVENT_TYPES, kyorugi_division_spans, kyorugi_row, kyorugi_schedule_categories,
+                                    poomsae_row, poomsae_schedule_categories, summarize_kyorugi, summarize_poomsae)
+from utils.result_export import export_rows
+
+# Tk 없이 엑셀 입력 파일 하나를 계산하고 결과 통합문서를 만드는 함수 모음 (명령행 일괄 처리용).
+# 입력 해석 규칙은 각 화면의 엑셀 가져오기 + 계산하기 버튼과 같다.
+
+NUMBER_HEADERS = ["번호", "종목", "부", "체급", "강수", "경기번호", "경기수"]
+KYORUGI_HEADERS = ["참가부", "체급", "인원수", "시작강수", "종료강수", "경기수", "경기시간(초)", "소요시간(초)"]
+POOMSAE_HEADERS = ["종목", "참가부", "세부부별", "성별", "인원수", "게임수", "경기시간(초)", "소요시간(초)"]
+
+
+def _text(value):
+    return "" if value is None else str(value)
+
+
+def _is_blank(row):
+    return all(cell is None or str(cell).strip() == "" for cell in row)
+
+
+def _cell(row, index):
+    return row[index] if index < len(row) else None
+
+
+def read_entry_rows(file_path):
+    # 헤더(첫 행)를 제외한 값 튜플 목록
+    rows = []
+    for _, batch in iter_row_batches(file_path):
+        rows.extend(batch)
+    return rows
+
+
+def end_time_text(start_time, seconds):
+    start = datetime.strptime(start_time, "%H:%M")
+    end = start + timedelta(seconds=seconds)
+    text = end.strftime("%H:%M")
+    if end.day != start.day:
+        text += " (+1)"
+    return text
+
+
+# ---------- 경기번호 ----------
+
+def number_records(rows):
+    # (종목, 부, 체급, 참가인원) 열. 참가인원이 비었거나 정수가 아니면 건너뜀
+    records = []
+    for row in rows:
+        participants_str = _text(_cell(row, 3))
+        if not participants_str.strip():
+            continue
+        try:
+            participants = int(participants_str)
+        except ValueError:
+            continue
+        records.append((_text(_cell(row, 0)), _text(_cell(row, 1)), _text(_cell(row, 2)), participants))
+    return records
+
+
+def plan_number_rows(rows, court_count=None):
+    # 결과 표와 같은 (번호, 종목, 부, 체급, 강수, 경기번호, 경기수) 목록
+    # court_count 를 주면 경기번호를 코트별 통합 번호로 매긴다
+    plans = plan_tournament(number_records(rows))
+    sequence = sequence_games_across_courts(plans, court_count) if court_count else None
+    return [(number,) + row.values for number, row in enumerate(result_rows(plans, sequence), start=1)]
+
+
+def plan_number_file(file_path, court_count=None):
+    return plan_number_rows(read_entry_rows(file_path), court_count)
+
+
+def write_number_workbook(result, output_path):
+    # 확장자에 따라 .xlsx / .csv / .parquet
+    export_rows(output_path, NUMBER_HEADERS, result, "경기 결과")
+
+
+def number_match_count(result):
+    # 토너먼트 경기 수. 자유품새 행의 마지막 열은 경기 수가 아니라 조 인원이므로 뺀다
+    return sum(values[-1] for values in result if values[1] != FREESTYLE_EVENT)
+
+
+def write_merged_number_workbook(file_results, output_path):
+    # file_results: map_in_processes(plan_number_file, ...) 결과. 입력 순서 그대로 한 통합문서에 모은다
+    import openpyxl # 작업 프로세스마다 읽지 않도록 통합문서를 쓸 때만 가져온다
+
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("경기 결과")
+    sheet.append(["파일"] + NUMBER_HEADERS)
+    report = workbook.create_sheet("파일별 결과")
+    report.append(["파일", "상태", "라운드 수", "경기수", "오류"])
+
+    for file_path, result, error in file_results:
+        name = os.path.basename(file_path)
+        if error is not None:
+            report.append([name, "실패", None, None, error])
+            continue
+        for values in result:
+            sheet.append((name,) + tuple(values))
+        report.append([name, "완료", len(result), number_match_count(result), None])
+    workbook.save(output_path)
+
+
+# ---------- 겨루기 경기시간 ----------
+
+def kyorugi_entries(rows):
+    # (참가부, 체급, 인원수, 시작강수, 종료강수) 열. 빈 행과 참가부가 없는 행은 건너뜀
+    entries = []
+    for row in rows:
+        if _is_blank(row):
+            continue
+        division = _text(_cell(row, 0))
+        if not division:
+            continue
+        count = _text(_cell(row, 2))
+        try:
+            headcount = int(count or 0)
+        except ValueError:
+            raise ValueError(f"인원수 입력이 잘못되었습니다. 참가부: {division}, 체급: {_text(_cell(row, 1))}, 인원수: {count}")
+        start_round, end_round = default_round_range(headcount, _cell(row, 3), _cell(row, 4))
+        entries.append((division, _text(_cell(row, 1)), headcount, start_round, end_round))
+    return entries
+
+
+def plan_kyorugi(entries, settings):
+    return summarize_kyorugi([kyorugi_row(division, weight_class, headcount, start_round, end_round, settings)
+                              for division, weight_class, headcount, start_round, end_round in entries])
+
+
+def kyorugi_schedule(summary, court_count):
+    # 겨루기 탭 계산하기와 같이 경기를 코트에 실제로 배정해서 종료 시각 계산
+    return simulate_courts(kyorugi_schedule_categories(summary.rows), court_count)
+
+
+def write_kyorugi_workbook(entries, summary, schedule, output_path, court_count, start_time):
+    # schedule: kyorugi_schedule(summary, court_count)
+    import openpyxl
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "체급별"
+    sheet.append(KYORUGI_HEADERS)
+    for (division, weight_class, headcount, start_round, end_round), row in zip(entries, summary.rows):
+        sheet.append([division, weight_class, headcount, start_round, end_round, row.matches, row.seconds_per_match, row.total_seconds])
+
+    summary_sheet = workbook.create_sheet("요약")
+    summary_sheet.append(["코트 수", court_count])
+    summary_sheet.append(["총 소요시간(초)", summary.total_seconds])
+    summary_sheet.append(["코트 적용 소요시간(초)", schedule.finish_seconds])
+    summary_sheet.append(["시작 시간", start_time])
+    summary_sheet.append(["예상 종료 시간", end_time_text(start_time, schedule.finish_seconds)])
+    summary_sheet.append([])
+    summary_sheet.append(["참가부", "게임수", "소요시간(초)", "코트 적용 소요시간(초)", "경기시간 설정(초)"])
+    spans = kyorugi_division_spans(summary.rows, schedule)
+    for division, data in summary.division_data.items():
+        summary_sheet.append([division, data["total_games"], data["total_seconds"], spans.get(division, 0),
+                              summary.applied_settings.get(division)])
+    workbook.save(output_path)
+
+
+# ---------- 품새 경기시간 ----------
+
+def poomsae_entries(rows):
+    # (종목, 참가부, 세부부별, 성별, 인원수) 열. 빈 행은 건너뜀
+    entries = []
+    for row in rows:
+        if _is_blank(row):
+            continue
+        event, division, category, gender, count = (_text(_cell(row, i)) for i in range(5))
+        try:
+            headcount = int(count or 0)
+        except ValueError:
+            raise ValueError(f"인원수 입력이 잘못되었습니다. 종목: {event}, 참가부: {division}, 인원수: {count}")
+        entries.append((event, division, category, gender, headcount))
+    return entries
+
+
+def plan_poomsae(entries, settings, prelim=True, main=True, final=True):
+    return summarize_poomsae([poomsae_row(event, division, headcount, settings, prelim, main, final)
+                              for event, division, _, _, headcount in entries])
+
+
+def poomsae_schedules(summary, gongin_courts, freestyle_courts, freestyle_simultaneous=False):
+    # 품새 탭 계산하기와 같은 (공인품새, 자유품새) 코트 시뮬레이션. 자유품새는 동시진행일 때만 여러 코트에 배정
+    gongin_schedule = simulate_courts(poomsae_schedule_categories([r for r in summary.rows if r.poomsae_type == GONGIN]), gongin_courts)
+    freestyle_schedule = simulate_courts(poomsae_schedule_categories([r for r in summary.rows if r.poomsae_type == FREESTYLE]),
+                                         freestyle_courts if freestyle_simultaneous else 1)
+    return gongin_schedule, freestyle_schedule
+
+
+def write_poomsae_workbook(entries, summary, schedules, output_path, gongin_courts, freestyle_courts, freestyle_simultaneous, start_time):
+    # schedules: poomsae_schedules(...). 자유품새는 공인품새가 끝난 뒤 진행
+    import openpyxl
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "종목별"
+    sheet.append(POOMSAE_HEADERS)
+    for entry, row in zip(entries, summary.rows):
+        sheet.append(list(entry) + [row.games, row.seconds_per_game, row.total_seconds])
+
+    gongin_seconds, freestyle_seconds = (schedule.finish_seconds for schedule in schedules)
+    summary_sheet = workbook.create_sheet("요약")
+    summary_sheet.append(["공인품새 코트 수", gongin_courts])
+    summary_sheet.append(["자유품새 코트 수", freestyle_courts])
+    summary_sheet.append(["자유품새 동시진행", "적용" if freestyle_simultaneous else "미적용"])
+    summary_sheet.append(["공인품새 코트 적용 소요시간(초)", gongin_seconds])
+    summary_sheet.append(["자유품새 코트 적용 소요시간(초)", freestyle_seconds])
+    summary_sheet.append(["시작 시간", start_time])
+    summary_sheet.append(["예상 종료 시간", end_time_text(start_time, gongin_seconds + freestyle_seconds)])
+    summary_sheet.append([])
+    summary_sheet.append(["구분", "종목", "게임수", "소요시간(초)"])
+    for poomsae_type in (GONGIN, FREESTYLE):
+        for event_type in POOMSAE_EVENT_TYPES:
+            data = summary.sub_totals[poomsae_type][event_type]
+            summary_sheet.append([poomsae_type, event_type, data["games"], data["time"]])
+    workbook.save(output_path)
+
+
+def list_entry_workbooks(path):
+    # 폴더면 안의 .xlsx 파일 (엑셀 임시 파일 제외, 이름순), 파일이면 그 파일 하나
+    if not os.path.isdir(path):
+        return [path]
+    names = sorted(name for name in os.listdir(path) if name.lower().endswith(".xlsx") and not name.startswith("~$"))
+    return [os.path.join(path, name) for name in names]
+
+
+def map_in_processes(function, items, max_workers=None):
+    # 항목마다 function(item) 을 여러 프로세스에서 실행하고 (항목, 결과, 오류 메시지)를 입력 순서대로 돌려준다.
+    # 한 항목이 실패해도 나머지는 계속 처리한다. function 은 모듈 최상위 함수(또는 그 partial)여야 한다.
+    items = list(items)
+    if max_workers == 1 or len(items) <= 1:
+        for item in items:
+            try:
+                yield item, function(item), None
+            except Exception as e:
+                yield item, None, str(e) or type(e).__name__
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(function, item) for item in items]
+        for item, future in zip(items, futures):
+            try:
+                yield item, future.result(), None
+            except Exception as e:
+                yield item, None, str(e) or type(e).__name__
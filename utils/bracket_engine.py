@@ -0,0 +1,232 @@
+from collections import namedtuple
+
+from utils.court_allocator import AllocationJob, allocate_courts
+from utils.freestyle_planner import FINAL_STAGE, MAIN_STAGE, PRELIM_STAGE, freestyle_stage_rows, plan_freestyle
+
+# Tk 없이 경기번호를 계산하는 토너먼트 엔진.
+# GUI(경기번호 계산기), 엑셀 일괄 처리 등에서 동일하게 사용한다.
+
+FREESTYLE_EVENT = "자유품새"
+
+# 한 라운드 요약: 강수, 첫 경기번호, 마지막 경기번호, 경기수
+BracketRound = namedtuple("BracketRound", ["round_size", "first_game", "last_game", "match_count"])
+
+# 한 체급(종목/부/체급)의 계산 결과. 자유품새는 rounds 대신 freestyle(FreestylePlan)
+CategoryPlan = namedtuple("CategoryPlan", ["event", "division", "weight_class", "participants", "rounds", "freestyle"])
+
+
+def next_power_of_two(n):
+    if n <= 1:
+        return 1
+    return 1 << (n - 1).bit_length()
+
+
+def bracket_rounds(participants, first_game=1):
+    if participants < 2:
+        return ()
+
+    total_slots = next_power_of_two(participants)
+    byes = total_slots - participants
+    game_number = first_game
+    rounds = []
+
+    # 예선전 (첫 라운드) - 부전승을 제외한 인원만 경기
+    first_round_matches = (participants - byes) // 2
+    if first_round_matches > 0:
+        rounds.append(BracketRound(total_slots, game_number, game_number + first_round_matches - 1, first_round_matches))
+        game_number += first_round_matches
+
+    # 본선 (다음 라운드부터 결승까지) - 첫 라운드 이후 인원은 항상 total_slots / 2
+    round_size = total_slots // 2
+    while round_size > 1:
+        round_matches = round_size // 2
+        rounds.append(BracketRound(round_size, game_number, game_number + round_matches - 1, round_matches))
+        game_number += round_matches
+        round_size //= 2
+
+    return tuple(rounds)
+
+
+def format_game_range(bracket_round):
+    if bracket_round.match_count <= 0:
+        return "-"
+    return f"{bracket_round.first_game}~{bracket_round.last_game}"
+
+
+def plan_tournament(records):
+    # records: (종목, 부, 체급, 참가인원) 반복 가능 객체
+    # 같은 (종목, 부, 체급)이 연속되면 경기번호가 이어지고, 바뀌면 1번부터 다시 시작한다.
+    plans = []
+    game_number_counter = 1
+    previous_category = None
+
+    for event, division, weight_class, participants in records:
+        if participants is None or participants < 2:
+            continue
+
+        event = event or ""
+        division = division or ""
+        weight_class = weight_class or ""
+
+        if event == FREESTYLE_EVENT:
+            plans.append(CategoryPlan(event, division, weight_class, participants, None, plan_freestyle(participants)))
+            previous_category = None
+            continue
+
+        current_category = (event, division, weight_class)
+        if current_category != previous_category:
+            game_number_counter = 1
+
+        rounds = bracket_rounds(participants, game_number_counter)
+        if rounds:
+            game_number_counter = rounds[-1].last_game + 1
+        plans.append(CategoryPlan(event, division, weight_class, participants, rounds, None))
+        previous_category = current_category
+
+    return plans
+
+
+# 결과 표 한 행: 화면 값 (종목, 부, 체급, 강수, 경기번호, 경기수)과 같은 열 순서의 정렬 키
+ResultRow = namedtuple("ResultRow", ["values", "sort_keys"])
+
+# 강수 열 정렬 순위: 결선 < 본선 < 예선 < 일반 토너먼트 강수
+STAGE_SORT_RANK = {FINAL_STAGE: 0, MAIN_STAGE: 1, PRELIM_STAGE: 2}
+BRACKET_SORT_RANK = 3
+
+
+# 코트별 통합 경기번호 구간. court 는 0 부터
+CourtGameRange = namedtuple("CourtGameRange", ["court", "first_game", "last_game", "width"])
+
+
+def sequence_games_across_courts(plans, court_count):
+    # 체급을 통째로 코트에 배정(경기 수 균형)한 뒤, 코트마다 큰 라운드부터 (예: 16강 전부 -> 8강 전부)
+    # 체급 순서대로 번호를 이어 붙인다. (plan 인덱스, 라운드 인덱스) -> CourtGameRange
+    # 경기가 아니라 (체급, 라운드) 단위로 정렬하므로 경기 수가 많아도 번호 매기기가 가볍다.
+    # 자유품새는 토너먼트 경기가 아니므로 제외
+    standard = [index for index, plan in enumerate(plans) if plan.freestyle is None and plan.rounds]
+    jobs = [AllocationJob(str(index), sum(r.match_count for r in plans[index].rounds), None) for index in standard]
+    allocation = allocate_courts(jobs, court_count)
+
+    sequence = {}
+    for court, job_indexes in enumerate(allocation.court_jobs):
+        entries = []
+        for job_index in job_indexes:
+            plan_index = standard[job_index]
+            for round_index, bracket_round in enumerate(plans[plan_index].rounds):
+                entries.append((-bracket_round.round_size, plan_index, round_index, bracket_round.match_count))
+        entries.sort()
+
+        width = max(3, len(str(sum(entry[3] for entry in entries))))
+        game_number = 1
+        for _, plan_index, round_index, match_count in entries:
+            sequence[plan_index, round_index] = CourtGameRange(court, game_number, game_number + match_count - 1, width)
+            game_number += match_count
+    return sequence
+
+
+def format_court_game_range(court_range):
+    court = court_range.court + 1
+    return f"{court}-{court_range.first_game:0{court_range.width}d}~{court}-{court_range.last_game:0{court_range.width}d}"
+
+
+def _result_row(plan, round_label, game_range, match_count, round_key, first_game):
+    values = (plan.event, plan.division, plan.weight_class, round_label, game_range, match_count)
+    sort_keys = (plan.event, plan.division, plan.weight_class, round_key, first_game, match_count)
+    return ResultRow(values, sort_keys)
+
+
+def result_rows(plans, sequence=None):
+    # 정렬 키는 문자열을 다시 해석하지 않도록 계산할 때 함께 만든다
+    # sequence(sequence_games_across_courts 결과)를 주면 경기번호를 코트별 통합 번호로 표시
+    rows = []
+    for plan_index, plan in enumerate(plans):
+        if plan.freestyle is not None:
+            for round_label, size, stage, group_number in freestyle_stage_rows(plan.freestyle):
+                rows.append(_result_row(plan, round_label, f"1~{size}", size, (STAGE_SORT_RANK[stage], group_number), (-1, 1)))
+        else:
+            for round_index, bracket_round in enumerate(plan.rounds):
+                round_key = (BRACKET_SORT_RANK, bracket_round.round_size)
+                court_range = sequence.get((plan_index, round_index)) if sequence is not None else None
+                if court_range is not None:
+                    rows.append(_result_row(plan, str(bracket_round.round_size), format_court_game_range(court_range),
+                                            bracket_round.match_count, round_key, (court_range.court, court_range.first_game)))
+                else:
+                    rows.append(_result_row(plan, str(bracket_round.round_size), format_game_range(bracket_round),
+                                            bracket_round.match_count, round_key, (-1, bracket_round.first_game)))
+    return rows
+
+
+# "결승"/"준결승"/"16강" 같은 강수 표기를 강 크기로 변환 (알 수 없는 값은 0)
+ROUND_LABEL_SIZES = {"결승": 2, "준결승": 4}
+
+
+def round_options(headcount):
+    # 겨루기 시작/종료 강수 선택지 (큰 강수부터). 인원이 강 크기의 절반을 넘는 강만 포함
+    options = [f"{power}강" for power in (1024, 512, 256, 128, 64, 32, 16, 8) if headcount > power / 2]
+    if headcount > 2:
+        options.append("준결승")
+    if headcount >= 2:
+        options.append("결승")
+    return options
+
+
+def default_round_range(headcount, start_round=None, end_round=None):
+    # 선택지에 없는 값이면 첫 강수 ~ 결승으로 맞춘다
+    options = round_options(headcount)
+    if not options:
+        return "", ""
+    start = start_round if start_round and start_round in options else options[0]
+    end = end_round if end_round and end_round in options else options[-1]
+    return start, end
+
+
+def round_label_to_size(round_label):
+    if round_label in ROUND_LABEL_SIZES:
+        return ROUND_LABEL_SIZES[round_label]
+    try:
+        return int(str(round_label).replace("강", ""))
+    except ValueError:
+        return 0
+
+
+def matches_in_round_range(headcount, start_round_size, end_round_size):
+    # 시작 강수 ~ 종료 강수 사이에 치러지는 경기 수 (반복 없이 계산)
+    if headcount <= 1:
+        return 0
+
+    if start_round_size < end_round_size:
+        start_round_size = end_round_size
+
+    bracket_size = max(2, next_power_of_two(headcount))
+    total_matches = 0
+
+    # 첫 라운드는 부전승을 제외한 인원만 경기
+    if end_round_size <= bracket_size <= start_round_size:
+        total_matches += headcount - bracket_size // 2
+
+    # 이후 라운드는 P강에서 P/2 경기 -> 2^a..2^b 구간 합은 2^b - 2^(a-1)
+    upper = min(start_round_size, bracket_size // 2)
+    lower = max(end_round_size, 2)
+    if upper >= lower:
+        upper = 1 << (upper.bit_length() - 1)
+        lower = next_power_of_two(lower)
+        if upper >= lower:
+            total_matches += upper - lower // 2
+
+    return total_matches
+
+
+def round_range_rounds(headcount, start_round_size, end_round_size):
+    # 시작 강수 ~ 종료 강수 사이 BracketRound (진행 순서). 경기 수 합계는 matches_in_round_range 와 같다
+    if start_round_size < end_round_size:
+        start_round_size = end_round_size
+    return tuple(bracket_round for bracket_round in bracket_rounds(headcount)
+                 if end_round_size <= bracket_round.round_size <= start_round_size)
+
+
+def round_label(round_size):
+    # round_options 와 같은 표기 (2 -> 결승, 4 -> 준결승, 16 -> 16강)
+    for label, size in ROUND_LABEL_SIZES.items():
+        if size == round_size:
+            return label
+    return f"{round_size}강"
@@ -0,0 +1,117 @@
+import bisect
+import heapq
+from collections import namedtuple
+
+# 참가부/체급 같은 묶음을 통째로 코트에 배정해서 가장 늦게 끝나는 코트의 시간(makespan)을 줄인다.
+# 1) 고정된 묶음을 먼저 넣고 2) 나머지는 긴 것부터 가장 한가한 코트에 넣은 뒤(LPT)
+# 3) 가장 바쁜 코트의 묶음을 옮기거나 맞바꾸는 지역 탐색으로 개선한다.
+# lower_bound 는 어떤 배정으로도 이보다 빨리 끝날 수 없는 시간이다.
+
+MAX_LOCAL_SEARCH_ROUNDS = 1000
+
+# locked_court: 고정할 코트 번호 (0 부터) 또는 None
+AllocationJob = namedtuple("AllocationJob", ["name", "seconds", "locked_court"])
+
+# court_jobs[c]: c 코트에 배정된 jobs 인덱스 목록
+Allocation = namedtuple("Allocation", ["court_jobs", "court_seconds", "makespan", "lower_bound"])
+
+
+def allocation_lower_bound(jobs, court_count):
+    # 평균 부하, 가장 긴 묶음, 고정 묶음만으로 채워진 코트 중 큰 값
+    total = sum(job.seconds for job in jobs)
+    locked = [0] * court_count
+    for job in jobs:
+        if job.locked_court is not None:
+            locked[job.locked_court] += job.seconds
+    return max(total / court_count, max((job.seconds for job in jobs), default=0), max(locked))
+
+
+def _lpt(jobs, court_count):
+    assignment = [None] * len(jobs)
+    loads = [0] * court_count
+    for index, job in enumerate(jobs):
+        if job.locked_court is not None:
+            assignment[index] = job.locked_court
+            loads[job.locked_court] += job.seconds
+
+    courts = [(load, court) for court, load in enumerate(loads)]
+    heapq.heapify(courts)
+    free_jobs = sorted((index for index, job in enumerate(jobs) if job.locked_court is None), key=lambda i: -jobs[i].seconds)
+    for index in free_jobs:
+        load, court = heapq.heappop(courts)
+        assignment[index] = court
+        load += jobs[index].seconds
+        loads[court] = load
+        heapq.heappush(courts, (load, court))
+    return assignment, loads
+
+
+def _improve(jobs, assignment, loads):
+    # 가장 바쁜 코트에서 옮기기/맞바꾸기로 makespan 이 줄어드는 첫 수를 반복 적용.
+    # 코트별로 고정되지 않은 묶음을 (시간, 인덱스) 순으로 정렬해 두고 후보를 이분 탐색으로 찾는다
+    court_count = len(loads)
+    free = [[] for _ in range(court_count)]
+    for index, court in enumerate(assignment):
+        if jobs[index].locked_court is None:
+            free[court].append((jobs[index].seconds, index))
+    for entries in free:
+        entries.sort()
+
+    for _ in range(MAX_LOCAL_SEARCH_ROUNDS):
+        busiest = max(range(court_count), key=loads.__getitem__)
+        makespan = loads[busiest]
+        if not _improve_once(assignment, loads, free, busiest, makespan):
+            break
+
+
+def _improve_once(assignment, loads, free, busiest, makespan):
+    if not free[busiest]:
+        return False
+    for court in range(len(loads)):
+        if court == busiest:
+            continue
+        # 받는 코트가 기존 makespan 보다 빨리 끝나려면 늘어나는 시간이 gap 보다 작아야 한다
+        gap = makespan - loads[court]
+        # 옮기기: 가장 짧은 묶음이 gap 보다 짧으면 이득
+        seconds, index = free[busiest][0]
+        if seconds < gap:
+            _move(assignment, loads, free, seconds, index, busiest, court)
+            return True
+        # 맞바꾸기: 더 짧은 묶음(seconds - gap < 상대 < seconds)과 교환하면 두 코트 모두 makespan 보다 빨리 끝난다
+        for seconds, index in free[busiest]:
+            position = bisect.bisect_right(free[court], (seconds - gap, float('inf')))
+            if position < len(free[court]) and free[court][position][0] < seconds:
+                other_seconds, other = free[court][position]
+                _move(assignment, loads, free, seconds, index, busiest, court)
+                _move(assignment, loads, free, other_seconds, other, court, busiest)
+                return True
+    return False
+
+
+def _move(assignment, loads, free, seconds, index, source, target):
+    entries = free[source]
+    del entries[bisect.bisect_left(entries, (seconds, index))]
+    bisect.insort(free[target], (seconds, index))
+    assignment[index] = target
+    loads[source] -= seconds
+    loads[target] += seconds
+
+
+def allocate_courts(jobs, court_count):
+    if court_count <= 0:
+        raise ValueError("코트 수는 0보다 커야 합니다.")
+    jobs = list(jobs)
+    for job in jobs:
+        if job.locked_court is not None and not 0 <= job.locked_court < court_count:
+            raise ValueError(f"{job.name}: 고정 코트 번호가 코트 수를 벗어났습니다.")
+
+    assignment, loads = _lpt(jobs, court_count)
+    _improve(jobs, assignment, loads)
+
+    court_jobs = [[] for _ in range(court_count)]
+    for index, court in enumerate(assignment):
+        court_jobs[court].append(index)
+    for indexes in court_jobs:
+        indexes.sort(key=lambda i: -jobs[i].seconds)
+
+    return Allocation(court_jobs, loads, max(loads), allocation_lower_bound(jobs, court_count))
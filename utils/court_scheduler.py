@@ -0,0 +1,83 @@
+import heapq
+from collections import namedtuple
+
+# 경기를 코트에 하나씩 배정하는 이산 사건 시뮬레이터.
+# 코트는 비는 시각 순서로 꺼내고(heap), 그 시각까지 준비된 경기 중 우선순위가 가장 높은 경기를 배정한다.
+# 한 체급의 다음 라운드는 이전 라운드 경기가 모두 끝난 뒤에야 준비된다.
+# "총 시간 / 코트 수" 와 달리 라운드 대기와 코트 유휴 시간이 종료 시각에 반영된다.
+
+# rounds: 라운드별 경기 수 (진행 순서), seconds_per_match: 한 경기 소요 시간(초)
+ScheduleCategory = namedtuple("ScheduleCategory", ["name", "rounds", "seconds_per_match"])
+
+# court 는 0 부터. category 는 categories 인덱스
+ScheduledMatch = namedtuple("ScheduledMatch", ["court", "start", "end", "category", "round_index", "match_index"])
+
+# court_timelines[c]: c 코트의 ScheduledMatch 목록 (시작 시각 순)
+CourtSchedule = namedtuple("CourtSchedule", ["matches", "court_timelines", "finish_seconds", "court_finish_seconds", "court_busy_seconds"])
+
+
+def simulate_courts(categories, court_count, round_first=False):
+    # round_first=False: 앞 체급부터 끝까지 진행 (체급 순서 우선)
+    # round_first=True : 모든 체급의 앞 라운드를 먼저 진행 (라운드 우선)
+    if court_count <= 0:
+        raise ValueError("코트 수는 0보다 커야 합니다.")
+
+    categories = list(categories)
+    matches = []
+    court_timelines = [[] for _ in range(court_count)]
+
+    # 라운드별 남은 경기 수와 그 라운드의 마지막 종료 시각
+    remaining = {}
+    round_end = {}
+    pending = [] # (준비 시각, 우선순위, 체급, 라운드) - 아직 준비 시각이 오지 않은 라운드
+    ready = [] # (우선순위, 체급, 라운드, 경기 번호) - 지금 배정 가능한 경기
+
+    def priority(category_index, round_index):
+        return (round_index, category_index) if round_first else (category_index, round_index)
+
+    def release_round(category_index, round_index, ready_time):
+        # 경기 수가 0 인 라운드는 건너뛴다
+        rounds = categories[category_index].rounds
+        while round_index < len(rounds) and rounds[round_index] <= 0:
+            round_index += 1
+        if round_index < len(rounds):
+            remaining[category_index, round_index] = rounds[round_index]
+            round_end[category_index, round_index] = ready_time
+            heapq.heappush(pending, (ready_time, priority(category_index, round_index), category_index, round_index))
+
+    for category_index in range(len(categories)):
+        release_round(category_index, 0, 0)
+
+    courts = [(0, court) for court in range(court_count)]
+    heapq.heapify(courts)
+
+    while pending or ready:
+        now, court = heapq.heappop(courts)
+
+        # 지금까지 준비된 라운드의 경기를 배정 후보로 옮긴다
+        while pending and pending[0][0] <= now:
+            _, rank, category_index, round_index = heapq.heappop(pending)
+            for match_index in range(categories[category_index].rounds[round_index]):
+                heapq.heappush(ready, (rank, category_index, round_index, match_index))
+
+        if not ready:
+            # 배정할 경기가 없으면 다음 라운드가 준비될 때까지 코트 대기
+            heapq.heappush(courts, (pending[0][0], court))
+            continue
+
+        _, category_index, round_index, match_index = heapq.heappop(ready)
+        end = now + categories[category_index].seconds_per_match
+        scheduled = ScheduledMatch(court, now, end, category_index, round_index, match_index)
+        matches.append(scheduled)
+        court_timelines[court].append(scheduled)
+        heapq.heappush(courts, (end, court))
+
+        key = (category_index, round_index)
+        remaining[key] -= 1
+        round_end[key] = max(round_end[key], end)
+        if remaining[key] == 0:
+            release_round(category_index, round_index + 1, round_end[key])
+
+    court_finish = [timeline[-1].end if timeline else 0 for timeline in court_timelines]
+    court_busy = [sum(match.end - match.start for match in timeline) for timeline in court_timelines]
+    return CourtSchedule(matches, court_timelines, max(court_finish, default=0), court_finish, court_busy)
@@ -0,0 +1,33 @@
+# 짧은 시간 안에 여러 번 요청된 화면 작업을 마지막 요청 뒤 한 번만 실행한다.
+# 키 입력이나 행 추가마다 필터 목록, 합계 표시, 칸 색을 다시 만들지 않고
+# 입력이 잠시 멈추면(또는 한 묶음의 처리가 끝나면) 한 번에 반영한다.
+
+DEFAULT_DELAY_MS = 150
+
+
+class Debouncer:
+    def __init__(self, widget, callback, delay_ms=DEFAULT_DELAY_MS):
+        self.widget = widget # after() 를 부를 위젯
+        self.callback = callback
+        self.delay_ms = delay_ms
+        self.job = None
+
+    def schedule(self):
+        # 이미 예약된 실행은 미루고, 마지막 요청 delay_ms 뒤에 한 번 실행
+        self.cancel()
+        self.job = self.widget.after(self.delay_ms, self._run)
+
+    def cancel(self):
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+
+    def flush(self):
+        # 예약된 실행이 있으면 지금 실행 (계산하기처럼 최신 상태가 바로 필요할 때)
+        if self.job is not None:
+            self.cancel()
+            self.callback()
+
+    def _run(self):
+        self.job = None
+        self.callback()
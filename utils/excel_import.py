@@ -0,0 +1,26 @@
+# 엑셀 입력 파일을 읽기 전용(read_only) 모드로 조금씩 읽는다.
+# 전체 통합문서를 메모리에 올리지 않으므로 큰 파일도 메모리 사용량이 일정하다.
+# openpyxl 은 import 가 무거워서 (numpy 까지 읽음) 실제로 파일을 열 때 가져온다.
+
+BATCH_SIZE = 500
+
+
+def iter_row_batches(file_path, min_row=2, batch_size=BATCH_SIZE):
+    # (예상 전체 행 수 또는 None, 값 튜플 리스트)를 batch_size 행씩 돌려준다
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(file_path, read_only=True)
+    try:
+        sheet = workbook.active
+        total_rows = sheet.max_row - min_row + 1 if sheet.max_row else None
+
+        batch = []
+        for row in sheet.iter_rows(min_row=min_row, values_only=True):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield total_rows, batch
+                batch = []
+        if batch:
+            yield total_rows, batch
+    finally:
+        workbook.close()
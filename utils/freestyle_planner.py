@@ -0,0 +1,74 @@
+from collections import namedtuple
+from functools import lru_cache
+
+# 자유품새 예선/본선/결선 조 편성.
+# 경기번호 계산기와 품새 경기시간 계산기가 같은 규칙을 공유한다.
+
+MAX_AVERAGE_GROUP_SIZE = 11.5
+FINAL_SIZE = 8
+
+PRELIM_STAGE = "예선"
+MAIN_STAGE = "본선"
+FINAL_STAGE = "결선"
+
+# 각 단계의 조별 인원 (조가 없으면 빈 튜플), 결선 인원
+FreestylePlan = namedtuple("FreestylePlan", ["prelim_groups", "main_groups", "final_size"])
+
+
+def split_groups(participants):
+    # 조당 평균 11.5명 이하가 되는 가장 작은 짝수 개의 조로 나누고, 남는 인원은 앞 조부터 채운다
+    num_groups = 2
+    while participants / num_groups > MAX_AVERAGE_GROUP_SIZE:
+        num_groups += 2
+
+    base_size, remainder = divmod(participants, num_groups)
+    return tuple(base_size + 1 if g < remainder else base_size for g in range(num_groups))
+
+
+@lru_cache(maxsize=4096)
+def plan_freestyle(participants):
+    if participants <= 11:
+        return FreestylePlan((), (), participants)
+
+    if participants <= 21:
+        # 본선 2개 조 (홀수면 1조가 1명 더 많음) + 결선
+        group1_size = (participants + 1) // 2
+        return FreestylePlan((), (group1_size, participants - group1_size), FINAL_SIZE)
+
+    # 예선 -> 본선 -> 결선
+    # 본선 진출 인원: 1조 인원의 절반(올림)이 모든 조에서 진출
+    prelim_groups = split_groups(participants)
+    advancement_per_group = (prelim_groups[0] + 1) // 2
+    main_groups = split_groups(advancement_per_group * len(prelim_groups))
+    return FreestylePlan(prelim_groups, main_groups, FINAL_SIZE)
+
+
+def freestyle_stage_rows(plan):
+    # 결과 표에 들어갈 (강수 표기, 인원, 단계, 조 번호) 목록. 결선은 조 번호 0
+    rows = [(f"{PRELIM_STAGE}-{g}조", size, PRELIM_STAGE, g) for g, size in enumerate(plan.prelim_groups, start=1)]
+    rows += [(f"{MAIN_STAGE}-{g}조", size, MAIN_STAGE, g) for g, size in enumerate(plan.main_groups, start=1)]
+    rows.append((FINAL_STAGE, plan.final_size, FINAL_STAGE, 0))
+    return rows
+
+
+def freestyle_individual_games(participants, prelim=True, main=True, final=True):
+    # 품새 경기시간 계산기의 자유품새 개인전 경기 수
+    if participants <= 11:
+        # 11명 이하는 결선만 진행되지만, 선택한 단계에 따라 보정
+        if final and not (prelim or main):
+            return FINAL_SIZE
+        if final:
+            return participants + FINAL_SIZE
+        if prelim or main:
+            return participants
+        return 0
+
+    plan = plan_freestyle(participants)
+    games = 0
+    if prelim:
+        games += sum(plan.prelim_groups)
+    if main:
+        games += sum(plan.main_groups)
+    if final:
+        games += plan.final_size
+    return games
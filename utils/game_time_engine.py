@@ -0,0 +1,138 @@
+from collections import namedtuple
+
+from utils.bracket_engine import matches_in_round_range, round_label_to_size, round_range_rounds
+from utils.court_scheduler import ScheduleCategory
+from utils.freestyle_planner import freestyle_individual_games
+
+# Tk 없이 경기 시간을 계산하는 엔진. 각 행은 한 번만 계산하고,
+# 합계/참가부별 합계/적용된 설정은 같은 레코드에서 만든다.
+
+DEFAULT_KYORUGI_SECONDS = 450
+
+# rounds: 시작~종료 강수 사이 BracketRound (진행 순서). 코트 시뮬레이션과 보고서의 경기번호에 쓴다
+KyorugiRow = namedtuple("KyorugiRow", ["division", "weight_class", "headcount", "matches", "seconds_per_match", "total_seconds", "rounds"])
+
+KyorugiSummary = namedtuple("KyorugiSummary", ["rows", "total_seconds", "division_data", "applied_settings"])
+
+POOMSAE_DIVISIONS = ["초등부", "중등부", "고등부", "대학부", "일반부"]
+POOMSAE_EVENT_TYPES = ["개인전", "복식전", "단체전"]
+FREESTYLE_SETTING_KEYS = {"개인전": "개인", "복식전": "복식", "단체전": "단체"}
+GONGIN = "공인품새"
+FREESTYLE = "자유품새"
+
+DEFAULT_POOMSAE_SETTINGS = {
+    "individual": {
+        "초등부": "210", "중등부": "210", "고등부": "210", "대학부": "240", "일반부": "240"
+    },
+    "team": {
+        "초등부": "390", "중등부": "420", "고등부": "390", "대학부": "450", "일반부": "420"
+    },
+    "freestyle": {
+        "개인": "140", "복식": "140", "단체": "140"
+    }
+}
+
+# poomsae_type: 공인품새/자유품새, event_type: 개인전/복식전/단체전. games 는 보정된 게임 수 (소수 가능)
+PoomsaeRow = namedtuple("PoomsaeRow", ["event", "division", "poomsae_type", "event_type", "headcount", "games", "seconds_per_game", "total_seconds"])
+
+# sub_totals[poomsae_type][event_type] = {"time": 초, "games": 게임 수}
+PoomsaeSummary = namedtuple("PoomsaeSummary", ["rows", "gongin_seconds", "freestyle_seconds", "sub_totals"])
+
+
+def format_time(seconds):
+    # 화면/보고서용 소요시간 표기 (예: 1시간 5분 0초)
+    m, s = divmod(seconds, 60)
+    h, m = divmod(m, 60)
+    return f"{int(h)}시간 {int(m)}분 {int(s)}초"
+
+
+def kyorugi_row(division, weight_class, headcount, start_round, end_round, settings):
+    seconds_per_match = int(settings.get(division, DEFAULT_KYORUGI_SECONDS))
+    start_size, end_size = round_label_to_size(start_round), round_label_to_size(end_round)
+    matches = matches_in_round_range(headcount, start_size, end_size)
+    return KyorugiRow(division, weight_class, headcount, matches, seconds_per_match, matches * seconds_per_match,
+                      round_range_rounds(headcount, start_size, end_size))
+
+
+def summarize_kyorugi(rows):
+    total_seconds = 0
+    division_data = {}
+    applied_settings = {}
+
+    for row in rows:
+        if row.division not in applied_settings:
+            applied_settings[row.division] = row.seconds_per_match
+
+        if row.headcount == 0:
+            continue
+
+        total_seconds += row.total_seconds
+        if row.division not in division_data:
+            division_data[row.division] = {"total_seconds": 0, "total_games": 0}
+        division_data[row.division]["total_seconds"] += row.total_seconds
+        division_data[row.division]["total_games"] += row.matches
+
+    return KyorugiSummary(tuple(rows), total_seconds, division_data, applied_settings)
+
+
+def poomsae_row(event, division, headcount, settings, prelim=True, main=True, final=True):
+    # event 예: "개인전", "개인전(자유품새)". division 은 POOMSAE_DIVISIONS 중 하나
+    if division not in POOMSAE_DIVISIONS:
+        raise ValueError(f"참가부 입력이 잘못되었습니다. {', '.join(POOMSAE_DIVISIONS)} 중 하나여야 합니다.\n잘못된 값: {division}")
+
+    poomsae_type = FREESTYLE if FREESTYLE in event else GONGIN
+    event_type = event.replace("(자유품새)", "").strip()
+    if event_type not in POOMSAE_EVENT_TYPES:
+        raise ValueError(f"알 수 없는 종목입니다: {event}")
+
+    if poomsae_type == GONGIN:
+        # 개인전 (인원수 - 1), 복식전 (인원수 / 2 - 1), 단체전 (인원수 / 3 - 1)
+        divisor = {"개인전": 1, "복식전": 2, "단체전": 3}[event_type]
+        games = headcount - 1 if divisor == 1 else headcount / divisor - 1
+        settings_group = 'individual' if event_type == "개인전" else 'team'
+        seconds_per_game = int(settings[settings_group].get(division, 0))
+    else:
+        if event_type == "개인전":
+            games = freestyle_individual_games(headcount, prelim, main, final)
+        else:
+            games = headcount / (2 if event_type == "복식전" else 5)
+        seconds_per_game = int(settings['freestyle'].get(FREESTYLE_SETTING_KEYS[event_type], 0))
+
+    return PoomsaeRow(event, division, poomsae_type, event_type, headcount, games, seconds_per_game, games * seconds_per_game)
+
+
+def summarize_poomsae(rows):
+    sub_totals = {poomsae_type: {event_type: {"time": 0, "games": 0} for event_type in POOMSAE_EVENT_TYPES}
+                  for poomsae_type in (GONGIN, FREESTYLE)}
+    totals = {GONGIN: 0, FREESTYLE: 0}
+
+    for row in rows:
+        totals[row.poomsae_type] += row.total_seconds
+        sub_totals[row.poomsae_type][row.event_type]["time"] += row.total_seconds
+        sub_totals[row.poomsae_type][row.event_type]["games"] += row.games
+
+    return PoomsaeSummary(tuple(rows), totals[GONGIN], totals[FREESTYLE], sub_totals)
+
+
+def kyorugi_schedule_categories(rows):
+    # 체급별 라운드를 코트 시뮬레이터 입력으로 변환 (경기 단위로 여러 코트에 나눠 배정)
+    return [ScheduleCategory(f"{row.division} {row.weight_class}", tuple(r.match_count for r in row.rounds), row.seconds_per_match)
+            for row in rows if row.headcount != 0]
+
+
+def kyorugi_division_spans(rows, schedule):
+    # 참가부별 코트 진행 시간(초): 그 참가부 경기 중 가장 늦은 종료 - 가장 이른 시작.
+    # schedule 은 kyorugi_schedule_categories(rows) 로 시뮬레이션한 결과. 경기가 없는 참가부는 빠진다
+    divisions = [row.division for row in rows if row.headcount != 0]
+    bounds = {}
+    for match in schedule.matches:
+        division = divisions[match.category]
+        start, end = bounds.get(division, (match.start, match.end))
+        bounds[division] = (min(start, match.start), max(end, match.end))
+    return {division: end - start for division, (start, end) in bounds.items()}
+
+
+def poomsae_schedule_categories(rows):
+    # 품새는 한 종목(행)을 한 코트에서 이어서 진행하므로 행 전체를 하나의 경기로 취급
+    return [ScheduleCategory(f"{row.event} {row.division}", (1,), row.total_seconds)
+            for row in rows if row.total_seconds > 0]
@@ -0,0 +1,103 @@
+import queue
+import threading
+import time
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from utils.excel_import import iter_row_batches
+from utils import profiler
+
+# 엑셀 가져오기를 작업 스레드에서 실행하고, 읽은 행 묶음을 큐로 받아 after()로 화면에 넘긴다.
+# 진행 상황과 취소 버튼을 보여주며, 가져오는 동안에도 창이 멈추지 않는다.
+# 성능 기록을 켜면 phase 이름으로 전체 / 파일 읽기(작업 스레드) / 행 변환 / 표 반영 시간을 남긴다.
+
+POLL_INTERVAL_MS = 50
+
+
+class ExcelImportDialog(tk.Toplevel):
+    def __init__(self, master, file_path, on_batch, on_done, min_row=2, phase="엑셀 가져오기"):
+        super().__init__(master)
+        self.title("엑셀 가져오기")
+        self.geometry("320x130")
+        self.resizable(False, False)
+        self.transient(master)
+        self.protocol("WM_DELETE_WINDOW", self.cancel)
+
+        self.on_batch = on_batch # on_batch(값 튜플 리스트) - 메인 스레드에서 호출
+        self.on_done = on_done # on_done() - 모두 읽은 뒤 메인 스레드에서 호출
+        self.row_count = 0
+        self.phase = phase
+        self.started = time.perf_counter()
+        self.queue = queue.Queue()
+        self.cancel_event = threading.Event()
+
+        self.status_label = tk.Label(self, text="엑셀 파일을 여는 중...")
+        self.status_label.pack(pady=(15, 5))
+        self.progress = ttk.Progressbar(self, mode="indeterminate", length=280)
+        self.progress.pack(pady=5)
+        self.progress.start(10)
+        tk.Button(self, text="취소", command=self.cancel).pack(pady=5)
+        self.grab_set()
+
+        self.worker = threading.Thread(target=self._read_rows, args=(file_path, min_row), daemon=True)
+        self.worker.start()
+        self.after(POLL_INTERVAL_MS, self._poll)
+
+    def _read_rows(self, file_path, min_row):
+        # 작업 스레드: Tk 위젯에 손대지 않고 큐에만 넣는다
+        try:
+            with profiler.profiled(f"{self.phase} / 파일 읽기"):
+                for total_rows, batch in iter_row_batches(file_path, min_row):
+                    if self.cancel_event.is_set():
+                        return
+                    self.queue.put(("rows", total_rows, batch))
+            self.queue.put(("done", None, None))
+        except Exception as e:
+            self.queue.put(("error", None, e))
+
+    def _poll(self):
+        if self.cancel_event.is_set():
+            return
+        try:
+            while True:
+                kind, total_rows, payload = self.queue.get_nowait()
+                if kind == "rows":
+                    self._show_progress(total_rows, len(payload))
+                    with profiler.profiled(f"{self.phase} / 행 변환"):
+                        self.on_batch(payload)
+                elif kind == "done":
+                    self._finish()
+                    with profiler.profiled_render(self.master, f"{self.phase} / 표 반영"):
+                        self.on_done()
+                    profiler.record(self.phase, time.perf_counter() - self.started)
+                    return
+                else:
+                    raise payload
+        except queue.Empty:
+            self.after(POLL_INTERVAL_MS, self._poll)
+        except Exception as e:
+            self.cancel()
+            messagebox.showerror("가져오기 실패", f"엑셀 파일을 읽는 중 오류가 발생했습니다:\n{e}", parent=self.master)
+
+    def _show_progress(self, total_rows, batch_rows):
+        self.row_count += batch_rows
+        if total_rows:
+            if str(self.progress['mode']) != "determinate":
+                self.progress.stop()
+                self.progress.config(mode="determinate", maximum=total_rows)
+            self.progress['value'] = min(self.row_count, total_rows)
+            self.status_label.config(text=f"{self.row_count:,} / {total_rows:,} 행 읽는 중...")
+        else:
+            self.status_label.config(text=f"{self.row_count:,} 행 읽는 중...")
+
+    def _finish(self):
+        # on_done 에서 오류가 나면 cancel() 로 다시 불리므로, 이미 닫힌 창이면 아무것도 하지 않는다
+        if not self.winfo_exists():
+            return
+        self.progress.stop()
+        self.grab_release()
+        self.destroy()
+
+    def cancel(self):
+        self.cancel_event.set()
+        self._finish()
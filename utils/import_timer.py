@@ -0,0 +1,33 @@
+import importlib
+import sys
+import time
+
+# 시작 시간 측정용. 모듈을 차례로 import 하면서 걸린 시간과 새로 올라온 모듈 수를 잰다.
+# 앞 항목이 이미 읽은 모듈(tkinter, common 등)은 뒤 항목 시간에 들어가지 않는다.
+# 모듈 안쪽까지 자세히 보려면 python -X importtime main.py --import-times 로 실행한다.
+
+
+def time_imports(module_names):
+    # (모듈 이름, import 시간(초), 새로 올라온 모듈 수). import 에 실패하면 시간 대신 오류를 돌려준다
+    for name in module_names:
+        before = len(sys.modules)
+        start = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            yield name, e, 0
+            continue
+        yield name, time.perf_counter() - start, len(sys.modules) - before
+
+
+def format_import_times(results):
+    lines = [f"{'모듈':<40} {'시간':>10}  {'새 모듈':>6}"]
+    total = 0
+    for name, seconds, module_count in results:
+        if isinstance(seconds, Exception):
+            lines.append(f"{name:<40} {'없음':>10}  ({seconds})")
+            continue
+        total += seconds
+        lines.append(f"{name:<40} {seconds * 1000:>7.1f} ms  {module_count:>6}")
+    lines.append(f"{'합계':<40} {total * 1000:>7.1f} ms")
+    return "\n".join(lines)
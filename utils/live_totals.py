@@ -0,0 +1,96 @@
+from collections import namedtuple
+from fractions import Fraction
+
+# 입력 표의 실시간 합계. 행마다 마지막으로 계산한 기여분(묶음, 게임 수, 초)을 기억해 두고,
+# 한 행이 바뀌면 그 행의 이전 기여분을 빼고 새 기여분을 더한다 (행 수와 관계없이 O(1)).
+# 체크된 행이 있으면 계산하기와 같이 체크된 행만의 합계를 current() 로 돌려준다.
+# 품새 게임 수/초는 분수(인원 / 3 등)라 float 로 더하고 빼기를 반복하면 오차가 쌓이므로 정수가 아닌 값은 Fraction 으로 더한다
+# (겨루기처럼 정수만 있으면 int 그대로라 느려지지 않는다).
+
+# group: 참가부 같은 소계 묶음. 기여분이 None 인 행(빈 행, 잘못된 입력)은 합계에서 빠진다
+LiveContribution = namedtuple("LiveContribution", ["group", "games", "seconds"])
+
+
+def _exact(value):
+    return value if type(value) is int else Fraction(value)
+
+
+def _number(value):
+    # 표시용: 정수면 int, 아니면 float
+    return value.numerator if value.denominator == 1 else float(value)
+
+
+class LiveAggregate:
+    def __init__(self):
+        self.row_count = 0
+        self._games = 0
+        self._seconds = 0
+        self._groups = {} # group -> [행 수, 게임 수, 초]
+
+    @property
+    def games(self):
+        return _number(self._games)
+
+    @property
+    def seconds(self):
+        return _number(self._seconds)
+
+    @property
+    def groups(self):
+        # group -> (게임 수, 초)
+        return {group: (_number(games), _number(seconds)) for group, (_, games, seconds) in self._groups.items()}
+
+    def add(self, contribution, sign):
+        games = _exact(contribution.games)
+        seconds = _exact(contribution.seconds)
+        self.row_count += sign
+        self._games += sign * games
+        self._seconds += sign * seconds
+        totals = self._groups.setdefault(contribution.group, [0, 0, 0])
+        totals[0] += sign
+        totals[1] += sign * games
+        totals[2] += sign * seconds
+        if totals[0] == 0:
+            del self._groups[contribution.group] # 마지막 행이 빠지면 묶음도 없앤다
+
+
+class LiveTotals:
+    def __init__(self, contribution):
+        self.contribution = contribution # contribution(row) -> LiveContribution 또는 None
+        self.clear()
+
+    def clear(self):
+        # id(row) -> (row, 기여분, 체크 여부). row 를 잡아 두므로 id 가 다른 행에 재사용되지 않는다
+        self.entries = {}
+        self.all = LiveAggregate()
+        self.checked = LiveAggregate()
+        self.checked_rows = 0
+
+    def _apply(self, contribution, checked, sign):
+        if checked:
+            self.checked_rows += sign
+        if contribution is None:
+            return
+        self.all.add(contribution, sign)
+        if checked:
+            self.checked.add(contribution, sign)
+
+    def update(self, row):
+        self.remove(row)
+        contribution = self.contribution(row)
+        checked = row['check'] == 1
+        self.entries[id(row)] = (row, contribution, checked)
+        self._apply(contribution, checked, 1)
+
+    def remove(self, row):
+        entry = self.entries.pop(id(row), None)
+        if entry is not None:
+            self._apply(entry[1], entry[2], -1)
+
+    def reset(self, rows):
+        self.clear()
+        for row in rows:
+            self.update(row)
+
+    def current(self):
+        return self.checked if self.checked_rows else self.all
@@ -0,0 +1,71 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+from datetime import datetime
+
+from utils import profiler
+
+# 성능 기록 진단 창. 단계별 호출 수/합계/평균/최대와 최근 기록(링 버퍼)을 보여주고 JSON 으로 저장한다.
+
+RECENT_LIMIT = 200 # 창에 보여줄 최근 기록 수 (JSON 에는 버퍼 전체)
+
+
+class ProfileDialog(tk.Toplevel):
+    def __init__(self, master):
+        super().__init__(master)
+        self.title("성능 기록")
+        self.geometry("640x560")
+
+        self.stats_tree = self._create_tree(("단계", "호출 수", "합계(ms)", "평균(ms)", "최대(ms)"), (240, 70, 90, 90, 90), 10)
+        tk.Label(self, text=f"최근 기록 (최대 {RECENT_LIMIT}개, 최신순)", anchor="w").pack(fill='x', padx=10)
+        self.recent_tree = self._create_tree(("시각", "단계", "시간(ms)", "스레드"), (100, 260, 90, 130), 12)
+
+        button_frame = tk.Frame(self)
+        button_frame.pack(pady=(0, 10))
+        tk.Button(button_frame, text="새로고침", command=self.refresh).pack(side="left", padx=5)
+        tk.Button(button_frame, text="초기화", command=self.clear).pack(side="left", padx=5)
+        tk.Button(button_frame, text="JSON 저장", command=self.save_trace).pack(side="left", padx=5)
+
+        self.refresh()
+
+    def _create_tree(self, columns, widths, height):
+        frame = tk.Frame(self)
+        frame.pack(expand=True, fill="both", padx=10, pady=(10, 5))
+        tree = ttk.Treeview(frame, columns=columns, show="headings", height=height)
+        for col, width in zip(columns, widths):
+            tree.heading(col, text=col)
+            tree.column(col, width=width, anchor="w" if col == "단계" else "center")
+        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side="left", expand=True, fill="both")
+        scrollbar.pack(side="right", fill="y")
+        return tree
+
+    def refresh(self):
+        for tree in (self.stats_tree, self.recent_tree):
+            children = tree.get_children()
+            if children:
+                tree.delete(*children)
+
+        # 합계가 큰 단계부터
+        for stats in sorted(profiler.phase_stats(), key=lambda s: s.total_seconds, reverse=True):
+            self.stats_tree.insert("", "end", values=(stats.phase, stats.count, f"{stats.total_seconds * 1000:.1f}",
+                                                      f"{stats.total_seconds / stats.count * 1000:.1f}", f"{stats.max_seconds * 1000:.1f}"))
+        for record in reversed(profiler.recent_records()[-RECENT_LIMIT:]):
+            self.recent_tree.insert("", "end", values=(datetime.fromtimestamp(record.started).strftime("%H:%M:%S"), record.phase,
+                                                       f"{record.seconds * 1000:.1f}", record.thread))
+
+    def clear(self):
+        profiler.reset()
+        self.refresh()
+
+    def save_trace(self):
+        file_path = filedialog.asksaveasfilename(parent=self, defaultextension=".json",
+                                                 initialfile=f"성능기록_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                                                 filetypes=[("JSON files", "*.json")])
+        if not file_path:
+            return
+        try:
+            profiler.dump_trace(file_path)
+            messagebox.showinfo("성공", f"성능 기록이 {file_path}에 저장되었습니다.", parent=self)
+        except Exception as e:
+            messagebox.showerror("오류", f"파일 저장 중 오류가 발생했습니다: {e}", parent=self)
@@ -0,0 +1,100 @@
+import json
+import threading
+import time
+from collections import deque, namedtuple
+from contextlib import contextmanager
+from datetime import datetime
+
+# 선택적 성능 기록. main.py --profile (또는 환경 변수 FEELSUTIL_PROFILE=1) 로 켰을 때만 기록하고,
+# 꺼져 있으면 profiled() 는 아무것도 재지 않고 바로 통과한다.
+# 최근 기록은 고정 크기 링 버퍼에 넣고, 단계별 호출 수/합계/최대는 버퍼와 따로 누적한다.
+# 기록은 진단 창(utils/profile_dialog.py, 메인 창에서 F12)에서 보거나 JSON 파일로 저장한다.
+
+PROFILE_BUFFER_SIZE = 1000
+
+# started: 시작 시각 (time.time()), seconds: 걸린 시간, thread: 기록한 스레드 이름 (엑셀 읽기는 작업 스레드)
+PhaseRecord = namedtuple("PhaseRecord", ["phase", "started", "seconds", "thread"])
+PhaseStats = namedtuple("PhaseStats", ["phase", "count", "total_seconds", "max_seconds"])
+
+_enabled = False
+_lock = threading.Lock() # 엑셀 가져오기 작업 스레드도 기록한다
+_records = deque(maxlen=PROFILE_BUFFER_SIZE)
+_totals = {} # 단계 -> [호출 수, 합계(초), 최대(초)]
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def is_enabled():
+    return _enabled
+
+
+def record(phase, seconds):
+    if not _enabled:
+        return
+    with _lock:
+        _records.append(PhaseRecord(phase, time.time() - seconds, seconds, threading.current_thread().name))
+        totals = _totals.setdefault(phase, [0, 0.0, 0.0])
+        totals[0] += 1
+        totals[1] += seconds
+        totals[2] = max(totals[2], seconds)
+
+
+@contextmanager
+def profiled(phase):
+    # with profiled("경기번호 / 계산하기"): ... 또는 메서드에 @profiled("...") 로 붙인다.
+    # 예외로 빠져나가도 걸린 시간은 기록한다
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(phase, time.perf_counter() - start)
+
+
+@contextmanager
+def profiled_render(widget, phase):
+    # 화면 표시 단계용. 기록 중이면 블록이 끝난 뒤 밀려 있는 Tk 배치/그리기(idle 작업)까지 처리한 시간을 잰다
+    with profiled(phase):
+        yield
+        if _enabled:
+            widget.update_idletasks()
+
+
+def phase_stats():
+    with _lock:
+        return [PhaseStats(phase, *totals) for phase, totals in _totals.items()]
+
+
+def recent_records():
+    # 오래된 것부터
+    with _lock:
+        return list(_records)
+
+
+def reset():
+    with _lock:
+        _records.clear()
+        _totals.clear()
+
+
+def dump_trace(file_path):
+    stats = phase_stats()
+    records = recent_records()
+    trace = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "buffer_size": PROFILE_BUFFER_SIZE,
+        "phases": [{"phase": s.phase, "count": s.count, "total_ms": round(s.total_seconds * 1000, 3),
+                    "avg_ms": round(s.total_seconds / s.count * 1000, 3), "max_ms": round(s.max_seconds * 1000, 3)}
+                   for s in stats],
+        "records": [{"phase": r.phase, "started": datetime.fromtimestamp(r.started).isoformat(timespec="milliseconds"),
+                     "ms": round(r.seconds * 1000, 3), "thread": r.thread}
+                    for r in records],
+    }
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(trace, f, ensure_ascii=False, indent=2)
+
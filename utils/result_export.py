@@ -0,0 +1,82 @@
+import csv
+import os
+
+from utils.profiler import profiled
+
+# 결과 행을 파일로 저장. 행은 반복자로 받아 한 줄씩 바로 쓰므로 결과 전체를 두 번 들고 있지 않는다.
+# 형식은 확장자로 정한다: .xlsx (write_only 통합문서), .csv (엑셀에서 열리도록 UTF-8 BOM), .parquet
+# Parquet 은 pyarrow 가 설치되어 있을 때만 쓸 수 있다.
+# openpyxl / pyarrow 는 import 가 무거워서 해당 형식으로 저장할 때만 가져온다.
+
+EXPORT_FILETYPES = [("Excel files", "*.xlsx"), ("CSV files", "*.csv"), ("Parquet files", "*.parquet")]
+PARQUET_BATCH_ROWS = 50000
+
+
+def export_rows(file_path, headers, rows, sheet_title="결과"):
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == ".csv":
+        write_csv(file_path, headers, rows)
+    elif extension == ".parquet":
+        write_parquet(file_path, headers, rows)
+    else:
+        write_xlsx(file_path, [(sheet_title, headers, rows)])
+
+
+@profiled("저장 / xlsx")
+def write_xlsx(file_path, sheets):
+    # sheets: (시트 이름, 헤더, 행 반복자) 목록. 시트 순서대로 한 번에 쓴다
+    import openpyxl
+
+    workbook = openpyxl.Workbook(write_only=True)
+    for title, headers, rows in sheets:
+        sheet = workbook.create_sheet(title)
+        if headers:
+            sheet.append(list(headers))
+        for row in rows:
+            sheet.append(list(row))
+    workbook.save(file_path)
+
+
+@profiled("저장 / csv")
+def write_csv(file_path, headers, rows):
+    with open(file_path, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        writer.writerows(rows)
+
+
+def _batches(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+@profiled("저장 / parquet")
+def write_parquet(file_path, headers, rows):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Parquet 로 저장하려면 pyarrow 를 설치해야 합니다. (pip install pyarrow)")
+
+    # 열 형식은 첫 묶음으로 정하고 이후 묶음은 같은 형식으로 이어 쓴다
+    writer = None
+    try:
+        for batch in _batches(rows, PARQUET_BATCH_ROWS):
+            columns = [list(column) for column in zip(*batch)]
+            if writer is None:
+                table = pa.table(dict(zip(headers, columns)))
+                writer = pq.ParquetWriter(file_path, table.schema)
+            else:
+                table = pa.table(dict(zip(headers, columns)), schema=writer.schema)
+            writer.write_table(table)
+        if writer is None:
+            pq.write_table(pa.table({header: [] for header in headers}), file_path)
+    finally:
+        if writer is not None:
+            writer.close()
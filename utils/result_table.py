@@ -0,0 +1,66 @@
+# 결과 Treeview 표시 계층.
+# 결과 행은 파이썬 리스트(self.rows)에 두고, Treeview 는 한 번에 비우고/채우고/재배치만 한다.
+# 정렬할 때 Treeview 에서 값을 다시 읽거나 항목을 지웠다 다시 넣지 않는다.
+
+
+class ResultTable:
+    def __init__(self, tree, number_column="번호"):
+        self.tree = tree
+        self.number_column = number_column # 화면 순서대로 1부터 매기는 번호 열
+        self.rows = [] # 계산된 순서의 행 값 (번호 열 제외)
+        self.sort_keys = [] # self.rows 와 같은 열 순서의 정렬 키 (숫자 강수, 첫 경기번호 등)
+        self.order = [] # 화면 순서 -> self.rows 인덱스
+        self.item_ids = [] # self.rows 인덱스 -> Treeview 항목 id
+
+    def clear(self):
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self.rows = []
+        self.sort_keys = []
+        self.order = []
+        self.item_ids = []
+
+    def set_rows(self, rows):
+        # rows: bracket_engine.ResultRow (values, sort_keys)
+        self.clear()
+        self.rows = [row.values for row in rows]
+        self.sort_keys = [row.sort_keys for row in rows]
+        self.order = list(range(len(self.rows)))
+        insert = self.tree.insert
+        self.item_ids = [insert("", "end", values=(number,) + tuple(row)) for number, row in enumerate(self.rows, start=1)]
+
+    def sorted_order(self, sort_spec):
+        # sort_spec: [(열 인덱스, 내림차순 여부)], 앞쪽 열이 우선. 열 인덱스 None 은 계산 순서
+        # 뒤쪽 열부터 안정 정렬을 반복하므로 같은 값끼리는 앞선 순서가 유지된다
+        order = list(range(len(self.rows)))
+        for column, reverse in reversed(sort_spec):
+            if column is None:
+                order.sort(reverse=reverse)
+            else:
+                keys = self.sort_keys
+                order.sort(key=lambda i: keys[i][column], reverse=reverse)
+        return order
+
+    def reorder(self, order):
+        # order: 새 화면 순서 (self.rows 인덱스 리스트)
+        order = list(order)
+        if order == self.order:
+            return
+        item_ids = [self.item_ids[i] for i in order]
+        self.tree.set_children("", *item_ids)
+
+        # 자리가 바뀐 항목만 번호 갱신
+        for position, (old, new) in enumerate(zip(self.order, order)):
+            if old != new:
+                self.tree.set(self.item_ids[new], self.number_column, position + 1)
+        self.order = order
+
+    def iter_displayed_rows(self):
+        # (번호,) + 행 값, 화면 순서. 내보내기에서 한 줄씩 바로 쓸 수 있도록 반복자로 돌려준다
+        rows = self.rows
+        for number, i in enumerate(self.order, start=1):
+            yield (number,) + tuple(rows[i])
+
+    def displayed_rows(self):
+        return list(self.iter_displayed_rows())
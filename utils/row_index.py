@@ -0,0 +1,43 @@
+# 입력 표의 열 값 -> 행 인덱스 집합 (역색인).
+# 필터는 조건마다 집합을 꺼내 교집합으로 구하므로 행 전체를 훑지 않고,
+# 필터 목록(참가부/체급 등)도 색인의 키에서 바로 얻는다.
+
+
+class RowIndex:
+    def __init__(self, keys):
+        self.keys = tuple(keys)
+        self.clear()
+
+    def clear(self):
+        self.values = {key: {} for key in self.keys} # key -> {값: {행 인덱스}}
+
+    def rebuild(self, rows):
+        self.clear()
+        for index, row in enumerate(rows):
+            self.add(index, row)
+
+    def add(self, index, row):
+        for key in self.keys:
+            self.values[key].setdefault(row[key], set()).add(index)
+
+    def change(self, index, key, old, new):
+        if key not in self.values or old == new:
+            return
+        values = self.values[key]
+        indexes = values.get(old)
+        if indexes is not None:
+            indexes.discard(index)
+            if not indexes:
+                del values[old]
+        values.setdefault(new, set()).add(index)
+
+    def distinct(self, key):
+        # 값이 있는 행이 하나라도 남은 값들
+        return self.values[key].keys()
+
+    def lookup(self, criteria):
+        # criteria: {key: 값}. 모든 조건을 만족하는 행 인덱스 (오름차순)
+        groups = sorted((self.values[key].get(value, set()) for key, value in criteria.items()), key=len)
+        if not groups:
+            return []
+        return sorted(groups[0].intersection(*groups[1:]))
@@ -0,0 +1,21 @@
+from datetime import date, datetime
+from tkinter import messagebox, simpledialog
+
+# 대회 DB 저장/불러오기 때 대회 일자(YYYY-MM-DD)를 묻는다. 저장된 일자가 있으면 함께 보여준다.
+
+
+def ask_tournament_day(parent, saved_days=(), initial_day=None):
+    # 올바른 일자 문자열, 취소하면 None
+    prompt = "대회 일자 (YYYY-MM-DD)"
+    if saved_days:
+        prompt += "\n저장된 일자: " + ", ".join(saved_days)
+    day = initial_day or date.today().isoformat()
+    while True:
+        day = simpledialog.askstring("대회 일자", prompt, initialvalue=day, parent=parent)
+        if day is None:
+            return None
+        day = day.strip()
+        try:
+            return datetime.strptime(day, "%Y-%m-%d").date().isoformat()
+        except ValueError:
+            messagebox.showerror("입력 오류", f"일자 형식이 잘못되었습니다: {day}\n예: 2026-10-18", parent=parent)
@@ -0,0 +1,140 @@
+from collections import namedtuple
+from datetime import timedelta
+
+from utils.bracket_engine import format_game_range, round_label
+from utils.freestyle_planner import FINAL_STAGE, MAIN_STAGE, PRELIM_STAGE, freestyle_stage_rows, plan_freestyle
+from utils.game_time_engine import FREESTYLE, GONGIN, POOMSAE_EVENT_TYPES, kyorugi_division_spans
+
+# 경기 시간 계산 결과를 한 통합문서(여러 시트)로 내보내기 위한 시트 구성.
+# 화면 글자를 다시 읽지 않고 계산하기에서 만든 요약/코트 시뮬레이션 결과로 시트를 만든다.
+# 각 시트의 행은 생성기라서 result_export.write_xlsx 가 시트 순서대로 한 번에 쓴다.
+
+# 겨루기 계산하기 결과. entries[i] 는 summary.rows[i] 의 입력 행, schedule 은 kyorugi_schedule_categories(summary.rows) 로 시뮬레이션한 CourtSchedule
+KyorugiReport = namedtuple("KyorugiReport", ["entries", "summary", "schedule", "court_count", "start_time"])
+
+# 품새 계산하기 결과. entries[i] 는 summary.rows[i] 의 입력 행 (세부부별, 성별)
+# stages: 자유품새 (예선, 본선, 결선) 포함 여부
+PoomsaeReport = namedtuple("PoomsaeReport", ["entries", "summary", "gongin_schedule", "freestyle_schedule", "gongin_courts",
+                                             "freestyle_courts", "freestyle_simultaneous", "stages", "settings", "start_time"])
+
+
+def _clock(start_time, seconds):
+    time = start_time + timedelta(seconds=seconds)
+    text = time.strftime("%H:%M")
+    if time.day != start_time.day:
+        text += " (+1)"
+    return text
+
+
+def kyorugi_report_sheets(report):
+    _, summary, schedule, court_count, start_time = report
+    # kyorugi_schedule_categories 와 같은 순서: 시뮬레이션의 category 인덱스 -> 체급 행
+    scheduled = [row for row in summary.rows if row.headcount != 0]
+
+    def match_numbers():
+        for row in summary.rows:
+            for bracket_round in row.rounds:
+                yield (row.division, row.weight_class, row.headcount, round_label(bracket_round.round_size),
+                       format_game_range(bracket_round), bracket_round.match_count)
+
+    def weight_classes():
+        for row in summary.rows:
+            start_round = round_label(row.rounds[0].round_size) if row.rounds else ""
+            end_round = round_label(row.rounds[-1].round_size) if row.rounds else ""
+            yield (row.division, row.weight_class, row.headcount, start_round, end_round,
+                   row.matches, row.seconds_per_match, row.total_seconds)
+
+    def divisions():
+        spans = kyorugi_division_spans(summary.rows, schedule)
+        for division, data in summary.division_data.items():
+            yield (division, data["total_games"], data["total_seconds"], round(spans.get(division, 0)))
+
+    def court_timelines():
+        for court, timeline in enumerate(schedule.court_timelines):
+            for order, match in enumerate(timeline, start=1):
+                row = scheduled[match.category]
+                bracket_round = row.rounds[match.round_index]
+                yield (court + 1, order, _clock(start_time, match.start), _clock(start_time, match.end), row.division,
+                       row.weight_class, round_label(bracket_round.round_size), bracket_round.first_game + match.match_index)
+
+    def settings():
+        yield ("시작 시간", start_time.strftime("%H:%M"))
+        yield ("코트 수", court_count)
+        yield ("코트 적용 소요시간(초)", schedule.finish_seconds)
+        yield ("예상 종료 시간", _clock(start_time, schedule.finish_seconds))
+        yield ()
+        yield ("참가부", "경기시간(초)")
+        yield from summary.applied_settings.items()
+
+    return [
+        ("경기번호", ["참가부", "체급", "인원수", "강수", "경기번호", "경기수"], match_numbers()),
+        ("체급별 시간", ["참가부", "체급", "인원수", "시작강수", "종료강수", "경기수", "경기시간(초)", "소요시간(초)"], weight_classes()),
+        ("참가부별 시간", ["참가부", "게임수", "소요시간(초)", "코트 적용 소요시간(초)"], divisions()),
+        ("코트별 진행", ["코트", "순서", "시작", "종료", "참가부", "체급", "강수", "경기번호"], court_timelines()),
+        ("적용 설정", ["항목", "값"], settings()),
+    ]
+
+
+def poomsae_report_sheets(report):
+    rows = report.summary.rows
+    prelim, main, final = report.stages
+    freestyle_divisor = report.freestyle_courts if report.freestyle_simultaneous else 1
+
+    def entry_values(entry, row):
+        return (row.event, row.division, entry['class'], entry['gender'], row.headcount)
+
+    def freestyle_groups():
+        # 자유품새 개인전 예선/본선/결선 조 편성 (선택한 단계만)
+        included = {PRELIM_STAGE: prelim, MAIN_STAGE: main, FINAL_STAGE: final}
+        for entry, row in zip(report.entries, rows):
+            if row.poomsae_type != FREESTYLE or row.event_type != "개인전" or row.headcount < 2:
+                continue
+            for label, size, stage, _ in freestyle_stage_rows(plan_freestyle(row.headcount)):
+                if included[stage]:
+                    yield entry_values(entry, row) + (label, size)
+
+    def events():
+        for entry, row in zip(report.entries, rows):
+            yield entry_values(entry, row) + (row.games, row.seconds_per_game, row.total_seconds)
+
+    def sub_totals():
+        for poomsae_type, divisor in ((GONGIN, report.gongin_courts), (FREESTYLE, freestyle_divisor)):
+            for event_type in POOMSAE_EVENT_TYPES:
+                data = report.summary.sub_totals[poomsae_type][event_type]
+                yield (poomsae_type, event_type, data["games"], data["time"], round(data["time"] / divisor))
+
+    def court_timelines():
+        # 공인품새가 끝난 뒤 자유품새 진행. poomsae_schedule_categories 와 같은 순서로 종목을 찾는다
+        gongin_finish = report.gongin_schedule.finish_seconds
+        for poomsae_type, schedule, offset in ((GONGIN, report.gongin_schedule, 0), (FREESTYLE, report.freestyle_schedule, gongin_finish)):
+            scheduled = [(entry, row) for entry, row in zip(report.entries, rows)
+                         if row.poomsae_type == poomsae_type and row.total_seconds > 0]
+            for court, timeline in enumerate(schedule.court_timelines):
+                for order, match in enumerate(timeline, start=1):
+                    entry, row = scheduled[match.category]
+                    yield (poomsae_type, court + 1, order, _clock(report.start_time, offset + match.start),
+                           _clock(report.start_time, offset + match.end)) + entry_values(entry, row)
+
+    def settings():
+        finish = report.gongin_schedule.finish_seconds + report.freestyle_schedule.finish_seconds
+        yield ("시작 시간", report.start_time.strftime("%H:%M"))
+        yield ("공인품새 코트 수", report.gongin_courts)
+        yield ("자유품새 코트 수", report.freestyle_courts)
+        yield ("자유품새 동시진행", "적용" if report.freestyle_simultaneous else "미적용")
+        yield ("자유품새 계산 단계", ", ".join(stage for stage, on in zip((PRELIM_STAGE, MAIN_STAGE, FINAL_STAGE), report.stages) if on))
+        yield ("코트 적용 소요시간(초)", finish)
+        yield ("예상 종료 시간", _clock(report.start_time, finish))
+        yield ()
+        yield ("구분", "경기시간(초)")
+        for group, label in (("individual", "공인 개인전"), ("team", "공인 복식/단체전"), ("freestyle", "자유품새")):
+            for name, seconds in report.settings.get(group, {}).items():
+                yield (f"{label} {name}", seconds)
+
+    entry_headers = ["종목", "참가부", "세부부별", "성별", "인원수"]
+    return [
+        ("자유품새 조 편성", entry_headers + ["단계", "인원"], freestyle_groups()),
+        ("종목별 시간", entry_headers + ["게임수", "경기시간(초)", "소요시간(초)"], events()),
+        ("구분별 시간", ["구분", "종목", "게임수", "소요시간(초)", "단순 코트 적용(초)"], sub_totals()),
+        ("코트별 진행", ["구분", "코트", "순서", "시작", "종료"] + entry_headers, court_timelines()),
+        ("적용 설정", ["항목", "값"], settings()),
+    ]
@@ -0,0 +1,357 @@
+import sqlite3
+from contextlib import closing
+
+from utils.bracket_engine import round_label
+from utils.freestyle_planner import freestyle_stage_rows
+from utils.game_time_engine import FREESTYLE, GONGIN
+
+# 대회 DB (SQLite). 세 계산기가 계산한 대회 일자별 종목/참가부/체급/인원/라운드/경기를 한 파일에 모아
+# 엑셀을 다시 가져오지 않고 여러 종목/일자를 SQL 로 조회한다.
+#
+#   events          대회 일자 + 계산기(source) + 종목. 같은 일자/계산기로 다시 저장하면 통째로 바꾼다
+#   divisions       참가부 이름
+#   weight_classes  종목 안의 체급 (품새는 세부부별 + 성별). position 은 입력 표 순서
+#   entries         체급별 인원수(입력한 글자 그대로도), 강수 범위, 경기 시간
+#   rounds          라운드(강수)별 경기번호 범위와 경기 수. 자유품새는 조 편성(조 인원은 group_size, 경기 수 0),
+#                   품새 경기시간은 종목 전체 한 줄
+#   matches         계산된 경기. 코트 통합 번호/코트 시뮬레이션 결과가 있으면 코트와 시각(시작 기준 초)
+#   settings        저장할 때 적용된 경기 시간 설정
+#
+# source: "number" (경기번호 계산기), "kyorugi" / "poomsae" (경기 시간 계산기)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    day TEXT NOT NULL,
+    source TEXT NOT NULL,
+    name TEXT NOT NULL,
+    start_time TEXT,
+    court_count INTEGER,
+    UNIQUE (day, source, name)
+);
+CREATE TABLE IF NOT EXISTS divisions (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS weight_classes (
+    id INTEGER PRIMARY KEY,
+    event_id INTEGER NOT NULL REFERENCES events(id) ON DELETE CASCADE,
+    division_id INTEGER NOT NULL REFERENCES divisions(id),
+    name TEXT NOT NULL,
+    gender TEXT NOT NULL DEFAULT '',
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    weight_class_id INTEGER PRIMARY KEY REFERENCES weight_classes(id) ON DELETE CASCADE,
+    headcount INTEGER NOT NULL,
+    count_text TEXT NOT NULL DEFAULT '',
+    checked INTEGER NOT NULL DEFAULT 0,
+    start_round TEXT NOT NULL DEFAULT '',
+    end_round TEXT NOT NULL DEFAULT '',
+    seconds_per_match INTEGER,
+    total_seconds REAL
+);
+CREATE TABLE IF NOT EXISTS rounds (
+    id INTEGER PRIMARY KEY,
+    weight_class_id INTEGER NOT NULL REFERENCES weight_classes(id) ON DELETE CASCADE,
+    label TEXT NOT NULL,
+    round_size INTEGER,
+    first_game INTEGER,
+    last_game INTEGER,
+    match_count REAL NOT NULL,
+    group_size INTEGER
+);
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    weight_class_id INTEGER NOT NULL REFERENCES weight_classes(id) ON DELETE CASCADE,
+    round_id INTEGER REFERENCES rounds(id) ON DELETE CASCADE,
+    game_number INTEGER,
+    court INTEGER,
+    start_seconds REAL,
+    end_seconds REAL
+);
+CREATE TABLE IF NOT EXISTS settings (
+    event_id INTEGER NOT NULL REFERENCES events(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    seconds INTEGER,
+    PRIMARY KEY (event_id, name)
+);
+CREATE INDEX IF NOT EXISTS idx_events_day ON events(day);
+CREATE INDEX IF NOT EXISTS idx_weight_classes_event ON weight_classes(event_id, position);
+CREATE INDEX IF NOT EXISTS idx_weight_classes_division ON weight_classes(division_id);
+CREATE INDEX IF NOT EXISTS idx_entries_headcount ON entries(headcount);
+CREATE INDEX IF NOT EXISTS idx_rounds_weight_class ON rounds(weight_class_id);
+CREATE INDEX IF NOT EXISTS idx_rounds_size ON rounds(round_size);
+CREATE INDEX IF NOT EXISTS idx_matches_weight_class ON matches(weight_class_id);
+CREATE INDEX IF NOT EXISTS idx_matches_round ON matches(round_id);
+CREATE INDEX IF NOT EXISTS idx_matches_court ON matches(court, start_seconds);
+"""
+
+NUMBER_SOURCE = "number"
+KYORUGI_SOURCE = "kyorugi"
+POOMSAE_SOURCE = "poomsae"
+KYORUGI_EVENT = "겨루기"
+
+# 나중에 더한 열 (테이블, 열, 열 정의, 기존 행 채우기). 예전에 만든 DB 는 처음 열 때 열을 더한다
+MIGRATIONS = (
+    ("entries", "count_text", "TEXT NOT NULL DEFAULT ''", "UPDATE entries SET count_text = CAST(headcount AS TEXT)"),
+    # 경기번호 계산기의 자유품새 조 편성은 경기 수 자리에 조 인원을 넣었었다
+    ("rounds", "group_size", "INTEGER", f"""
+        UPDATE rounds SET group_size = match_count, match_count = 0
+        WHERE round_size IS NULL AND weight_class_id IN (
+            SELECT w.id FROM weight_classes w JOIN events e ON e.id = w.event_id WHERE e.source = '{NUMBER_SOURCE}')
+    """),
+)
+
+
+class TournamentStore:
+    def __init__(self, path):
+        self.path = path
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.executescript(SCHEMA)
+        for table, column, definition, fill in MIGRATIONS:
+            if column not in {info[1] for info in connection.execute(f"PRAGMA table_info({table})")}:
+                with connection:
+                    connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+                    connection.execute(fill)
+        return connection
+
+    # ---------- 저장 ----------
+
+    def save_number_plan(self, day, rows, plans, sequence=None):
+        # 경기번호 계산기. rows: 입력 표의 모든 행 (종목, 부, 체급, 참가인원 글자, 참가인원 정수 또는 None)
+        # 참가인원이 비었거나 숫자가 아닌 행도 그대로 저장해서 불러올 때 입력 표가 같아진다.
+        # plans: 참가인원이 정수인 행으로 만든 plan_tournament 결과, sequence: sequence_games_across_courts 결과 (코트 통합 번호)
+        with closing(self._connect()) as connection, connection:
+            writer = _Writer(connection, day, NUMBER_SOURCE)
+            plan_iter = iter(enumerate(plans))
+            for event, division, weight_class, count_text, participants in rows:
+                weight_class_id = writer.add_entry(writer.event_id(event or ""), division or "", weight_class or "", "", participants or 0,
+                                                   count_text=count_text)
+                if participants is None or participants < 2:
+                    continue # plan_tournament 와 같은 규칙 (2명 미만은 계획 없음)
+                plan_index, plan = next(plan_iter)
+                if plan.freestyle is not None:
+                    for label, size, _, _ in freestyle_stage_rows(plan.freestyle):
+                        writer.add_round(weight_class_id, label, None, None, None, 0, group_size=size)
+                    continue
+                for round_index, bracket_round in enumerate(plan.rounds):
+                    round_id = writer.add_round(weight_class_id, str(bracket_round.round_size), bracket_round.round_size,
+                                                bracket_round.first_game, bracket_round.last_game, bracket_round.match_count)
+                    court_range = sequence.get((plan_index, round_index)) if sequence is not None else None
+                    if court_range is not None:
+                        court, first_game = court_range.court + 1, court_range.first_game
+                    else:
+                        court, first_game = None, bracket_round.first_game
+                    writer.add_matches((weight_class_id, round_id, first_game + i, court, None, None)
+                                       for i in range(bracket_round.match_count))
+            writer.flush()
+
+    def save_kyorugi(self, day, report, rows):
+        # 경기 시간 계산기 겨루기 탭. report: tournament_report.KyorugiReport (entries 는 계산한 입력 행)
+        # rows: 입력 표의 모든 행. 계산하지 않은 행(선택 안 함, 참가부 빈칸)도 인원수 글자/선택 그대로 저장하고
+        # 라운드와 경기는 계산한 행에만 붙인다.
+        _, summary, schedule, court_count, start_time = report
+        computed = {id(entry): row for entry, row in zip(report.entries, summary.rows)}
+        with closing(self._connect()) as connection, connection:
+            writer = _Writer(connection, day, KYORUGI_SOURCE)
+            event_id = writer.event_id(KYORUGI_EVENT, start_time.strftime("%H:%M"), court_count)
+            scheduled = [] # kyorugi_schedule_categories 순서: 인원 0 명은 제외
+            for entry in rows:
+                row = computed.get(id(entry))
+                if row is None:
+                    writer.add_entry(event_id, entry['division'], entry['weight_class'], "", _headcount(entry['count']),
+                                     entry['check'] == 1, entry['start_round'], entry['end_round'], count_text=entry['count'])
+                    continue
+                start_round = round_label(row.rounds[0].round_size) if row.rounds else ""
+                end_round = round_label(row.rounds[-1].round_size) if row.rounds else ""
+                weight_class_id = writer.add_entry(event_id, row.division, row.weight_class, "", row.headcount,
+                                                   entry['check'] == 1, start_round, end_round,
+                                                   row.seconds_per_match, row.total_seconds, entry['count'])
+                round_ids = [writer.add_round(weight_class_id, round_label(r.round_size), r.round_size, r.first_game,
+                                              r.last_game, r.match_count) for r in row.rounds]
+                if row.headcount != 0:
+                    scheduled.append((weight_class_id, row.rounds, round_ids))
+            writer.add_matches((scheduled[m.category][0], scheduled[m.category][2][m.round_index],
+                                scheduled[m.category][1][m.round_index].first_game + m.match_index, m.court + 1, m.start, m.end)
+                               for m in schedule.matches)
+            writer.add_settings(event_id, summary.applied_settings.items())
+            writer.flush()
+
+    def save_poomsae(self, day, report, rows):
+        # 경기 시간 계산기 품새 탭. report: tournament_report.PoomsaeReport (entries 는 계산한 입력 행)
+        # rows: 입력 표의 모든 행. 계산하지 않은 행도 저장하고 라운드와 경기는 계산한 행에만 붙인다.
+        start_text = report.start_time.strftime("%H:%M")
+        computed = {id(entry): row for entry, row in zip(report.entries, report.summary.rows)}
+        with closing(self._connect()) as connection, connection:
+            writer = _Writer(connection, day, POOMSAE_SOURCE)
+            ids = []
+            for entry in rows:
+                row = computed.get(id(entry))
+                event = row.event if row is not None else entry['event']
+                # game_time_engine.poomsae_row 와 같은 규칙: 종목 이름에 자유품새가 있으면 자유품새 코트
+                courts = report.freestyle_courts if FREESTYLE in event else report.gongin_courts
+                event_id = writer.event_id(event, start_text, courts)
+                if row is None:
+                    writer.add_entry(event_id, entry['division'], entry['class'], entry['gender'], _headcount(entry['count']),
+                                     entry['check'] == 1, count_text=entry['count'])
+                    continue
+                weight_class_id = writer.add_entry(event_id, row.division, entry['class'], entry['gender'], row.headcount,
+                                                   entry['check'] == 1, seconds_per_match=row.seconds_per_game,
+                                                   total_seconds=row.total_seconds, count_text=entry['count'])
+                ids.append((row, weight_class_id, writer.add_round(weight_class_id, row.event_type, None, None, None, max(row.games, 0))))
+
+            # 공인품새가 끝난 뒤 자유품새 진행 (poomsae_schedule_categories 와 같은 순서)
+            offset = 0
+            for poomsae_type, schedule in ((GONGIN, report.gongin_schedule), (FREESTYLE, report.freestyle_schedule)):
+                scheduled = [(weight_class_id, round_id) for row, weight_class_id, round_id in ids
+                             if row.poomsae_type == poomsae_type and row.total_seconds > 0]
+                writer.add_matches((scheduled[m.category][0], scheduled[m.category][1], None, m.court + 1,
+                                    offset + m.start, offset + m.end) for m in schedule.matches)
+                offset += schedule.finish_seconds
+
+            settings = [(f"{group}/{name}", seconds) for group, values in report.settings.items() for name, seconds in values.items()]
+            for event_id in writer.event_ids.values():
+                writer.add_settings(event_id, settings)
+            writer.flush()
+
+    # ---------- 불러오기 ----------
+
+    def days(self, source=None):
+        # 저장된 대회 일자 (오름차순)
+        with closing(self._connect()) as connection:
+            if source is None:
+                rows = connection.execute("SELECT DISTINCT day FROM events ORDER BY day")
+            else:
+                rows = connection.execute("SELECT DISTINCT day FROM events WHERE source = ? ORDER BY day", (source,))
+            return [day for day, in rows]
+
+    def load_entries(self, day, source):
+        # 입력 표 순서의 (종목, 참가부, 체급, 성별, 인원수 글자, 선택, 시작강수, 종료강수)
+        with closing(self._connect()) as connection:
+            return connection.execute("""
+                SELECT e.name, d.name, w.name, w.gender, en.count_text, en.checked, en.start_round, en.end_round
+                FROM events e
+                JOIN weight_classes w ON w.event_id = e.id
+                JOIN divisions d ON d.id = w.division_id
+                JOIN entries en ON en.weight_class_id = w.id
+                WHERE e.day = ? AND e.source = ?
+                ORDER BY w.position
+            """, (day, source)).fetchall()
+
+    # ---------- 여러 종목/일자 조회 ----------
+
+    def matches_per_day(self, source=None):
+        # (일자, 계산기, 경기 수). 같은 대회를 여러 계산기로 저장했을 수 있어 계산기별로 나눈다
+        query = """
+            SELECT e.day, e.source, SUM(r.match_count)
+            FROM events e
+            JOIN weight_classes w ON w.event_id = e.id
+            JOIN rounds r ON r.weight_class_id = w.id
+        """
+        params = ()
+        if source is not None:
+            query += " WHERE e.source = ?"
+            params = (source,)
+        query += " GROUP BY e.day, e.source ORDER BY e.day, e.source"
+        with closing(self._connect()) as connection:
+            return connection.execute(query, params).fetchall()
+
+    def find_categories(self, division=None, min_headcount=None, day=None, source=None):
+        # (일자, 계산기, 종목, 참가부, 체급, 성별, 인원수). 예: find_categories("남중부", 33) -> 남중부 32명 초과 체급
+        conditions, params = [], []
+        for condition, value in (("d.name = ?", division), ("en.headcount >= ?", min_headcount), ("e.day = ?", day), ("e.source = ?", source)):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+        query = """
+            SELECT e.day, e.source, e.name, d.name, w.name, w.gender, en.headcount
+            FROM weight_classes w
+            JOIN divisions d ON d.id = w.division_id
+            JOIN entries en ON en.weight_class_id = w.id
+            JOIN events e ON e.id = w.event_id
+        """
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY e.day, e.source, w.position"
+        with closing(self._connect()) as connection:
+            return connection.execute(query, params).fetchall()
+
+
+def _headcount(count_text):
+    # 계산하지 않은 행의 인원수 (숫자가 아니면 0, 입력한 글자는 count_text 로 따로 저장)
+    try:
+        return int(count_text)
+    except ValueError:
+        return 0
+
+
+class _Writer:
+    # 한 번의 저장 (한 트랜잭션). 같은 일자/계산기의 이전 저장은 지우고 새로 쓴다.
+    # 경기(matches)는 많을 수 있어 모아서 executemany 로 넣는다
+
+    MATCH_BATCH = 10000
+
+    def __init__(self, connection, day, source):
+        self.connection = connection
+        self.day = day
+        self.source = source
+        self.event_ids = {}
+        self.division_ids = {}
+        self.position = 0
+        self.matches = []
+        connection.execute("DELETE FROM events WHERE day = ? AND source = ?", (day, source))
+
+    def event_id(self, name, start_time=None, court_count=None):
+        if name not in self.event_ids:
+            cursor = self.connection.execute("INSERT INTO events (day, source, name, start_time, court_count) VALUES (?, ?, ?, ?, ?)",
+                                             (self.day, self.source, name, start_time, court_count))
+            self.event_ids[name] = cursor.lastrowid
+        return self.event_ids[name]
+
+    def _division_id(self, name):
+        if name not in self.division_ids:
+            self.connection.execute("INSERT OR IGNORE INTO divisions (name) VALUES (?)", (name,))
+            self.division_ids[name] = self.connection.execute("SELECT id FROM divisions WHERE name = ?", (name,)).fetchone()[0]
+        return self.division_ids[name]
+
+    def add_entry(self, event_id, division, weight_class, gender, headcount, checked=False, start_round="", end_round="",
+                  seconds_per_match=None, total_seconds=None, count_text=None):
+        self.position += 1
+        cursor = self.connection.execute("INSERT INTO weight_classes (event_id, division_id, name, gender, position) VALUES (?, ?, ?, ?, ?)",
+                                         (event_id, self._division_id(division), weight_class, gender, self.position))
+        if count_text is None:
+            count_text = str(headcount)
+        self.connection.execute("""INSERT INTO entries (weight_class_id, headcount, count_text, checked, start_round, end_round,
+                                                        seconds_per_match, total_seconds)
+                                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                                (cursor.lastrowid, headcount, count_text, int(checked), start_round, end_round, seconds_per_match, total_seconds))
+        return cursor.lastrowid
+
+    def add_round(self, weight_class_id, label, round_size, first_game, last_game, match_count, group_size=None):
+        cursor = self.connection.execute("""INSERT INTO rounds (weight_class_id, label, round_size, first_game, last_game, match_count, group_size)
+                                            VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                                         (weight_class_id, label, round_size, first_game, last_game, match_count, group_size))
+        return cursor.lastrowid
+
+    def add_matches(self, matches):
+        # (weight_class_id, round_id, 경기번호, 코트(1부터), 시작 초, 종료 초)
+        self.matches.extend(matches)
+        if len(self.matches) >= self.MATCH_BATCH:
+            self._flush_matches()
+
+    def add_settings(self, event_id, items):
+        self.connection.executemany("INSERT OR REPLACE INTO settings (event_id, name, seconds) VALUES (?, ?, ?)",
+                                    ((event_id, name, seconds) for name, seconds in items))
+
+    def _flush_matches(self):
+        self.connection.executemany("""INSERT INTO matches (weight_class_id, round_id, game_number, court, start_seconds, end_seconds)
+                                       VALUES (?, ?, ?, ?, ?, ?)""", self.matches)
+        self.matches = []
+
+    def flush(self):
+        if self.matches:
+            self._flush_matches()
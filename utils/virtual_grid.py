@@ -0,0 +1,290 @@
+import tkinter as tk
+from tkinter import ttk
+
+from utils.debounce import Debouncer
+from utils.row_index import RowIndex
+
+# 화면에 보이는 행만 위젯으로 그리는 편집 가능한 입력 표.
+# 행 데이터는 self.rows(row_model.RowRecord 리스트 - 열 값만 담는 __slots__ 객체, row["key"] 로 읽고 쓴다)에 보관하고,
+# 스크롤하면 같은 위젯 묶음(slot)에 다른 행을 채운다.
+# 그래서 엑셀에서 수천 행을 가져와도 위젯 수는 화면 높이만큼만 생성된다.
+#
+# columns 항목 예시:
+#   {"key": "division", "width": 15}                              # Entry (기본)
+#   {"key": "check", "kind": "check"}                             # Checkbutton
+#   {"key": "start_round", "kind": "combo", "width": 10, "options": lambda row: [...]}
+#   {"key": "no", "kind": "index", "width": 5}                    # 행 번호
+#   {"kind": "label", "text": "~"}                                # 고정 글자
+#   {"kind": "delete", "text": "-", "config": {"bg": "red"}}      # 행 삭제 버튼
+#   "tab_cycle": True 이면 Tab/Shift-Tab 으로 같은 열의 다음/이전 행으로 이동
+#
+# index_keys 로 준 열은 역색인(RowIndex)을 유지하고, set_filter({열: 값}) 은 색인의 교집합으로 보여줄 행을 구한다.
+
+DEFAULT_ROW_HEIGHT = 30
+STYLE_DELAY_MS = 50 # 입력 중 칸 색 갱신은 이만큼 모아서 한 번에
+DEFAULT_ENTRY_STYLE = {"bg": "white", "fg": "black"}
+
+
+class VirtualGrid(tk.Frame):
+    def __init__(self, master, columns, on_change=None, on_delete=None, cell_style=None, index_keys=(), **kwargs):
+        super().__init__(master, **kwargs)
+        self.columns = columns
+        self.on_change = on_change # on_change(row_index, key)
+        self.on_delete = on_delete # on_delete(row_index)
+        self.cell_style = cell_style # cell_style(row, key) -> 위젯 설정 dict 또는 None
+
+        self.rows = []
+        self.view = [] # 필터를 통과한 행 인덱스 (화면 순서)
+        self.index = RowIndex(index_keys)
+        self.criteria = {} # 필터 조건 {열: 값}
+        self.version = 0 # 행이 바뀔 때마다 1씩 증가 (자동 저장이 변경 여부를 이것만 보고 판단)
+        self.top = 0
+        self.slots = []
+        self.visible_slot_count = 0
+        self.row_height = DEFAULT_ROW_HEIGHT
+        self._loading = False
+        self._dirty_rows = set() # 칸 색을 다시 정해야 하는 행 인덱스
+        self._style_debouncer = Debouncer(self, self._flush_styles, STYLE_DELAY_MS)
+
+        self.body = tk.Frame(self)
+        self.body.pack(side="left", fill="both", expand=True)
+        self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.body.bind("<Configure>", self._on_resize)
+        self._bind_mousewheel(self.body)
+
+    # ---------- 데이터 ----------
+
+    def set_rows(self, rows):
+        self.rows[:] = rows
+        self.version += 1
+        self.index.rebuild(self.rows)
+        self._rebuild_view()
+
+    def append_row(self, row):
+        self.rows.append(row)
+        self.version += 1
+        self.index.add(len(self.rows) - 1, row)
+        if all(row[key] == value for key, value in self.criteria.items()):
+            self.view.append(len(self.rows) - 1)
+        self._render()
+
+    def delete_row(self, index):
+        # 뒤쪽 행의 인덱스가 모두 당겨지므로 색인을 다시 만든다 (행 삭제 자체도 O(n))
+        del self.rows[index]
+        self.version += 1
+        self.index.rebuild(self.rows)
+        self._rebuild_view()
+
+    def set_filter(self, criteria):
+        # criteria: {열 키: 값}. 열 키는 index_keys 에 있어야 한다. 빈 dict 면 전체
+        self.criteria = dict(criteria)
+        self.top = 0
+        self._rebuild_view()
+
+    def refresh(self):
+        # 화면 밖에서 rows 의 값을 바꾼 뒤 부른다 (전체 선택 등)
+        self.version += 1
+        self._render()
+
+    def refresh_row(self, index):
+        self.version += 1
+        for slot in self.slots[:self.visible_slot_count]:
+            if slot["index"] == index:
+                self._fill_slot(slot, index)
+                break
+
+    def _rebuild_view(self):
+        if self.criteria:
+            self.view = self.index.lookup(self.criteria)
+        else:
+            self.view = list(range(len(self.rows)))
+        self._render()
+
+    # ---------- 포커스 ----------
+
+    def focus_cell(self, index, key):
+        if not self.visible_slot_count:
+            return
+        try:
+            position = self.view.index(index)
+        except ValueError:
+            return
+        if position < self.top or position >= self.top + self.visible_slot_count:
+            self.top = position
+            self._render()
+
+        slot = self.slots[position - self.top]
+        widget = slot["widgets"][key]
+        widget.focus_set()
+        if isinstance(widget, tk.Entry):
+            widget.selection_range(0, tk.END)
+
+    def _move_focus(self, slot, key, step):
+        if slot["index"] is None or not self.view:
+            return "break"
+        position = self.view.index(slot["index"])
+        self.focus_cell(self.view[(position + step) % len(self.view)], key)
+        return "break" # Prevent default tab behavior
+
+    # ---------- 그리기 ----------
+
+    def _create_slot(self):
+        frame = tk.Frame(self.body)
+        slot = {"frame": frame, "index": None, "widgets": {}, "vars": {}}
+
+        for column in self.columns:
+            kind = column.get("kind", "entry")
+            key = column.get("key")
+            var = None
+
+            if kind == "index":
+                widget = tk.Label(frame, width=column.get("width", 5))
+            elif kind == "label":
+                widget = tk.Label(frame, text=column.get("text", ""))
+            elif kind == "delete":
+                widget = tk.Button(frame, text=column.get("text", "-"), command=lambda s=slot: self._on_delete_click(s), **column.get("config", {}))
+            elif kind == "check":
+                var = tk.IntVar()
+                widget = tk.Checkbutton(frame, variable=var)
+            elif kind == "combo":
+                var = tk.StringVar()
+                widget = ttk.Combobox(frame, textvariable=var, values=[], width=column.get("width", 10), state="readonly")
+            else:
+                var = tk.StringVar()
+                widget = tk.Entry(frame, width=column.get("width", 15), textvariable=var)
+                if column.get("tab_cycle"):
+                    widget.bind("<Tab>", lambda e, s=slot, k=key: self._move_focus(s, k, 1))
+                    widget.bind("<Shift-Tab>", lambda e, s=slot, k=key: self._move_focus(s, k, -1))
+
+            widget.pack(side="left", padx=column.get("padx", 2))
+            self._bind_mousewheel(widget)
+            if key is not None:
+                slot["widgets"][key] = widget
+            if var is not None:
+                slot["vars"][key] = var
+                var.trace_add("write", lambda name, index, mode, s=slot, k=key: self._on_var_write(s, k))
+
+        self._bind_mousewheel(frame)
+        return slot
+
+    def _on_resize(self, event):
+        if not self.slots:
+            self.slots.append(self._create_slot())
+            self.slots[0]["frame"].update_idletasks()
+            self.row_height = max(1, self.slots[0]["frame"].winfo_reqheight() + 4)
+
+        count = max(1, event.height // self.row_height)
+        while len(self.slots) < count:
+            self.slots.append(self._create_slot())
+        self.visible_slot_count = count
+        for slot in self.slots[count:]:
+            slot["frame"].pack_forget()
+            slot["index"] = None
+        self._render()
+
+    def _render(self):
+        max_top = max(0, len(self.view) - self.visible_slot_count)
+        self.top = min(max(0, self.top), max_top)
+
+        for position, slot in enumerate(self.slots[:self.visible_slot_count]):
+            view_position = self.top + position
+            if view_position < len(self.view):
+                self._fill_slot(slot, self.view[view_position])
+                slot["frame"].pack(fill='x', pady=2, anchor='w')
+            else:
+                slot["index"] = None
+                slot["frame"].pack_forget()
+
+        if self.view:
+            first = self.top / len(self.view)
+            last = min(1.0, (self.top + self.visible_slot_count) / len(self.view))
+            self.scrollbar.set(first, last)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _fill_slot(self, slot, index):
+        row = self.rows[index]
+        slot["index"] = index
+        self._loading = True
+        try:
+            for column in self.columns:
+                kind = column.get("kind", "entry")
+                key = column.get("key")
+                if kind == "index":
+                    slot["widgets"][key].config(text=str(index + 1))
+                elif kind == "combo":
+                    slot["widgets"][key]['values'] = column["options"](row)
+                if key in slot["vars"]:
+                    value = row.get(key, 0 if kind == "check" else "")
+                    var = slot["vars"][key]
+                    # 같은 값이면 다시 쓰지 않는다 (입력 중 커서 위치 유지)
+                    if var.get() != value:
+                        var.set(value)
+        finally:
+            self._loading = False
+        self._style_slot(slot)
+
+    def _style_slot(self, slot):
+        row = self.rows[slot["index"]]
+        for column in self.columns:
+            if column.get("kind", "entry") != "entry":
+                continue
+            key = column["key"]
+            style = self.cell_style(row, key) if self.cell_style else None
+            slot["widgets"][key].config(**(style or DEFAULT_ENTRY_STYLE))
+
+    # ---------- 이벤트 ----------
+
+    def _on_var_write(self, slot, key):
+        if self._loading or slot["index"] is None:
+            return
+        index = slot["index"]
+        try:
+            value = slot["vars"][key].get()
+        except tk.TclError:
+            return
+        if self.rows[index].get(key) == value:
+            return
+
+        self.index.change(index, key, self.rows[index].get(key), value)
+        self.rows[index][key] = value
+        self.version += 1
+        if self.on_change:
+            self.on_change(index, key)
+        self._dirty_rows.add(index)
+        self._style_debouncer.schedule()
+
+    def _flush_styles(self):
+        dirty, self._dirty_rows = self._dirty_rows, set()
+        for slot in self.slots[:self.visible_slot_count]:
+            if slot["index"] in dirty:
+                self._style_slot(slot)
+
+    def _on_delete_click(self, slot):
+        if slot["index"] is not None and self.on_delete:
+            self.on_delete(slot["index"])
+
+    def _on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * len(self.view))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            self.top += step * self.visible_slot_count if args[2] == "pages" else step
+        self._render()
+
+    def _on_mousewheel(self, event):
+        if event.num == 4:
+            step = -1
+        elif event.num == 5:
+            step = 1
+        else:
+            step = -1 if event.delta > 0 else 1
+        self.top += step * 3
+        self._render()
+
+    def _bind_mousewheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_mousewheel) # Windows/macOS
+        widget.bind("<Button-4>", self._on_mousewheel) # Linux scroll up
+        widget.bind("<Button-5>", self._on_mousewheel) # Linux scroll down